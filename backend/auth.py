@@ -1,30 +1,120 @@
 # JWT 인증 및 비밀번호 해싱
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
 from typing import Optional
-import jwt
+import logging
+import threading
+import time
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 from database import get_db
 from models import User
+from refresh_tokens import is_revoked
+from tokens import (
+    SECRET_KEY,
+    ALGORITHM,
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    REFRESH_TOKEN_EXPIRE_DAYS,
+    TokenError,
+    token_service,
+)
 import os
 from dotenv import load_dotenv
 from zoneinfo import ZoneInfo
 
 load_dotenv()
 
-SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
-ALGORITHM = os.getenv("ALGORITHM", "HS256")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
-REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
+logger = logging.getLogger(__name__)
+
+# bcrypt 비용 (2^rounds 번 반복). 값을 올리면 기존 해시는 다음 로그인 때 새 비용으로 다시 저장된다
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# 인증 사용자 캐시 (토큰 → 사용자 조회 생략)
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60"))
+PRINCIPAL_CACHE_MAX_SIZE = int(os.getenv("PRINCIPAL_CACHE_MAX_SIZE", "1024"))
 
 # KST(Asia/Seoul) 타임존
 KST = ZoneInfo("Asia/Seoul")
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+@dataclass(frozen=True)
+class CurrentUser:
+    """인증된 사용자 정보 (DB 세션과 분리된 읽기 전용 객체)
+
+    대부분의 라우터는 current_user.id만 사용하므로 캐시에 이 객체를 보관한다.
+    사용자 정보를 수정해야 하는 경우에는 id로 User를 다시 조회해서 사용한다.
+    """
+    id: int
+    email: str
+    name: str
+    profile_color: Optional[str] = None
+    bio: Optional[str] = None
+    kakao_id: Optional[str] = None
+
+    @classmethod
+    def from_model(cls, user: User) -> "CurrentUser":
+        return cls(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            profile_color=user.profile_color,
+            bio=user.bio,
+            kakao_id=user.kakao_id,
+        )
+
+
+class PrincipalCache:
+    """(user_id, 토큰 발급 시각) → CurrentUser 를 보관하는 TTL + LRU 캐시"""
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # key -> (expires_at, CurrentUser)
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[CurrentUser]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return principal
+
+    def set(self, key, principal: CurrentUser) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, principal)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: int) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == user_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+principal_cache = PrincipalCache(PRINCIPAL_CACHE_MAX_SIZE, PRINCIPAL_CACHE_TTL_SECONDS)
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """사용자 정보가 바뀌었을 때 캐시에서 제거"""
+    principal_cache.invalidate_user(user_id)
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """비밀번호 검증"""
     return pwd_context.verify(plain_password, hashed_password)
@@ -33,72 +123,76 @@ def get_password_hash(password: str) -> str:
     """비밀번호 해싱"""
     return pwd_context.hash(password)
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    """비밀번호 검증 + 비용 설정이 바뀐 해시면 새 해시 반환 (바꿀 필요 없으면 None)"""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+# 없는 계정 로그인 검증용 더미 해시. 첫 요청에서 만들면 그 요청만 bcrypt를 두 번 하게 되어
+# 응답 시간 차이가 생기므로 import 시점에 설정된 BCRYPT_ROUNDS로 미리 만든다.
+DUMMY_PASSWORD_HASH = pwd_context.hash("dummy-password-for-timing")
+
+def verify_dummy_password(plain_password: str) -> bool:
+    """없는 계정/소셜 전용 계정 로그인 시 실제 검증과 같은 비용의 검증을 한 번 수행
+
+    응답 시간으로 계정 존재 여부를 알 수 없게 한다.
+    """
+    pwd_context.verify(plain_password, DUMMY_PASSWORD_HASH)
+    return False
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
-    """Access Token 생성 (KST 기준)"""
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.now(KST) + expires_delta
-    else:
-        expire = datetime.now(KST) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire, "type": "access"})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    """Access Token 생성 (data의 sub만 사용, tokens.token_service로 발급)"""
+    return token_service.issue_access_token(int(data["sub"]), expires_delta)
 
 def create_refresh_token(data: dict):
-    """Refresh Token 생성 (KST 기준)"""
-    to_encode = data.copy()
-    expire = datetime.now(KST) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode.update({"exp": expire, "type": "refresh"})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    """Refresh Token 생성 (data의 sub만 사용, tokens.token_service로 발급)"""
+    return token_service.issue_refresh_token(int(data["sub"]))
 
 def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
-) -> User:
-    """현재 로그인한 사용자 가져오기"""
+) -> CurrentUser:
+    """현재 로그인한 사용자 가져오기 (캐시에 있으면 DB 조회 생략)"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="인증 정보를 확인할 수 없습니다",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
-    # 디버깅: 토큰 확인
-    print("[DEBUG] get_current_user 호출됨")
-    print(f"[DEBUG] raw token (처음 50자): {token[:50] if token else 'None'}...")
-    print(f"[DEBUG] SECRET_KEY: {SECRET_KEY[:20] if SECRET_KEY else 'None'}...")
-    print(f"[DEBUG] ALGORITHM: {ALGORITHM}")
+    # 로그는 DEBUG가 켜져 있을 때만 만든다 (꺼져 있으면 인증 경로에 비용 없음)
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        print(f"[DEBUG] decoded payload: {payload}")
-        
-        # sub는 문자열로 저장되므로 정수로 변환
-        user_id_str = payload.get("sub")
-        if user_id_str is None:
-            print(f"[DEBUG] ❌ payload에 'sub'가 없음")
-            raise credentials_exception
-        
-        user_id: int = int(user_id_str)
-        token_type: str = payload.get("type")
-        
-        print(f"[DEBUG] user_id: {user_id}, token_type: {token_type}")
-        
-        if token_type != "access":
-            print(f"[DEBUG] ❌ 토큰 검증 실패: user_id={user_id}, token_type={token_type}")
-            raise credentials_exception
-    except jwt.InvalidTokenError as e:
-        print(f"[DEBUG] ❌ JWT InvalidTokenError 발생: {repr(e)}")
+        # 서명, 만료, type == access, sub를 한 번에 검증
+        claims = token_service.verify(token, "access")
+    except TokenError as e:
+        if debug_enabled:
+            logger.debug("인증 실패: 유효하지 않은 토큰", extra={"error": str(e)})
         raise credentials_exception
-    except Exception as e:
-        print(f"[DEBUG] ❌ 예상치 못한 에러: {repr(e)}")
+    except Exception:
+        logger.warning("토큰 검증 중 예상치 못한 에러", exc_info=True)
         raise credentials_exception
+    user_id = claims.user_id
+    
+    # 로그아웃/재사용 감지로 폐기된 계열의 토큰 (메모리 조회만, DB 접근 없음)
+    if is_revoked(claims):
+        if debug_enabled:
+            logger.debug("인증 실패: 폐기된 토큰", extra={"user_id": user_id})
+        raise credentials_exception
+    
+    # 같은 토큰(사용자 + 발급 시각)으로 최근에 조회한 적이 있으면 캐시 사용
+    cache_key = (user_id, claims.issued_at or claims.expires_at)
+    principal = principal_cache.get(cache_key)
+    if principal is not None:
+        return principal
     
     user = db.query(User).filter(User.id == user_id).first()
     if user is None:
-        print(f"[DEBUG] ❌ 사용자를 찾을 수 없음: user_id={user_id}")
+        if debug_enabled:
+            logger.debug("인증 실패: 사용자를 찾을 수 없음", extra={"user_id": user_id})
         raise credentials_exception
     
-    print(f"[DEBUG] ✅ 인증 성공: user_id={user_id}, name={user.name}")
-    return user
+    if debug_enabled:
+        logger.debug("인증 성공", extra={"user_id": user_id})
+    principal = CurrentUser.from_model(user)
+    principal_cache.set(cache_key, principal)
+    return principal
 
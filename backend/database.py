@@ -4,48 +4,148 @@
 # =======================
 
 from sqlalchemy import create_engine, text, inspect, event, MetaData
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.orm import sessionmaker, declarative_base
 from pydantic_settings import BaseSettings, SettingsConfigDict
 import os
+import logging
 from dotenv import load_dotenv
+from logging_config import redact
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 
 # 환경 변수에서 직접 DATABASE_URL 읽기
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./zero_waste.db")
 
-print(f"[DEBUG] DATABASE_URL: {DATABASE_URL[:50]}..." if len(DATABASE_URL) > 50 else f"[DEBUG] DATABASE_URL: {DATABASE_URL}")
+logger.info("DATABASE_URL: %s", redact(DATABASE_URL))
+
+# 엔진 프로필 (환경 변수로 조정)
+# DB_ECHO=1 일 때만 SQL 로그 출력 (운영에서는 끔)
+DB_ECHO = os.getenv("DB_ECHO", "0") == "1"
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))  # 커넥션을 기다리는 최대 시간(초)
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # 이보다 오래된 커넥션은 새로 연결 (관리형 DB의 유휴 종료 대비)
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "1") == "1"
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "15000"))  # PostgreSQL 서버 측 쿼리 제한 시간 (0이면 없음)
+DB_SCHEMA = "public"
+
+_pool_options = {
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_timeout": DB_POOL_TIMEOUT,
+}
+
+# SQLite 프로필: 커넥션마다 적용하는 PRAGMA
+# - WAL: 읽기와 쓰기가 서로 막지 않고, 쓰기는 로그에 덧붙이기만 해서 커밋이 빠르다
+# - busy_timeout: 다른 커넥션이 쓰는 중이면 바로 "database is locked" 대신 기다린다
+# - synchronous=NORMAL: WAL에서는 커밋마다 fsync 하지 않아도 DB가 깨지지 않는다
+# - mmap_size / cache_size / temp_store: 읽기와 정렬용 임시 데이터를 메모리에서 처리
+SQLITE_PRAGMAS = {
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+    "cache_size": int(os.getenv("SQLITE_CACHE_SIZE", "-20000")),  # 음수는 KiB 단위 (약 20MB)
+    "temp_store": os.getenv("SQLITE_TEMP_STORE", "MEMORY"),
+}
 
-# SQLite 사용 시 check_same_thread=False 필요
-if DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(
-        DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        echo=True,  # 개발 시 SQL 쿼리 로그 출력
+
+def apply_sqlite_pragmas(dbapi_connection, pragmas=None):
+    """SQLite 커넥션에 PRAGMA 적용"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in (pragmas or SQLITE_PRAGMAS).items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def _is_sqlite_memory(url) -> bool:
+    # sqlite:// , sqlite:///:memory: , file:...?mode=memory 는 커넥션마다 별도 DB (풀 크기 옵션을 받지 않는 풀 사용)
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
+
+def create_db_engine(database_url: str):
+    """환경 변수 프로필을 적용한 엔진 생성"""
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        # SQLite 사용 시 check_same_thread=False 필요
+        if _is_sqlite_memory(url):
+            # 메모리 DB는 풀 크기/대기 옵션을 받지 않는다. 모든 스레드가 같은 DB를 보도록 커넥션 하나를 공유
+            pool_options = {"poolclass": StaticPool}
+        else:
+            pool_options = _pool_options
+        sqlite_engine = create_engine(
+            database_url,
+            connect_args={"check_same_thread": False},
+            echo=DB_ECHO,  # 개발 시 SQL 쿼리 로그 출력
+            **pool_options,
+        )
+
+        @event.listens_for(sqlite_engine, "connect")
+        def _set_sqlite_pragmas(dbapi_connection, connection_record):
+            apply_sqlite_pragmas(dbapi_connection)
+
+        return sqlite_engine
+
+    # PostgreSQL: search_path와 statement_timeout을 접속 옵션으로 전달
+    # (커넥션마다 SET 문을 따로 보내는 왕복이 없다)
+    pg_options = f"-c search_path={DB_SCHEMA}"
+    if DB_STATEMENT_TIMEOUT_MS > 0:
+        pg_options += f" -c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"
+    return create_engine(
+        database_url,
+        connect_args={"options": pg_options},
+        echo=DB_ECHO,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        pool_recycle=DB_POOL_RECYCLE,
+        **_pool_options,
     )
-else:
-    # PostgreSQL 사용 시 public 스키마 명시적 설정
-    engine = create_engine(
-        DATABASE_URL,
-        connect_args={"options": "-c search_path=public"},
-        echo=True
+
+
+engine = create_db_engine(DATABASE_URL)
+
+
+def ensure_database_schema():
+    """PostgreSQL 스키마가 없으면 생성 (import 시점이 아니라 앱 시작 시 main.py에서 호출)"""
+    if engine.dialect.name != "postgresql":
+        return
+    with engine.begin() as conn:
+        conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {DB_SCHEMA}"))
+
+
+def pool_metrics() -> dict:
+    """커넥션 풀 사용 현황"""
+    pool = engine.pool
+    metrics = {"pool_class": type(pool).__name__}
+    if not hasattr(pool, "checkedout"):
+        return metrics
+    size = pool.size()
+    checked_out = pool.checkedout()
+    capacity = size + max(DB_MAX_OVERFLOW, 0)
+    metrics.update(
+        {
+            "pool_size": size,
+            "max_overflow": DB_MAX_OVERFLOW,
+            "checked_out": checked_out,
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "capacity": capacity,
+            "utilization": round(checked_out / capacity, 3) if capacity else 0.0,
+            "timeout_seconds": DB_POOL_TIMEOUT,
+        }
     )
-    # 추가 안전장치: 모든 커넥션에 대해 search_path 설정
-    @event.listens_for(engine, "connect")
-    def set_search_path(dbapi_connection, connection_record):
-        cursor = dbapi_connection.cursor()
-        cursor.execute("SET search_path TO public")
-        cursor.close()
-    # 스키마가 없을 경우 생성
-    with engine.connect() as conn:
-        conn.execute(text("CREATE SCHEMA IF NOT EXISTS public"))
-        conn.execute(text("SET search_path TO public"))
+    return metrics
 
 # 세션 팩토리
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-metadata = MetaData(schema="public") if not DATABASE_URL.startswith("sqlite") else MetaData()
+metadata = MetaData(schema=DB_SCHEMA) if not DATABASE_URL.startswith("sqlite") else MetaData()
 
 # Base 모델
 Base = declarative_base(metadata=metadata)
@@ -0,0 +1,90 @@
+# 날짜별 데이터 버전 관리 (ETag / 조건부 GET)
+# =======================
+# 사용자의 특정 날짜 미션 데이터가 바뀔 때마다 day_versions의 버전을 올리고,
+# 조회 API는 버전으로 만든 ETag가 If-None-Match와 같으면 미션 테이블을 읽지 않고 304를 응답한다.
+
+import hashlib
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import and_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from models import DayVersion
+
+# 응답 형태가 바뀌면 올려서 기존 ETag를 모두 무효화
+ETAG_SCHEMA_VERSION = "1"
+
+# 조건부 GET 응답에 붙이는 캐시 헤더 (항상 재검증)
+CACHE_CONTROL = "private, no-cache"
+
+
+def bump_day_versions(db: Session, user_id: int, dates: Iterable[date]) -> None:
+    """날짜별 버전 1 증가 (커밋은 호출한 쪽에서)"""
+    unique_dates = sorted(set(dates))
+    if not unique_dates:
+        return
+
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        statement = insert(DayVersion).values(
+            [{"user_id": user_id, "date": target_date, "version": 1} for target_date in unique_dates]
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[DayVersion.user_id, DayVersion.date],
+            set_={"version": DayVersion.version + 1},
+        )
+        db.execute(statement)
+        return
+
+    # 그 외 DB: 조회 후 갱신
+    existing = {
+        row.date: row
+        for row in db.query(DayVersion).filter(
+            and_(
+                DayVersion.user_id == user_id,
+                DayVersion.date.in_(unique_dates)
+            )
+        ).all()
+    }
+    for target_date in unique_dates:
+        if target_date in existing:
+            existing[target_date].version += 1
+        else:
+            db.add(DayVersion(user_id=user_id, date=target_date, version=1))
+
+
+def get_day_versions(db: Session, user_id: int, dates: List[date]) -> Dict[date, int]:
+    """날짜별 현재 버전 (기록이 없으면 0)"""
+    rows = db.query(DayVersion.date, DayVersion.version).filter(
+        and_(
+            DayVersion.user_id == user_id,
+            DayVersion.date.in_(dates)
+        )
+    ).all()
+    versions = {target_date: 0 for target_date in dates}
+    versions.update({row.date: row.version for row in rows})
+    return versions
+
+
+def make_etag(kind: str, user_id: int, versions: Dict[date, int]) -> str:
+    """응답 종류 + 사용자 + 날짜별 버전으로 강한 ETag 생성"""
+    parts = [ETAG_SCHEMA_VERSION, kind, str(user_id)]
+    parts.extend(f"{target_date.isoformat()}:{version}" for target_date, version in sorted(versions.items()))
+    digest = hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 (목록/와일드카드/W/ 접두어 허용)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return any(
+        (candidate[2:] if candidate.startswith("W/") else candidate) == etag
+        for candidate in candidates
+    )
@@ -0,0 +1,146 @@
+# 그룹 미션 카운터 (group_missions.member_count / completed_check_count)
+# =======================
+# 추천 목록, 참여/초대 인원 확인마다 group_members를 COUNT 하지 않도록
+# 그룹 행에 인원 수와 완료 체크 수를 비정규화해서 들고 있는다.
+# - 참여/수락/탈퇴/체크 시 같은 트랜잭션 안에서 "col = col + delta" UPDATE로 갱신한다.
+# - 참여/수락은 "member_count < 최대 인원" 조건부 UPDATE로 자리를 먼저 잡으므로
+#   동시에 들어온 요청이 정원을 넘기지 못한다.
+# - 그룹을 삭제하면 행과 함께 사라지므로 따로 갱신할 것이 없다.
+# - 값이 어긋났을 때는 reconcile_group_counters()로 원본 테이블에서 다시 계산한다
+#   (scripts/reconcile_group_counters.py).
+# - 인원이 바뀐 세션에는 GROUP_DIRECTORY_DIRTY_KEY를 남겨 커밋 후 추천 후보 풀을 다시 만들게 한다.
+
+import logging
+from typing import Iterable, Optional
+
+from sqlalchemy import func, inspect, text
+from sqlalchemy.orm import Session
+
+from database import SessionLocal, engine
+from models import GroupMember, GroupMission, GroupMissionCheck
+
+logger = logging.getLogger(__name__)
+
+MAX_MEMBERS_PER_GROUP = 3
+
+COUNTER_COLUMNS = ("member_count", "completed_check_count")
+
+# 그룹 구성이 바뀐 세션 표시 (커밋 후 추천 후보 풀 갱신 신호로 사용)
+GROUP_DIRECTORY_DIRTY_KEY = "group_directory_dirty"
+
+
+def mark_group_directory_changed(db: Session) -> None:
+    """그룹 생성/삭제처럼 카운터 밖에서 그룹 목록이 바뀐 경우 호출"""
+    db.info[GROUP_DIRECTORY_DIRTY_KEY] = True
+
+
+def reserve_member_slot(db: Session, group_id: int) -> bool:
+    """빈자리가 있으면 member_count를 1 늘리고 True (가득 찼거나 그룹이 없으면 False)"""
+    updated = (
+        db.query(GroupMission)
+        .filter(
+            GroupMission.id == group_id,
+            GroupMission.member_count < MAX_MEMBERS_PER_GROUP,
+        )
+        .update(
+            {GroupMission.member_count: GroupMission.member_count + 1},
+            synchronize_session=False,
+        )
+    )
+    if updated == 1:
+        mark_group_directory_changed(db)
+    return updated == 1
+
+
+def release_member_slot(db: Session, group_id: int) -> None:
+    """그룹원이 나갈 때 member_count 1 감소"""
+    db.query(GroupMission).filter(
+        GroupMission.id == group_id,
+        GroupMission.member_count > 0,
+    ).update(
+        {GroupMission.member_count: GroupMission.member_count - 1},
+        synchronize_session=False,
+    )
+    mark_group_directory_changed(db)
+
+
+def adjust_completed_checks(db: Session, group_id: int, delta: int) -> None:
+    """완료 체크 수 증감 (체크 완료 상태가 바뀐 경우에만 호출)"""
+    if not delta:
+        return
+    db.query(GroupMission).filter(GroupMission.id == group_id).update(
+        {GroupMission.completed_check_count: GroupMission.completed_check_count + delta},
+        synchronize_session=False,
+    )
+
+
+def reconcile_group_counters(db: Session, group_ids: Optional[Iterable[int]] = None) -> int:
+    """원본 테이블(group_members, group_mission_checks)로 카운터를 다시 계산. 고친 그룹 수 반환"""
+    query = db.query(GroupMission)
+    if group_ids is not None:
+        query = query.filter(GroupMission.id.in_(list(group_ids)))
+    groups = query.all()
+    if not groups:
+        return 0
+    ids = [group.id for group in groups]
+
+    member_counts = dict(
+        db.query(GroupMember.group_mission_id, func.count(GroupMember.id))
+        .filter(GroupMember.group_mission_id.in_(ids))
+        .group_by(GroupMember.group_mission_id)
+        .all()
+    )
+    completed_counts = dict(
+        db.query(GroupMissionCheck.group_mission_id, func.count(GroupMissionCheck.id))
+        .filter(
+            GroupMissionCheck.group_mission_id.in_(ids),
+            GroupMissionCheck.completed == True,
+        )
+        .group_by(GroupMissionCheck.group_mission_id)
+        .all()
+    )
+
+    fixed = 0
+    for group in groups:
+        member_count = member_counts.get(group.id, 0)
+        completed_count = completed_counts.get(group.id, 0)
+        if group.member_count != member_count or group.completed_check_count != completed_count:
+            group.member_count = member_count
+            group.completed_check_count = completed_count
+            fixed += 1
+    if fixed:
+        mark_group_directory_changed(db)
+    return fixed
+
+
+def ensure_group_counter_schema():
+    """기존 DB에 카운터 컬럼이 없으면 추가하고 현재 데이터로 채운다 (최초 배포 시 1회)"""
+    inspector = inspect(engine)
+    if "group_missions" not in inspector.get_table_names():
+        return
+
+    columns = {col["name"] for col in inspector.get_columns("group_missions")}
+    missing = [name for name in COUNTER_COLUMNS if name not in columns]
+    if not missing:
+        return
+
+    with engine.begin() as conn:
+        for name in missing:
+            conn.execute(
+                text(f"ALTER TABLE group_missions ADD COLUMN {name} INTEGER NOT NULL DEFAULT 0")
+            )
+        if "member_count" in missing:
+            conn.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS ix_group_missions_member_count "
+                    "ON group_missions (member_count)"
+                )
+            )
+
+    db = SessionLocal()
+    try:
+        logger.info("그룹 카운터 컬럼을 추가하고 기존 데이터로 채웁니다", extra={"columns": missing})
+        reconcile_group_counters(db)
+        db.commit()
+    finally:
+        db.close()
@@ -0,0 +1,222 @@
+# 그룹 추천 후보 풀
+# =======================
+# /group-missions/recommended 요청마다 전체 그룹을 읽어 거르지 않도록, 빈자리가 있는 그룹을
+# 기본 점수(최근 활동 + 빈자리) 순으로 정렬한 후보 풀을 백그라운드에서 주기적으로 만들어 둔다.
+# 요청에서는 내 친구 id만 조회해서, 친구가 참여한 후보에 가산점을 주고 상위 k개를 고른다.
+# (사용자는 그룹을 최대 2개만 참여하므로 친구 수에만 비례하고 전체 그룹 수와는 무관)
+#
+# 점수 = FRIEND_WEIGHT × 참여 중인 친구 수
+#      + ACTIVITY_WEIGHT × 최근 활동률 (최근 N일 완료 체크 수 / (인원 × N))
+#      + SLOT_WEIGHT × 빈자리 비율
+#
+# 참여/탈퇴/그룹 생성·삭제가 커밋되면 다음 확인 주기에 풀을 다시 만든다 (group_counters 신호).
+#
+# 환경 변수
+#   RECOMMENDATION_POOL_SIZE              : 풀에 담을 후보 그룹 수 (기본 500)
+#   RECOMMENDATION_REFRESH_INTERVAL_SECONDS : 변경이 없어도 다시 만드는 주기 (기본 60)
+#   RECOMMENDATION_ACTIVITY_DAYS          : 활동률 집계 기간 (기본 7일)
+
+import asyncio
+import heapq
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from types import MappingProxyType
+from typing import Iterable, List, Mapping, Optional, Set, Tuple
+
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session
+
+from database import SessionLocal
+from group_counters import GROUP_DIRECTORY_DIRTY_KEY, MAX_MEMBERS_PER_GROUP
+from models import Friend, GroupMember, GroupMission, GroupMissionCheck
+from scoring import today_kst
+
+logger = logging.getLogger(__name__)
+
+RECOMMENDATION_POOL_SIZE = int(os.getenv("RECOMMENDATION_POOL_SIZE", "500"))
+RECOMMENDATION_REFRESH_INTERVAL_SECONDS = float(os.getenv("RECOMMENDATION_REFRESH_INTERVAL_SECONDS", "60"))
+RECOMMENDATION_ACTIVITY_DAYS = int(os.getenv("RECOMMENDATION_ACTIVITY_DAYS", "7"))
+# 변경 신호를 확인하는 주기(초)
+RECOMMENDATION_DIRTY_POLL_SECONDS = 1.0
+
+FRIEND_WEIGHT = 1.0
+ACTIVITY_WEIGHT = 0.5
+SLOT_WEIGHT = 0.25
+
+
+@dataclass(frozen=True)
+class CandidatePool:
+    version: int  # 만들기 시작한 시점의 변경 번호
+    built_at: float  # time.monotonic()
+    ranked: Tuple[int, ...]  # 그룹 id (기본 점수 내림차순)
+    base_score: Mapping[int, float]  # group_id -> 기본 점수
+    groups_by_member: Mapping[int, Tuple[int, ...]]  # user_id -> 참여 중인 후보 그룹 id
+
+    def age(self) -> float:
+        return time.monotonic() - self.built_at
+
+
+_pool: Optional[CandidatePool] = None
+_dirty_version = 0
+_build_lock = threading.Lock()
+_refresher_running = False
+
+
+def mark_dirty() -> None:
+    """그룹 구성이 바뀌었음을 알림 (다음 확인 주기에 풀을 다시 만든다)"""
+    global _dirty_version
+    _dirty_version += 1
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_dirty_after_commit(session):
+    if session.info.pop(GROUP_DIRECTORY_DIRTY_KEY, False):
+        mark_dirty()
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_dirty_after_rollback(session):
+    session.info.pop(GROUP_DIRECTORY_DIRTY_KEY, None)
+
+
+def friend_ids_query(db: Session, user_id: int):
+    """친구 id 조회 (친구 관계는 양방향이므로 두 방향을 합친다)"""
+    return db.query(Friend.friend_id).filter(Friend.user_id == user_id).union(
+        db.query(Friend.user_id).filter(Friend.friend_id == user_id)
+    )
+
+
+def build_pool(db: Session) -> CandidatePool:
+    """빈자리가 있는 그룹을 기본 점수 순으로 정렬해 새 후보 풀 생성"""
+    version = _dirty_version
+    since = today_kst() - timedelta(days=RECOMMENDATION_ACTIVITY_DAYS - 1)
+    activity = (
+        db.query(GroupMissionCheck.group_mission_id, func.count(GroupMissionCheck.id).label("checks"))
+        .filter(GroupMissionCheck.date >= since, GroupMissionCheck.completed == True)
+        .group_by(GroupMissionCheck.group_mission_id)
+        .subquery()
+    )
+    rows = (
+        db.query(GroupMission.id, GroupMission.member_count, func.coalesce(activity.c.checks, 0))
+        .outerjoin(activity, activity.c.group_mission_id == GroupMission.id)
+        .filter(GroupMission.member_count < MAX_MEMBERS_PER_GROUP)
+        .all()
+    )
+
+    scored = []
+    for group_id, member_count, checks in rows:
+        activity_rate = min(checks / (max(member_count, 1) * RECOMMENDATION_ACTIVITY_DAYS), 1.0)
+        free_ratio = (MAX_MEMBERS_PER_GROUP - member_count) / MAX_MEMBERS_PER_GROUP
+        scored.append((ACTIVITY_WEIGHT * activity_rate + SLOT_WEIGHT * free_ratio, group_id))
+    # 동점이면 최근에 만든 그룹 우선
+    top = heapq.nlargest(RECOMMENDATION_POOL_SIZE, scored)
+    ranked = tuple(group_id for _, group_id in top)
+
+    groups_by_member = {}
+    if ranked:
+        members = (
+            db.query(GroupMember.user_id, GroupMember.group_mission_id)
+            .filter(GroupMember.group_mission_id.in_(ranked))
+            .all()
+        )
+        for user_id, group_id in members:
+            groups_by_member.setdefault(user_id, []).append(group_id)
+
+    return CandidatePool(
+        version=version,
+        built_at=time.monotonic(),
+        ranked=ranked,
+        base_score=MappingProxyType({group_id: score for score, group_id in top}),
+        groups_by_member=MappingProxyType(
+            {user_id: tuple(group_ids) for user_id, group_ids in groups_by_member.items()}
+        ),
+    )
+
+
+def refresh_pool(db: Optional[Session] = None) -> CandidatePool:
+    """후보 풀을 다시 만들어 교체 (동시에 여러 번 만들지 않도록 잠금)"""
+    global _pool
+    with _build_lock:
+        own_session = db is None
+        if own_session:
+            db = SessionLocal()
+        try:
+            _pool = build_pool(db)
+        finally:
+            if own_session:
+                db.close()
+        return _pool
+
+
+def _needs_refresh(pool: Optional[CandidatePool]) -> bool:
+    if pool is None:
+        return True
+    if pool.age() >= RECOMMENDATION_REFRESH_INTERVAL_SECONDS:
+        return True
+    return pool.version < _dirty_version
+
+
+def get_pool(db: Session) -> CandidatePool:
+    """응답에 사용할 후보 풀
+
+    백그라운드 갱신이 돌고 있으면 있는 풀을 그대로 쓰고,
+    (테스트 등에서) 갱신 작업이 없으면 변경 신호가 있을 때 바로 다시 만든다.
+    """
+    pool = _pool
+    if pool is None or (not _refresher_running and _needs_refresh(pool)):
+        pool = refresh_pool(db)
+    return pool
+
+
+def rank_for_user(
+    pool: CandidatePool,
+    user_id: int,
+    friend_ids: Iterable[int],
+    exclude: Set[int],
+    limit: int,
+) -> List[int]:
+    """후보 풀에서 사용자에게 추천할 그룹 id 상위 limit개"""
+    exclude = set(exclude) | set(pool.groups_by_member.get(user_id, ()))
+
+    # 친구가 참여 중인 후보만 점수가 바뀐다
+    friend_counts = {}
+    for friend_id in friend_ids:
+        for group_id in pool.groups_by_member.get(friend_id, ()):
+            friend_counts[group_id] = friend_counts.get(group_id, 0) + 1
+    scored = [
+        (pool.base_score[group_id] + FRIEND_WEIGHT * count, group_id)
+        for group_id, count in friend_counts.items()
+        if group_id not in exclude
+    ]
+
+    # 나머지는 기본 점수 순서 그대로이므로 앞에서부터 limit개만 보면 된다
+    taken = 0
+    for group_id in pool.ranked:
+        if taken >= limit:
+            break
+        if group_id in exclude or group_id in friend_counts:
+            continue
+        scored.append((pool.base_score[group_id], group_id))
+        taken += 1
+
+    return [group_id for _, group_id in heapq.nlargest(limit, scored)]
+
+
+async def run_refresher() -> None:
+    """앱 수명 동안 후보 풀을 주기적으로 갱신 (main.py lifespan에서 시작)"""
+    global _refresher_running
+    _refresher_running = True
+    try:
+        while True:
+            if _needs_refresh(_pool):
+                try:
+                    await asyncio.to_thread(refresh_pool)
+                except Exception:
+                    logger.exception("그룹 추천 후보 풀 갱신 실패")
+            await asyncio.sleep(RECOMMENDATION_DIRTY_POLL_SECONDS)
+    finally:
+        _refresher_running = False
@@ -0,0 +1,130 @@
+# 외부 HTTP 호출용 공유 클라이언트
+# =======================
+# 요청마다 httpx.AsyncClient()를 만들면 매번 DNS 조회, TCP/TLS 핸드셰이크를 새로 한다.
+# 앱 수명 동안 클라이언트 하나를 공유해서 커넥션을 재사용한다 (main.py lifespan에서 생성/종료).
+# h2 패키지가 설치되어 있으면 HTTP/2로 한 커넥션에서 여러 요청을 처리한다.
+#
+# 환경 변수
+#   HTTP_CONNECT_TIMEOUT / HTTP_READ_TIMEOUT / HTTP_WRITE_TIMEOUT / HTTP_POOL_TIMEOUT (초)
+#   HTTP_MAX_CONNECTIONS, HTTP_MAX_KEEPALIVE_CONNECTIONS, HTTP_KEEPALIVE_EXPIRY
+#   HTTP_MAX_RETRIES (기본 2), HTTP_RETRY_BACKOFF_SECONDS (기본 0.2)
+#   HTTP2 : 0 이면 h2가 있어도 HTTP/1.1 사용
+
+import asyncio
+import importlib.util
+import logging
+import os
+import random
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "3"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "5"))
+HTTP_WRITE_TIMEOUT = float(os.getenv("HTTP_WRITE_TIMEOUT", "5"))
+HTTP_POOL_TIMEOUT = float(os.getenv("HTTP_POOL_TIMEOUT", "2"))
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "10"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "2"))
+HTTP_RETRY_BACKOFF_SECONDS = float(os.getenv("HTTP_RETRY_BACKOFF_SECONDS", "0.2"))
+HTTP2_ENABLED = os.getenv("HTTP2", "1") != "0" and importlib.util.find_spec("h2") is not None
+
+# 서버가 요청을 받지 못한 것이 확실한 오류 (POST도 다시 보내도 안전)
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+# 멱등 요청(GET 등)만 다시 보내는 오류/상태 코드
+_IDEMPOTENT_RETRY_ERRORS = (httpx.ReadTimeout, httpx.RemoteProtocolError, httpx.ReadError)
+_RETRY_STATUS_CODES = {502, 503, 504}
+_IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def create_client(**kwargs) -> httpx.AsyncClient:
+    """커넥션 풀/타임아웃 설정이 적용된 AsyncClient 생성"""
+    options = {
+        "timeout": httpx.Timeout(
+            connect=HTTP_CONNECT_TIMEOUT,
+            read=HTTP_READ_TIMEOUT,
+            write=HTTP_WRITE_TIMEOUT,
+            pool=HTTP_POOL_TIMEOUT,
+        ),
+        "limits": httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+        "http2": HTTP2_ENABLED,
+    }
+    options.update(kwargs)
+    return httpx.AsyncClient(**options)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """앱 공유 클라이언트 (FastAPI 의존성으로도 사용). lifespan 밖에서는 처음 호출할 때 생성"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_client()
+    return _client
+
+
+async def close_http_client() -> None:
+    global _client
+    client, _client = _client, None
+    if client is not None:
+        await client.aclose()
+
+
+def _backoff(attempt: int) -> float:
+    # 지수 백오프 + 지터 (0.2, 0.4, 0.8 ... 초의 50~100%)
+    return HTTP_RETRY_BACKOFF_SECONDS * (2 ** attempt) * random.uniform(0.5, 1.0)
+
+
+async def request_with_retry(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    max_retries: int = HTTP_MAX_RETRIES,
+    **kwargs,
+) -> httpx.Response:
+    """일시적인 오류에 한해 백오프 후 다시 요청
+
+    POST처럼 멱등이 아닌 요청은 서버에 도달하지 않은 것이 확실한 연결 오류만 다시 보낸다
+    (카카오 인가 코드는 한 번만 쓸 수 있으므로 응답을 못 받았다고 다시 보내면 안 된다).
+    """
+    idempotent = method.upper() in _IDEMPOTENT_METHODS
+    attempt = 0
+    while True:
+        try:
+            response = await client.request(method, url, **kwargs)
+        except _NOT_SENT_ERRORS as e:
+            error = e
+        except _IDEMPOTENT_RETRY_ERRORS as e:
+            if not idempotent:
+                raise
+            error = e
+        else:
+            if not (idempotent and response.status_code in _RETRY_STATUS_CODES):
+                return response
+            error = None
+            if attempt >= max_retries:
+                return response
+            await response.aclose()
+
+        if attempt >= max_retries:
+            raise error
+        delay = _backoff(attempt)
+        logger.warning(
+            "외부 HTTP 요청 재시도",
+            extra={
+                "method": method,
+                "url": url,
+                "attempt": attempt + 1,
+                "delay": round(delay, 3),
+                "error": repr(error) if error else None,
+            },
+        )
+        await asyncio.sleep(delay)
+        attempt += 1
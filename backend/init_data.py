@@ -2,6 +2,7 @@
 from database import SessionLocal
 from models import CatalogMission, User
 from models import GroupMission, GroupMember
+from group_counters import reserve_member_slot
 from auth import get_password_hash
 
 def init_catalog_missions():
@@ -98,6 +99,7 @@ def init_group_missions():
         if first:
             member = GroupMember(group_mission_id=first.id, user_id=user.id)
             db.add(member)
+            reserve_member_slot(db, first.id)
             db.commit()
 
         print(f"{len(groups)}개의 그룹 미션이 추가되었습니다.")
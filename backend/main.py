@@ -1,9 +1,26 @@
 # FastAPI 메인 애플리케이션
-from fastapi import FastAPI
+from contextlib import asynccontextmanager, suppress
+import asyncio
+import anyio
+from logging_config import setup_logging, shutdown_logging
+
+# 다른 모듈이 import 시점에 남기는 로그도 큐 핸들러를 거치도록 가장 먼저 설정
+setup_logging()
+
+import hmac
+from typing import Optional
+from fastapi import Depends, FastAPI, Header, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from database import engine, Base, ensure_day_mission_schema
+from database import engine, Base, ensure_database_schema, ensure_day_mission_schema, pool_metrics
+from scoring import ensure_score_ledger
+from group_counters import ensure_group_counter_schema
 from routers import auth, users, missions, day_missions, group_missions, friends, ranking, utils, kakao_auth, personal_routine
 from routers import debug
+import ranking_snapshot
+import group_recommendations
+import refresh_tokens
+from http_client import close_http_client, get_http_client
+from password_hashing import password_hasher
 import os
 from dotenv import load_dotenv
 
@@ -14,6 +31,8 @@ load_dotenv()
 import logging
 logger = logging.getLogger(__name__)
 
+ensure_database_schema()
+
 try:
     Base.metadata.create_all(bind=engine, checkfirst=True)
 except Exception as e:
@@ -27,11 +46,43 @@ except Exception as e:
         raise
 
 ensure_day_mission_schema()
+ensure_group_counter_schema()
+ensure_score_ledger()
+
+# 라우터 핸들러는 동기 Session을 쓰므로 def로 선언되어 스레드풀에서 실행된다 (0이면 anyio 기본값 40 유지)
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "0"))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    setup_logging()
+    # 동기 DB 핸들러(def)를 실행하는 스레드풀 크기 (DB 커넥션 풀 크기와 맞춰서 설정)
+    if THREADPOOL_SIZE:
+        anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    # 외부 API(카카오) 호출용 공유 클라이언트 생성
+    get_http_client()
+    # 랭킹 스냅샷 백그라운드 갱신 시작
+    ranking_refresher = asyncio.create_task(ranking_snapshot.run_refresher())
+    # 그룹 추천 후보 풀 백그라운드 갱신 시작
+    recommendation_refresher = asyncio.create_task(group_recommendations.run_refresher())
+    # refresh 토큰 폐기 목록 동기화 + 만료 계열 정리
+    refresh_token_maintenance = asyncio.create_task(refresh_tokens.run_maintenance())
+    try:
+        yield
+    finally:
+        for task in (ranking_refresher, recommendation_refresher, refresh_token_maintenance):
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        password_hasher.shutdown()
+        await close_http_client()
+        # 큐에 남은 로그 출력 후 리스너 종료
+        shutdown_logging()
 
 app = FastAPI(
     title="Zero Waste Routine API",
     description="친환경 미션 추적 앱 API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -56,6 +107,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 브라우저 JS에서 읽어야 하는 응답 헤더 (그룹 목록 다음 페이지 커서, 랭킹 출처/나이)
+    expose_headers=["X-Next-Cursor", "X-Ranking-Snapshot-Age", "X-Ranking-Source"],
 )
 
 # 라우터 등록
@@ -85,6 +138,29 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+# 내부 지표 엔드포인트 보호
+# METRICS_TOKEN을 설정하면 X-Metrics-Token 헤더가 같을 때만 응답하고,
+# 설정하지 않으면 디버깅 라우터처럼 production이 아닐 때만 연다 (로그인 풀 포화 여부 등 노출 방지)
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+def require_metrics_access(x_metrics_token: Optional[str] = Header(None)):
+    if METRICS_TOKEN:
+        if x_metrics_token and hmac.compare_digest(x_metrics_token, METRICS_TOKEN):
+            return
+    elif os.getenv("ENV") != "production":
+        return
+    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+@app.get("/metrics/db", dependencies=[Depends(require_metrics_access)])
+async def db_metrics():
+    """DB 커넥션 풀 사용 현황"""
+    return {"pool": pool_metrics()}
+
+@app.get("/metrics/auth", dependencies=[Depends(require_metrics_access)])
+async def auth_metrics():
+    """비밀번호 해싱 스레드 풀 상태 (대기열 길이, 대기 시간 등)"""
+    return {"password_hasher": password_hasher.metrics()}
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -68,6 +68,9 @@ class GroupMission(Base):
     color = Column(String, default="bg-blue-300")
     created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # 비정규화 카운터 (group_counters.py에서 참여/탈퇴/체크와 같은 트랜잭션으로 갱신)
+    member_count = Column(Integer, nullable=False, default=0, server_default="0", index=True)
+    completed_check_count = Column(Integer, nullable=False, default=0, server_default="0")
     
     # 관계
     members = relationship("GroupMember", back_populates="group_mission", cascade="all, delete-orphan")
@@ -166,3 +169,53 @@ class WeeklyPersonalRoutine(Base):
         ),
     )
 
+
+class UserDailyScore(Base):
+    __tablename__ = "user_daily_scores"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    date = Column(Date, nullable=False, index=True)
+    personal_points = Column(Integer, nullable=False, default=0)  # 개인 미션 점수 (하루 최대 3점)
+    group_points = Column(Integer, nullable=False, default=0)  # 그룹 미션 점수 (2점 또는 보너스 4점)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    # 복합 유니크: 사용자별 하루 한 행
+    __table_args__ = (
+        UniqueConstraint('user_id', 'date', name='uq_user_daily_score'),
+    )
+
+class UserStreak(Base):
+    __tablename__ = "user_streaks"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, unique=True, index=True)
+    current_streak = Column(Integer, nullable=False, default=0)  # last_completed_date에서 끝나는 연속 달성일
+    longest_streak = Column(Integer, nullable=False, default=0)
+    last_completed_date = Column(Date, nullable=True)  # 마지막으로 개인 미션을 완료한 날짜 (KST)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+class DayVersion(Base):
+    __tablename__ = "day_versions"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    date = Column(Date, nullable=False)
+    version = Column(Integer, nullable=False, default=0)  # 해당 날짜 미션/루틴이 바뀔 때마다 1씩 증가
+    
+    # 복합 유니크: 사용자별 날짜당 한 행
+    __table_args__ = (
+        UniqueConstraint('user_id', 'date', name='uq_user_day_version'),
+    )
+
+class RefreshTokenFamily(Base):
+    __tablename__ = "refresh_token_families"
+    
+    # 로그인 1회마다 계열 1개. refresh 할 때마다 current_jti만 새 값으로 바뀐다
+    id = Column(String(32), primary_key=True)  # family_id (uuid hex)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    current_jti = Column(String(32), nullable=False)  # 지금 유효한 refresh 토큰의 jti
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)  # 마지막 refresh 토큰 만료 시각 (UTC)
+    revoked_at = Column(DateTime(timezone=True), nullable=True)  # 로그아웃/재사용 감지 시각
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
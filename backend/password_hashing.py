@@ -0,0 +1,143 @@
+# 비밀번호 해싱 전용 스레드 풀
+# =======================
+# bcrypt 검증은 한 번에 100~300ms 동안 CPU를 쓰므로 이벤트 루프에서 직접 돌리면
+# 그 시간 동안 같은 워커의 다른 요청(미션 조회 등)이 모두 멈춘다.
+# 크기가 정해진 전용 executor에서 실행하고, 대기 중인 작업 수가 상한을 넘으면
+# 큐에 더 쌓지 않고 바로 거절한다 (로그인 폭주가 다른 요청을 밀어내지 않도록).
+#
+# 환경 변수
+#   PASSWORD_HASH_WORKERS     : bcrypt 실행 스레드 수 (기본 min(4, CPU 수))
+#   PASSWORD_HASH_MAX_PENDING : 실행 중 + 대기 중 작업 상한 (기본 64)
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple, TypeVar
+
+from auth import get_password_hash, verify_and_update_password, verify_dummy_password, verify_password
+
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+
+T = TypeVar("T")
+
+
+class PasswordHasherBusy(Exception):
+    """대기 중인 해싱 작업이 상한에 도달함"""
+
+
+class PasswordHasherPool:
+    """bcrypt 작업을 전용 스레드에서 실행하고 대기열 지표를 기록"""
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(self.max_workers, max_pending)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0  # 실행 중 + 대기 중
+        self._running = 0
+        self._peak_pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._total_run_seconds = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="password-hash",
+                )
+            return self._executor
+
+    def _reserve(self) -> None:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise PasswordHasherBusy()
+            self._pending += 1
+            self._peak_pending = max(self._peak_pending, self._pending)
+
+    def _execute(self, submitted_at: float, func: Callable[..., T], *args) -> T:
+        started_at = time.perf_counter()
+        with self._lock:
+            self._running += 1
+            wait = started_at - submitted_at
+            self._total_wait_seconds += wait
+            self._max_wait_seconds = max(self._max_wait_seconds, wait)
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+                self._total_run_seconds += time.perf_counter() - started_at
+
+    def _release(self, _future=None) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        """func(*args)를 해싱 전용 스레드에서 실행 (상한 초과 시 PasswordHasherBusy)"""
+        executor = self._get_executor()
+        self._reserve()
+        try:
+            future = executor.submit(self._execute, time.perf_counter(), func, *args)
+        except BaseException:
+            self._release()
+            raise
+        # 요청이 취소되어 실행되지 않은 작업도 대기 수에서 빠지도록 완료 콜백에서 정리
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def metrics(self) -> dict:
+        with self._lock:
+            completed = self._completed
+            return {
+                "workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "running": self._running,
+                "queued": self._pending - self._running,
+                "peak_pending": self._peak_pending,
+                "completed": completed,
+                "rejected": self._rejected,
+                "avg_wait_ms": round(self._total_wait_seconds / completed * 1000, 2) if completed else 0.0,
+                "max_wait_ms": round(self._max_wait_seconds * 1000, 2),
+                "avg_run_ms": round(self._total_run_seconds / completed * 1000, 2) if completed else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hasher = PasswordHasherPool(PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_PENDING)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (해싱 전용 스레드에서 실행)"""
+    return await password_hasher.run(verify_password, plain_password, hashed_password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """비밀번호 검증 + 필요 시 새 비용으로 다시 만든 해시 (해싱 전용 스레드에서 실행)"""
+    return await password_hasher.run(verify_and_update_password, plain_password, hashed_password)
+
+
+async def verify_dummy_password_async(plain_password: str) -> bool:
+    """계정이 없을 때도 같은 시간이 걸리도록 더미 검증 (항상 False)"""
+    return await password_hasher.run(verify_dummy_password, plain_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """비밀번호 해싱 (해싱 전용 스레드에서 실행)"""
+    return await password_hasher.run(get_password_hash, password)
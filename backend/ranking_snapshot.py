@@ -0,0 +1,180 @@
+# 랭킹 스냅샷 캐시
+# =======================
+# 랭킹은 바뀌는 것보다 조회되는 일이 훨씬 많으므로, 개인 상위 N명과 그룹 랭킹을
+# 주기적으로(또는 점수 변경 직후) 다시 만들어 변경 불가능한 스냅샷으로 들고 있는다.
+# /ranking/* 엔드포인트는 이 스냅샷을 그대로 응답한다.
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from database import SessionLocal
+from schemas import RankingUserResponse
+from scoring import RANKING_DIRTY_KEY, group_leaderboard, personal_leaderboard_page, today_kst
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷에 담을 개인 랭킹 상위 인원
+RANKING_SNAPSHOT_TOP_N = int(os.getenv("RANKING_SNAPSHOT_TOP_N", "100"))
+# 변경이 없어도 이 주기(초)마다 다시 만든다
+RANKING_REFRESH_INTERVAL_SECONDS = float(os.getenv("RANKING_REFRESH_INTERVAL_SECONDS", "30"))
+# 이보다 오래된 스냅샷은 응답에 쓰지 않고 요청 안에서 다시 만든다 (허용 지연 상한)
+RANKING_MAX_STALENESS_SECONDS = float(os.getenv("RANKING_MAX_STALENESS_SECONDS", "120"))
+# 점수 변경 신호를 확인하는 주기(초)
+RANKING_DIRTY_POLL_SECONDS = float(os.getenv("RANKING_DIRTY_POLL_SECONDS", "1"))
+
+SNAPSHOT_AGE_HEADER = "X-Ranking-Snapshot-Age"
+# 응답 출처: snapshot(스냅샷) 또는 live(스냅샷 밖 구간을 DB에서 바로 조회)
+RANKING_SOURCE_HEADER = "X-Ranking-Source"
+
+
+@dataclass(frozen=True)
+class RankingSnapshot:
+    version: int  # 만들기 시작한 시점의 변경 번호
+    built_at: float  # time.monotonic()
+    built_for: date  # 연속 달성일 기준 날짜 (KST)
+    personal: Tuple[RankingUserResponse, ...]  # 개인 랭킹 상위 N명 (순위 순)
+    personal_position_by_user: Mapping[int, int]  # user_id -> personal 내 인덱스
+    is_complete: bool  # 전체 사용자가 personal에 들어 있는지
+    group: Tuple[Mapping[str, object], ...]  # 그룹 랭킹 전체 (총점 순)
+    group_rank_by_id: Mapping[int, int]  # group_id -> 순위 (동점은 같은 순위)
+
+    def age(self) -> float:
+        return time.monotonic() - self.built_at
+
+
+_snapshot: Optional[RankingSnapshot] = None
+_dirty_version = 0
+_build_lock = threading.Lock()
+_refresher_running = False
+
+
+def mark_dirty() -> None:
+    """점수가 바뀌었음을 알림 (다음 갱신 주기에 스냅샷을 다시 만든다)"""
+    global _dirty_version
+    _dirty_version += 1
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_dirty_after_commit(session):
+    # 커밋된 뒤에만 신호를 보내야 스냅샷이 커밋 전 상태를 읽지 않는다
+    if session.info.pop(RANKING_DIRTY_KEY, False):
+        mark_dirty()
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_dirty_after_rollback(session):
+    session.info.pop(RANKING_DIRTY_KEY, None)
+
+
+def _rank_groups(groups) -> dict:
+    ranks = {}
+    previous_score = None
+    current_rank = 0
+    for index, group in enumerate(groups):
+        if group["total_score"] != previous_score:
+            current_rank = index + 1
+            previous_score = group["total_score"]
+        ranks[group["id"]] = current_rank
+    return ranks
+
+
+def build_snapshot(db: Session) -> RankingSnapshot:
+    """DB에서 랭킹을 읽어 새 스냅샷 생성"""
+    version = _dirty_version
+    rows = personal_leaderboard_page(db, limit=RANKING_SNAPSHOT_TOP_N)
+    personal = tuple(
+        RankingUserResponse(
+            id=row.id,
+            name=row.name,
+            score=row.score,
+            streak=row.streak,
+            profile_color=row.profile_color,
+            rank=row.rank,
+        )
+        for row in rows
+    )
+    groups = group_leaderboard(db)
+
+    return RankingSnapshot(
+        version=version,
+        built_at=time.monotonic(),
+        built_for=today_kst(),
+        personal=personal,
+        personal_position_by_user=MappingProxyType(
+            {user.id: index for index, user in enumerate(personal)}
+        ),
+        is_complete=len(personal) < RANKING_SNAPSHOT_TOP_N,
+        group=tuple(MappingProxyType(group) for group in groups),
+        group_rank_by_id=MappingProxyType(_rank_groups(groups)),
+    )
+
+
+def refresh_snapshot(db: Optional[Session] = None) -> RankingSnapshot:
+    """스냅샷을 다시 만들어 교체 (동시에 여러 번 만들지 않도록 잠금)"""
+    global _snapshot
+    with _build_lock:
+        own_session = db is None
+        if own_session:
+            db = SessionLocal()
+        try:
+            _snapshot = build_snapshot(db)
+        finally:
+            if own_session:
+                db.close()
+        return _snapshot
+
+
+def _needs_refresh(snapshot: Optional[RankingSnapshot], max_age: float) -> bool:
+    if snapshot is None:
+        return True
+    if snapshot.age() >= max_age:
+        return True
+    if snapshot.built_for != today_kst():
+        return True
+    return snapshot.version < _dirty_version
+
+
+def get_snapshot(db: Session) -> RankingSnapshot:
+    """응답에 사용할 스냅샷
+
+    백그라운드 갱신이 돌고 있으면 허용 지연 상한 안의 스냅샷을 그대로 쓰고,
+    (테스트 등에서) 갱신 작업이 없으면 변경 신호가 있을 때 바로 다시 만든다.
+    """
+    snapshot = _snapshot
+    if _refresher_running:
+        needs_refresh = (
+            snapshot is None
+            or snapshot.age() >= RANKING_MAX_STALENESS_SECONDS
+            or snapshot.built_for != today_kst()
+        )
+    else:
+        needs_refresh = _needs_refresh(snapshot, RANKING_REFRESH_INTERVAL_SECONDS)
+    if needs_refresh:
+        snapshot = refresh_snapshot(db)
+    return snapshot
+
+
+async def run_refresher() -> None:
+    """앱 수명 동안 스냅샷을 주기적으로 갱신 (main.py lifespan에서 시작)"""
+    global _refresher_running
+    _refresher_running = True
+    try:
+        while True:
+            if _needs_refresh(_snapshot, RANKING_REFRESH_INTERVAL_SECONDS):
+                try:
+                    await asyncio.to_thread(refresh_snapshot)
+                except Exception:
+                    logger.exception("랭킹 스냅샷 갱신 실패")
+            await asyncio.sleep(RANKING_DIRTY_POLL_SECONDS)
+    finally:
+        _refresher_running = False
@@ -0,0 +1,239 @@
+# refresh 토큰 계열(family) 저장소
+# =======================
+# 로그인 1회마다 계열 하나를 만들고, refresh 할 때마다 계열의 current_jti를 새 값으로 바꾼다.
+# - 이미 교체된 refresh 토큰이 다시 들어오면(탈취 후 재사용) 계열 전체를 폐기한다.
+# - 로그아웃하면 계열을 폐기한다. access 토큰에도 계열 id(fam)가 들어 있으므로
+#   폐기된 계열의 access 토큰도 바로 거절된다.
+# - 폐기된 계열 id는 프로세스 메모리의 dict에 들고 있어서 요청마다의 검사는 O(1)이고
+#   DB를 읽지 않는다. 다른 워커에서 폐기한 계열은 주기적으로 DB에서 다시 읽어 맞춘다.
+# - 만료된 계열은 백그라운드에서 주기적으로 삭제한다.
+# - 계열 도입 전에 발급된 refresh 토큰(fam/jti 없음)은 처음 쓰일 때 그 토큰에서 정해지는
+#   계열 id로 새 계열을 만든다. 같은 토큰이 다시 오면 계열이 이미 있으므로 재사용으로 보고 폐기한다.
+#
+# 환경 변수
+#   REFRESH_REVOCATION_SYNC_SECONDS : 폐기 목록을 DB에서 다시 읽는 주기 (기본 30)
+#   REFRESH_PURGE_INTERVAL_SECONDS  : 만료된 계열 삭제 주기 (기본 3600)
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from database import SessionLocal
+from models import RefreshTokenFamily
+from tokens import TokenClaims, TokenError, token_service
+
+logger = logging.getLogger(__name__)
+
+REFRESH_REVOCATION_SYNC_SECONDS = float(os.getenv("REFRESH_REVOCATION_SYNC_SECONDS", "30"))
+REFRESH_PURGE_INTERVAL_SECONDS = float(os.getenv("REFRESH_PURGE_INTERVAL_SECONDS", "3600"))
+
+
+class RevokedFamilies:
+    """폐기된 계열 id → 계열 만료 시각(epoch). 만료 후에는 토큰 자체가 무효라 목록에서 지운다"""
+
+    def __init__(self):
+        self._expires_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, family_id: str) -> bool:
+        return family_id in self._expires_at
+
+    def __len__(self) -> int:
+        return len(self._expires_at)
+
+    def add(self, family_id: str, expires_at: float) -> None:
+        with self._lock:
+            self._expires_at[family_id] = expires_at
+
+    def update(self, entries: Dict[str, float]) -> None:
+        with self._lock:
+            self._expires_at.update(entries)
+
+    def purge(self, now: float) -> None:
+        with self._lock:
+            self._expires_at = {
+                family_id: expires_at
+                for family_id, expires_at in self._expires_at.items()
+                if expires_at > now
+            }
+
+
+revoked_families = RevokedFamilies()
+
+
+def _new_id() -> str:
+    return uuid.uuid4().hex
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _epoch(value: datetime) -> float:
+    # SQLite는 타임존 없이 돌려주므로 UTC로 간주
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _legacy_family_id(claims: TokenClaims) -> str:
+    # 계열 없는 토큰은 (사용자, 발급/만료 시각)으로 구분된다
+    key = f"legacy:{claims.user_id}:{claims.issued_at}:{claims.expires_at}"
+    return hashlib.sha256(key.encode()).hexdigest()[:32]
+
+
+def is_revoked(claims: TokenClaims) -> bool:
+    """토큰이 폐기된 계열에 속하는지 (메모리만 확인)"""
+    return claims.family_id is not None and claims.family_id in revoked_families
+
+
+def issue_new_family(db: Session, user_id: int) -> Tuple[str, str]:
+    """새 계열을 만들고 (access, refresh) 토큰 쌍 발급"""
+    family = RefreshTokenFamily(
+        id=_new_id(),
+        user_id=user_id,
+        current_jti=_new_id(),
+        expires_at=_utcnow() + token_service.refresh_expires,
+    )
+    db.add(family)
+    db.commit()
+    return token_service.issue_token_pair(user_id, family_id=family.id, token_id=family.current_jti)
+
+
+def revoke_family(db: Session, family_id: str) -> None:
+    """계열 폐기 (이미 폐기됐으면 그대로 둔다)"""
+    family = db.query(RefreshTokenFamily).filter(RefreshTokenFamily.id == family_id).first()
+    if family is None:
+        return
+    if family.revoked_at is None:
+        family.revoked_at = _utcnow()
+        db.commit()
+    revoked_families.add(family.id, _epoch(family.expires_at))
+
+
+def rotate(db: Session, claims: TokenClaims) -> Tuple[str, str]:
+    """refresh 토큰을 새 토큰 쌍으로 교체 (재사용이면 계열 폐기 후 TokenError)"""
+    if claims.family_id is None or claims.token_id is None:
+        return _migrate_legacy(db, claims)
+    if claims.family_id in revoked_families:
+        raise TokenError("폐기된 토큰입니다")
+
+    new_jti = _new_id()
+    # current_jti가 요청 토큰과 같을 때만 바꾸는 조건부 UPDATE (동시 요청에도 한 번만 성공)
+    updated = (
+        db.query(RefreshTokenFamily)
+        .filter(
+            RefreshTokenFamily.id == claims.family_id,
+            RefreshTokenFamily.user_id == claims.user_id,
+            RefreshTokenFamily.current_jti == claims.token_id,
+            RefreshTokenFamily.revoked_at.is_(None),
+        )
+        .update(
+            {
+                RefreshTokenFamily.current_jti: new_jti,
+                RefreshTokenFamily.expires_at: _utcnow() + token_service.refresh_expires,
+            },
+            synchronize_session=False,
+        )
+    )
+    if updated != 1:
+        db.rollback()
+        # 이미 교체된 토큰이 다시 쓰였거나 폐기된 계열 → 계열 전체 폐기
+        logger.warning(
+            "refresh 토큰 재사용 감지, 계열 폐기",
+            extra={"user_id": claims.user_id, "family_id": claims.family_id},
+        )
+        revoke_family(db, claims.family_id)
+        raise TokenError("재사용된 refresh 토큰입니다")
+    db.commit()
+    return token_service.issue_token_pair(claims.user_id, family_id=claims.family_id, token_id=new_jti)
+
+
+def _migrate_legacy(db: Session, claims: TokenClaims) -> Tuple[str, str]:
+    """계열 도입 전에 발급된 refresh 토큰을 한 번만 새 계열로 옮긴다"""
+    family_id = _legacy_family_id(claims)
+    if family_id in revoked_families:
+        raise TokenError("폐기된 토큰입니다")
+
+    expires_at = max(
+        _utcnow() + token_service.refresh_expires,
+        datetime.fromtimestamp(claims.expires_at, timezone.utc),
+    )
+    family = RefreshTokenFamily(
+        id=family_id,
+        user_id=claims.user_id,
+        current_jti=_new_id(),
+        expires_at=expires_at,
+    )
+    db.add(family)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        # 이미 옮긴 토큰이 다시 쓰였다 → 그 계열 전체 폐기
+        logger.warning(
+            "이전 형식 refresh 토큰 재사용 감지, 계열 폐기",
+            extra={"user_id": claims.user_id, "family_id": family_id},
+        )
+        revoke_family(db, family_id)
+        raise TokenError("재사용된 refresh 토큰입니다")
+    return token_service.issue_token_pair(claims.user_id, family_id=family_id, token_id=family.current_jti)
+
+
+def sync_revocations(db: Session) -> int:
+    """DB의 폐기 목록(만료 전)을 메모리 목록에 합침 (다른 워커에서 폐기한 계열 반영)"""
+    rows = (
+        db.query(RefreshTokenFamily.id, RefreshTokenFamily.expires_at)
+        .filter(
+            RefreshTokenFamily.revoked_at.isnot(None),
+            RefreshTokenFamily.expires_at > _utcnow(),
+        )
+        .all()
+    )
+    revoked_families.update({row.id: _epoch(row.expires_at) for row in rows})
+    return len(rows)
+
+
+def purge_expired(db: Session) -> int:
+    """만료된 계열 삭제"""
+    deleted = (
+        db.query(RefreshTokenFamily)
+        .filter(RefreshTokenFamily.expires_at <= _utcnow())
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    revoked_families.purge(time.time())
+    return deleted
+
+
+def _run_in_session(func):
+    db = SessionLocal()
+    try:
+        return func(db)
+    finally:
+        db.close()
+
+
+async def run_maintenance() -> None:
+    """앱 수명 동안 폐기 목록 동기화와 만료 계열 삭제 (main.py lifespan에서 시작)"""
+    next_purge = 0.0
+    while True:
+        try:
+            if time.monotonic() >= next_purge:
+                deleted = await asyncio.to_thread(_run_in_session, purge_expired)
+                if deleted:
+                    logger.info("만료된 refresh 토큰 계열 삭제", extra={"deleted": deleted})
+                next_purge = time.monotonic() + REFRESH_PURGE_INTERVAL_SECONDS
+            await asyncio.to_thread(_run_in_session, sync_revocations)
+        except Exception:
+            logger.exception("refresh 토큰 저장소 정리 실패")
+        await asyncio.sleep(REFRESH_REVOCATION_SYNC_SECONDS)
@@ -1,63 +1,80 @@
 # 인증 관련 라우터
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from database import get_db
 from models import User
 from schemas import LoginRequest, TokenResponse, RefreshTokenRequest
-from auth import (
-    verify_password,
-    get_password_hash,
-    create_access_token,
-    create_refresh_token,
-    get_current_user,
-    SECRET_KEY,
-    ALGORITHM,
-    ACCESS_TOKEN_EXPIRE_MINUTES
+from password_hashing import (
+    PasswordHasherBusy,
+    verify_and_update_password_async,
+    verify_dummy_password_async,
 )
-from datetime import timedelta
-import jwt
+from auth import get_current_user, oauth2_scheme
+from refresh_tokens import issue_new_family, revoke_family, rotate
+from tokens import ACCESS, REFRESH, TokenError, token_service
+from typing import Optional
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/auth", tags=["인증"])
 
+def _find_login_user(db: Session, email: str):
+    # 로그인에는 id와 비밀번호 해시만 필요하므로 두 컬럼만 조회
+    return db.query(User.id, User.password_hash).filter(User.email == email).first()
+
+def _complete_login(db: Session, user_id: int, new_hash: Optional[str]):
+    if new_hash:
+        # BCRYPT_ROUNDS가 바뀐 경우 로그인 성공 시점에 새 비용으로 다시 저장
+        db.query(User).filter(User.id == user_id).update(
+            {User.password_hash: new_hash}, synchronize_session=False
+        )
+        db.commit()
+    return issue_new_family(db, user_id)
+
 @router.post("/login", response_model=TokenResponse)
 async def login(
     login_data: LoginRequest,
     db: Session = Depends(get_db)
 ):
-    """이메일/비밀번호 로그인"""
-    user = db.query(User).filter(User.email == login_data.email).first()
+    """이메일/비밀번호 로그인
+
+    비밀번호 검증을 await 해야 해서 async 핸들러로 두고, 동기 DB 작업은 스레드풀에서 실행
+    """
+    user = await run_in_threadpool(_find_login_user, db, login_data.email)
     
-    if not user or not user.password_hash:
+    try:
+        # bcrypt는 이벤트 루프를 막지 않도록 해싱 전용 스레드 풀에서 실행
+        if not user or not user.password_hash:
+            # 없는 계정/소셜 전용 계정도 같은 비용의 더미 검증 한 번으로 응답 시간을 맞춘다
+            password_ok = await verify_dummy_password_async(login_data.password)
+            new_hash = None
+        else:
+            password_ok, new_hash = await verify_and_update_password_async(
+                login_data.password, user.password_hash
+            )
+    except PasswordHasherBusy:
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="이메일 또는 비밀번호가 올바르지 않습니다"
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="로그인 요청이 많습니다. 잠시 후 다시 시도해주세요",
+            headers={"Retry-After": "1"},
         )
-    
-    if not verify_password(login_data.password, user.password_hash):
+    if not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="이메일 또는 비밀번호가 올바르지 않습니다"
         )
     
-    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    # JWT의 sub 필드는 문자열이어야 함
-    access_token = create_access_token(
-        data={"sub": str(user.id)}, expires_delta=access_token_expires
-    )
-    refresh_token = create_refresh_token(data={"sub": str(user.id)})
+    access_token, refresh_token = await run_in_threadpool(_complete_login, db, user.id, new_hash)
     
-    # 디버깅: 토큰 생성 확인
-    print(f"[DEBUG] 로그인 성공: user_id={user.id}")
-    print(f"[DEBUG] SECRET_KEY (처음 20자): {SECRET_KEY[:20] if SECRET_KEY else 'None'}...")
-    print(f"[DEBUG] ALGORITHM: {ALGORITHM}")
-    print(f"[DEBUG] access_token (처음 50자): {access_token[:50]}...")
-    print(f"[DEBUG] refresh_token (처음 50자): {refresh_token[:50]}...")
+    logger.info("로그인 성공", extra={"user_id": user.id})
     
     return TokenResponse(access=access_token, refresh=refresh_token)
 
 @router.post("/refresh", response_model=TokenResponse)
-async def refresh_token(
+def refresh_token(
     refresh_data: RefreshTokenRequest,
     db: Session = Depends(get_db)
 ):
@@ -68,35 +85,32 @@ async def refresh_token(
     )
     
     try:
-        payload = jwt.decode(refresh_data.refresh, SECRET_KEY, algorithms=[ALGORITHM])
-        # sub는 문자열로 저장되므로 정수로 변환
-        user_id_str = payload.get("sub")
-        if user_id_str is None:
-            raise credentials_exception
-        user_id: int = int(user_id_str)
-        token_type: str = payload.get("type")
-        
-        if token_type != "refresh":
-            raise credentials_exception
-    except jwt.InvalidTokenError:
+        claims = token_service.verify(refresh_data.refresh, REFRESH)
+    except TokenError:
         raise credentials_exception
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.query(User.id).filter(User.id == claims.user_id).first()
     if user is None:
         raise credentials_exception
     
-    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    # JWT의 sub 필드는 문자열이어야 함
-    access_token = create_access_token(
-        data={"sub": str(user.id)}, expires_delta=access_token_expires
-    )
-    refresh_token = create_refresh_token(data={"sub": str(user.id)})
+    try:
+        # refresh 토큰은 한 번만 쓸 수 있다 (이미 교체된 토큰이면 계열 전체 폐기)
+        access_token, refresh_token = rotate(db, claims)
+    except TokenError:
+        raise credentials_exception
     
     return TokenResponse(access=access_token, refresh=refresh_token)
 
 @router.post("/logout")
-async def logout(current_user: User = Depends(get_current_user)):
-    """로그아웃 (클라이언트에서 토큰 삭제)"""
+def logout(
+    token: str = Depends(oauth2_scheme),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """로그아웃 (이 로그인의 refresh 토큰 계열 폐기, 같은 계열의 access 토큰도 무효)"""
+    claims = token_service.verify(token, ACCESS)
+    if claims.family_id:
+        revoke_family(db, claims.family_id)
     return {"message": "로그아웃되었습니다"}
 
 @router.post("/{provider}")
@@ -1,11 +1,13 @@
 # 날짜별 미션 라우터
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Header, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import Date, and_, case, cast, column, exists, func, literal_column, select, values
 from sqlalchemy.exc import SQLAlchemyError
-from database import get_db
+from database import get_db, SessionLocal
 from models import DayMission, User, WeeklyPersonalRoutine
 from schemas import (
+    CatalogMissionResponse,
     DayMissionResponse,
     DayMissionCreate,
     DayMissionUpdate,
@@ -13,17 +15,23 @@ from schemas import (
     DayCompletionSummary,
 )
 from auth import get_current_user
+from scoring import refresh_daily_score
+from day_versions import CACHE_CONTROL, bump_day_versions, etag_matches, get_day_versions, make_etag
 from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
 import json
 import os
 import logging
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 # KST(Asia/Seoul) 타임존 설정
 KST = ZoneInfo("Asia/Seoul")
 logger = logging.getLogger(__name__)
 
+# 기간 조회(/days/range) 제한
+MAX_RANGE_DAYS = 366
+RANGE_CHUNK_WEEKS = 4  # 한 번에 집계하는 주 수 (메모리 사용량 상한)
+
 def get_monday_of_week(target_date: date) -> date:
     """특정 날짜가 속한 주의 월요일 날짜를 반환"""
     days_since_monday = target_date.weekday()  # 0=월요일, 6=일요일
@@ -56,46 +64,113 @@ def resolve_target_date(raw_date: Optional[str]) -> date:
         logger.warning("Invalid date input for week summary: %s", raw_date)
         return datetime.now(KST).date()
 
+def build_day_mission_list(target_date: date, day_missions: list, weekly_routines: list) -> list:
+    """한 날짜의 일일 미션 + 주간 루틴을 응답 형태로 합친다
+
+    주간 루틴은 start_date부터 그 주 일요일까지만 표시하고,
+    같은 (sub_mission, mission_id)의 일일 미션이 이미 있으면 제외한다.
+    """
+    sunday = get_sunday_of_week(target_date)
+    
+    # 주간 루틴을 DayMission 형태로 변환 (프론트엔드 호환)
+    # start_date 기준으로 필터링: target_date >= start_date && target_date <= sunday
+    routine_missions = []
+    for routine in weekly_routines:
+        # 선택한 날짜가 start_date부터 그 주 일요일 사이에 있어야 표시
+        if not (routine.start_date <= target_date <= sunday):
+            continue  # 이 날짜에는 이 루틴을 표시하지 않음
+        
+        # CatalogMission 테이블이 없으므로 mission_id와 sub_mission만 사용
+        # 프론트엔드에서 하드코딩된 데이터를 사용하므로 최소한의 정보만 반환
+        mission_dict = {
+            "id": routine.mission_id,
+            "category": "",  # 프론트엔드에서 하드코딩된 데이터 사용
+            "submissions": [],  # 프론트엔드에서 하드코딩된 데이터 사용
+            "name": routine.sub_mission or ""
+        }
+        routine_missions.append({
+            "id": routine.id,
+            "mission": mission_dict,
+            "sub_mission": routine.sub_mission,
+            "completed": False,  # 주간 루틴은 날짜별로 체크 가능하도록 day_missions에서 확인해야 함
+            "date": target_date.isoformat(),
+            "created_at": routine.created_at.isoformat() if routine.created_at else None,
+            "is_weekly_routine": True,  # 주간 루틴임을 표시
+            "routine_id": routine.id
+        })
+    
+    # 일일 미션에 주간 루틴 정보 추가 (is_weekly_routine=False)
+    # CatalogMission 테이블이 없으므로 mission_id와 sub_mission만 사용
+    result = []
+    for mission in day_missions:
+        mission_dict = {
+            "id": mission.mission_id,
+            "category": "",  # 프론트엔드에서 하드코딩된 데이터 사용
+            "submissions": [],  # 프론트엔드에서 하드코딩된 데이터 사용
+            "name": mission.sub_mission or ""
+        }
+        result.append({
+            "id": mission.id,
+            "mission": mission_dict,
+            "sub_mission": mission.sub_mission,
+            "completed": mission.completed,
+            "date": mission.date.isoformat(),
+            "created_at": mission.created_at.isoformat() if mission.created_at else None,
+            "is_weekly_routine": False
+        })
+    
+    # 주간 루틴 추가 (이미 day_missions에 해당 날짜의 체크가 있으면 제외)
+    existing_mission_keys = {(m.sub_mission, m.mission_id) for m in day_missions}
+    for routine in routine_missions:
+        routine_key = (routine["sub_mission"], routine["mission"]["id"])
+        if routine_key not in existing_mission_keys:
+            result.append(routine)
+    
+    return result
+
+def not_modified_response(
+    db: Session,
+    user_id: int,
+    kind: str,
+    dates: List[date],
+    response: Response,
+    if_none_match: Optional[str],
+) -> Optional[Response]:
+    """날짜별 버전으로 ETag를 만들어 응답 헤더에 넣고, If-None-Match와 같으면 304 응답을 반환"""
+    etag = make_etag(kind, user_id, get_day_versions(db, user_id, dates))
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
+
 router = APIRouter(prefix="/days", tags=["날짜별 미션"])
 
 
 @router.get("/week-summary", response_model=List[DayCompletionSummary])
-async def get_week_summary(
+def get_week_summary(
+    response: Response,
     date_str: Optional[str] = Query(
         None, alias="date", description="기준 날짜 (YYYY-MM-DD, 기본값=오늘)"
     ),
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """특정 주간(월~일)의 완료 현황 요약"""
+    """특정 주간(월~일)의 완료 현황 요약 (If-None-Match 지원)"""
     target_date = resolve_target_date(date_str)
 
     week_start = get_monday_of_week(target_date)
     sunday = get_sunday_of_week(week_start)
 
     try:
-        day_missions = (
-            db.query(DayMission)
-            .filter(
-                and_(
-                    DayMission.user_id == current_user.id,
-                    DayMission.date >= week_start,
-                    DayMission.date <= sunday,
-                )
-            )
-            .all()
-        )
-
-        weekly_routines = (
-            db.query(WeeklyPersonalRoutine)
-            .filter(
-                and_(
-                    WeeklyPersonalRoutine.user_id == current_user.id,
-                    WeeklyPersonalRoutine.week_start_date == week_start,
-                )
-            )
-            .all()
+        week_dates = [week_start + timedelta(days=i) for i in range(7)]
+        not_modified = not_modified_response(
+            db, current_user.id, "week-summary", week_dates, response, if_none_match
         )
+        if not_modified:
+            return not_modified
+        return summarize_days(db, current_user.id, week_start, sunday)
     except SQLAlchemyError:
         logger.exception("Failed to query week summary data for user %s", current_user.id)
         raise HTTPException(
@@ -103,66 +178,181 @@ async def get_week_summary(
             detail="주간 요약 데이터를 불러오지 못했습니다.",
         )
 
-    missions_by_date = {}
-    for mission in day_missions:
-        missions_by_date.setdefault(mission.date, []).append(mission)
 
-    valid_weekly_routines = []
-    for routine in weekly_routines:
-        if routine.start_date is None:
-            logger.warning("Weekly routine %s missing start_date. Skipping.", routine.id)
-            continue
-        valid_weekly_routines.append(routine)
-
-    summaries = {
-        week_start + timedelta(days=i): DayCompletionSummary(
-            date=week_start + timedelta(days=i),
-            total_missions=0,
-            completed_missions=0,
-            completion_rate=0.0,
-            is_day_perfectly_complete=False,
-        )
-        for i in range(7)
-    }
+def _date_series(db: Session, start: date, end: date):
+    """start~end 날짜 목록 CTE (d, week_start)
 
-    for offset in range(7):
-        current_date = week_start + timedelta(days=offset)
-        day_list = missions_by_date.get(current_date, [])
-        total_missions = len(day_list)
-        completed_missions = sum(1 for mission in day_list if mission.completed)
+    PostgreSQL은 generate_series로 DB에서 날짜를 만들고,
+    SQLite는 VALUES 목록으로 대신한다 (조회 기간이 최대 1년이라 부담이 없다).
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        series = func.generate_series(
+            start, end, literal_column("interval '1 day'")
+        ).table_valued("value").alias("series")
+        return select(
+            cast(series.c.value, Date).label("d"),
+            cast(func.date_trunc("week", series.c.value), Date).label("week_start"),
+        ).cte("days")
+
+    rows = []
+    current_date = start
+    while current_date <= end:
+        rows.append((current_date, get_monday_of_week(current_date)))
+        current_date += timedelta(days=1)
+    return values(
+        column("d", Date), column("week_start", Date), name="days"
+    ).data(rows).cte("days")
+
+
+def summarize_days(db: Session, user_id: int, start: date, end: date) -> List[DayCompletionSummary]:
+    """start~end 날짜별 완료 현황을 집계 쿼리 한 번으로 계산
+
+    - 일일 미션 수/완료 수: day_missions를 날짜별 GROUP BY
+    - 루틴 수: 날짜 목록을 주간 루틴과 조인해서, 그날 표시되는 루틴 중
+      같은 (mission_id, sub_mission)의 일일 미션이 없는 것만 센다
+    """
+    days = _date_series(db, start, end)
+
+    mission_totals = (
+        select(
+            DayMission.date.label("d"),
+            func.count(DayMission.id).label("total"),
+            func.sum(case((DayMission.completed == True, 1), else_=0)).label("completed"),
+        )
+        .where(
+            and_(
+                DayMission.user_id == user_id,
+                DayMission.date >= start,
+                DayMission.date <= end,
+            )
+        )
+        .group_by(DayMission.date)
+        .subquery("mission_totals")
+    )
 
-        existing_keys = {(mission.mission_id, mission.sub_mission) for mission in day_list}
+    # 루틴은 start_date부터 그 주 일요일까지 표시된다 (week_start_date가 같은 주)
+    routine_gaps = (
+        select(days.c.d, func.count(WeeklyPersonalRoutine.id).label("gap"))
+        .select_from(days)
+        .join(
+            WeeklyPersonalRoutine,
+            and_(
+                WeeklyPersonalRoutine.user_id == user_id,
+                WeeklyPersonalRoutine.week_start_date == days.c.week_start,
+                WeeklyPersonalRoutine.start_date <= days.c.d,
+            ),
+        )
+        .where(
+            ~exists().where(
+                and_(
+                    DayMission.user_id == user_id,
+                    DayMission.date == days.c.d,
+                    DayMission.mission_id == WeeklyPersonalRoutine.mission_id,
+                    # 예전 데이터의 NULL sub_mission끼리도 같은 미션으로 본다
+                    DayMission.sub_mission.is_not_distinct_from(WeeklyPersonalRoutine.sub_mission),
+                )
+            )
+        )
+        .group_by(days.c.d)
+        .subquery("routine_gaps")
+    )
 
-        for routine in valid_weekly_routines:
-            if routine.start_date <= current_date <= sunday:
-                routine_key = (routine.mission_id, routine.sub_mission)
-                if routine_key not in existing_keys:
-                    total_missions += 1
+    rows = db.execute(
+        select(
+            days.c.d,
+            (
+                func.coalesce(mission_totals.c.total, 0)
+                + func.coalesce(routine_gaps.c.gap, 0)
+            ).label("total"),
+            func.coalesce(mission_totals.c.completed, 0).label("completed"),
+        )
+        .select_from(days)
+        .outerjoin(mission_totals, mission_totals.c.d == days.c.d)
+        .outerjoin(routine_gaps, routine_gaps.c.d == days.c.d)
+        .order_by(days.c.d)
+    ).all()
 
-        completion_rate = (
-            completed_missions / total_missions if total_missions > 0 else 0.0
+    return [
+        DayCompletionSummary(
+            date=row.d,
+            total_missions=row.total,
+            completed_missions=row.completed,
+            completion_rate=row.completed / row.total if row.total > 0 else 0.0,
+            is_day_perfectly_complete=row.total > 0 and row.completed == row.total,
         )
-        is_perfect = total_missions > 0 and completed_missions == total_missions
+        for row in rows
+    ]
+
+
+def iter_day_summaries(db: Session, user_id: int, start: date, end: date) -> Iterator[DayCompletionSummary]:
+    """start~end 날짜별 완료 현황을 날짜 순으로 생성
+
+    RANGE_CHUNK_WEEKS 주 단위로 summarize_days를 호출하므로 기간이 길어도
+    한 번에 들고 있는 데이터는 몇 주 분량뿐이다.
+    """
+    chunk_start = start
+    while chunk_start <= end:
+        chunk_end = min(chunk_start + timedelta(weeks=RANGE_CHUNK_WEEKS) - timedelta(days=1), end)
+        yield from summarize_days(db, user_id, chunk_start, chunk_end)
+        chunk_start = chunk_end + timedelta(days=1)
+
+
+@router.get("/range")
+def get_range_summary(
+    start: date = Query(..., description="시작 날짜 (YYYY-MM-DD)"),
+    end: date = Query(..., description="종료 날짜 (YYYY-MM-DD, 포함)"),
+    response_format: str = Query(
+        "ndjson", alias="format", pattern="^(ndjson|json)$", description="ndjson(한 줄에 하루) 또는 json(배열)"
+    ),
+    current_user: User = Depends(get_current_user),
+):
+    """임의 기간(최대 1년)의 날짜별 완료 현황을 스트리밍으로 응답
 
-        summaries[current_date] = DayCompletionSummary(
-            date=current_date,
-            total_missions=total_missions,
-            completed_missions=completed_missions,
-            completion_rate=completion_rate,
-            is_day_perfectly_complete=is_perfect,
+    week-summary와 같은 항목을 날짜 순으로 내려준다. 전체 목록을 메모리에 만들지 않고
+    몇 주 단위로 집계하는 대로 바로 전송한다.
+    """
+    if end < start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="종료 날짜가 시작 날짜보다 빠릅니다"
+        )
+    if (end - start).days + 1 > MAX_RANGE_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"조회 기간은 최대 {MAX_RANGE_DAYS}일입니다"
         )
 
-    return list(summaries.values())
+    user_id = current_user.id
+
+    def generate():
+        # 스트리밍 도중에도 세션이 살아 있도록 응답 전용 세션 사용
+        db = SessionLocal()
+        try:
+            if response_format == "json":
+                yield "["
+                for index, summary in enumerate(iter_day_summaries(db, user_id, start, end)):
+                    yield ("," if index else "") + summary.model_dump_json()
+                yield "]"
+            else:
+                for summary in iter_day_summaries(db, user_id, start, end):
+                    yield summary.model_dump_json() + "\n"
+        finally:
+            db.close()
+
+    media_type = "application/json" if response_format == "json" else "application/x-ndjson"
+    return StreamingResponse(generate(), media_type=media_type)
 
 
 @router.get("/{date_str}/missions")
 @router.get("/{date_str}")  # 레거시 호환
-async def get_day_missions(
+def get_day_missions(
+    response: Response,
     date_str: str = Path(..., pattern=r"^\d{4}-\d{2}-\d{2}$"),
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """특정 날짜의 미션 목록 조회 (일일 미션 + 주간 루틴 포함)"""
+    """특정 날짜의 미션 목록 조회 (일일 미션 + 주간 루틴 포함, If-None-Match 지원)"""
     try:
         target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
     except ValueError:
@@ -171,6 +361,12 @@ async def get_day_missions(
             detail="날짜 형식이 올바르지 않습니다 (YYYY-MM-DD)"
         )
     
+    not_modified = not_modified_response(
+        db, current_user.id, "day-missions", [target_date], response, if_none_match
+    )
+    if not_modified:
+        return not_modified
+    
     # 일일 미션 조회
     day_missions = db.query(DayMission).filter(
         and_(
@@ -184,7 +380,6 @@ async def get_day_missions(
     
     # 주간 루틴 조회 (해당 날짜가 속한 주의 월요일 루틴)
     week_start = get_monday_of_week(target_date)
-    sunday = get_sunday_of_week(week_start)
     
     weekly_routines = db.query(WeeklyPersonalRoutine).filter(
         and_(
@@ -193,64 +388,73 @@ async def get_day_missions(
         )
     ).all()
     
-    # 주간 루틴을 DayMission 형태로 변환 (프론트엔드 호환)
-    # start_date 기준으로 필터링: target_date >= start_date && target_date <= sunday
-    routine_missions = []
-    for routine in weekly_routines:
-        # 선택한 날짜가 start_date부터 그 주 일요일 사이에 있어야 표시
-        if not (routine.start_date <= target_date <= sunday):
-            continue  # 이 날짜에는 이 루틴을 표시하지 않음
-        
-        # CatalogMission 테이블이 없으므로 mission_id와 sub_mission만 사용
-        # 프론트엔드에서 하드코딩된 데이터를 사용하므로 최소한의 정보만 반환
-        mission_dict = {
-            "id": routine.mission_id,
-            "category": "",  # 프론트엔드에서 하드코딩된 데이터 사용
-            "submissions": [],  # 프론트엔드에서 하드코딩된 데이터 사용
-            "name": routine.sub_mission or ""
-        }
-        routine_missions.append({
-            "id": routine.id,
-            "mission": mission_dict,
-            "sub_mission": routine.sub_mission,
-            "completed": False,  # 주간 루틴은 날짜별로 체크 가능하도록 day_missions에서 확인해야 함
-            "date": target_date.isoformat(),
-            "created_at": routine.created_at.isoformat() if routine.created_at else None,
-            "is_weekly_routine": True,  # 주간 루틴임을 표시
-            "routine_id": routine.id
-        })
+    return build_day_mission_list(target_date, day_missions, weekly_routines)
+
+@router.get("/week/{week_start_date}/missions")
+def get_week_missions(
+    response: Response,
+    week_start_date: str = Path(..., pattern=r"^\d{4}-\d{2}-\d{2}$"),
+    if_none_match: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """특정 주(월~일)의 날짜별 미션 목록을 한 번에 조회
+
+    응답은 {"YYYY-MM-DD": [...], ...} 형태이며 각 날짜의 목록은
+    /days/{date}/missions 응답과 같다. 월요일이 아닌 날짜를 보내면 그 날짜가 속한 주로 처리한다.
+    """
+    try:
+        requested_date = datetime.strptime(week_start_date, "%Y-%m-%d").date()
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="날짜 형식이 올바르지 않습니다 (YYYY-MM-DD)"
+        )
     
-    # 일일 미션에 주간 루틴 정보 추가 (is_weekly_routine=False)
-    # CatalogMission 테이블이 없으므로 mission_id와 sub_mission만 사용
-    result = []
+    week_start = get_monday_of_week(requested_date)
+    sunday = get_sunday_of_week(week_start)
+    
+    week_dates = [week_start + timedelta(days=i) for i in range(7)]
+    not_modified = not_modified_response(
+        db, current_user.id, "week-missions", week_dates, response, if_none_match
+    )
+    if not_modified:
+        return not_modified
+    
+    # 주간의 모든 일일 미션 조회 (한 번의 쿼리)
+    day_missions = db.query(DayMission).filter(
+        and_(
+            DayMission.user_id == current_user.id,
+            DayMission.date >= week_start,
+            DayMission.date <= sunday
+        )
+    ).all()
+    
+    # 주간 루틴 조회 (한 번의 쿼리)
+    weekly_routines = db.query(WeeklyPersonalRoutine).filter(
+        and_(
+            WeeklyPersonalRoutine.user_id == current_user.id,
+            WeeklyPersonalRoutine.week_start_date == week_start
+        )
+    ).all()
+    
+    missions_by_date = {}
     for mission in day_missions:
-        mission_dict = {
-            "id": mission.mission_id,
-            "category": "",  # 프론트엔드에서 하드코딩된 데이터 사용
-            "submissions": [],  # 프론트엔드에서 하드코딩된 데이터 사용
-            "name": mission.sub_mission or ""
-        }
-        result.append({
-            "id": mission.id,
-            "mission": mission_dict,
-            "sub_mission": mission.sub_mission,
-            "completed": mission.completed,
-            "date": mission.date.isoformat(),
-            "created_at": mission.created_at.isoformat() if mission.created_at else None,
-            "is_weekly_routine": False
-        })
+        missions_by_date.setdefault(mission.date, []).append(mission)
     
-    # 주간 루틴 추가 (이미 day_missions에 해당 날짜의 체크가 있으면 제외)
-    existing_mission_keys = {(m.sub_mission, m.mission_id) for m in day_missions}
-    for routine in routine_missions:
-        routine_key = (routine["sub_mission"], routine["mission"]["id"])
-        if routine_key not in existing_mission_keys:
-            result.append(routine)
+    result = {}
+    for offset in range(7):
+        current_date = week_start + timedelta(days=offset)
+        result[current_date.isoformat()] = build_day_mission_list(
+            current_date,
+            missions_by_date.get(current_date, []),
+            weekly_routines,
+        )
     
     return result
 
 @router.post("/{date_str}/missions")
-async def add_mission(
+def add_mission(
     date_str: str,
     mission_data: DayMissionCreate,
     current_user: User = Depends(get_current_user),
@@ -318,6 +522,9 @@ async def add_mission(
             
             current_date += timedelta(days=1)
         
+        bump_day_versions(
+            db, current_user.id, [date.fromisoformat(created) for created in created_dates]
+        )
         db.commit()
         
         return DayMissionBatchCreateResponse(
@@ -371,6 +578,7 @@ async def add_mission(
         completed=False
     )
     db.add(day_mission)
+    bump_day_versions(db, current_user.id, [target_date])
     db.commit()
     db.refresh(day_mission)
     
@@ -379,7 +587,7 @@ async def add_mission(
     return day_mission
 
 @router.delete("/{date_str}/missions/{mission_id}")
-async def delete_mission(
+def delete_mission(
     date_str: str,
     mission_id: int,
     current_user: User = Depends(get_current_user),
@@ -408,12 +616,16 @@ async def delete_mission(
             detail="존재하지 않는 미션입니다"
         )
     
+    was_completed = day_mission.completed
     db.delete(day_mission)
+    if was_completed:
+        refresh_daily_score(db, current_user.id, target_date)
+    bump_day_versions(db, current_user.id, [target_date])
     db.commit()
     return {"message": "미션이 삭제되었습니다"}
 
 @router.patch("/{date_str}/missions/{mission_id}/complete", response_model=DayMissionResponse)
-async def toggle_complete(
+def toggle_complete(
     date_str: str,
     mission_id: int,
     update_data: DayMissionUpdate,
@@ -444,20 +656,35 @@ async def toggle_complete(
         )
     
     day_mission.completed = update_data.completed
+    refresh_daily_score(db, current_user.id, target_date)
+    bump_day_versions(db, current_user.id, [target_date])
     db.commit()
     db.refresh(day_mission)
     
     # CatalogMission 테이블이 없으므로 관계 로드 제거
     # 프론트엔드에서 하드코딩된 데이터를 사용하므로 mission_id와 sub_mission만 반환
-    return day_mission
+    return DayMissionResponse(
+        id=day_mission.id,
+        mission=CatalogMissionResponse(
+            id=day_mission.mission_id,
+            category="",
+            submissions=[],
+            name=day_mission.sub_mission or "",
+        ),
+        sub_mission=day_mission.sub_mission,
+        completed=day_mission.completed,
+        created_at=day_mission.created_at,
+    )
 
-def _prioritize_week_summary_route():
-    week_path = "/days/week-summary"
-    for index, route in enumerate(router.routes):
-        if getattr(route, "path", None) == week_path:
-            route_to_move = router.routes.pop(index)
-            router.routes.insert(0, route_to_move)
-            break
+def _prioritize_static_routes():
+    # /days/{date_str} 레거시 경로보다 먼저 매칭되어야 하는 고정 경로
+    static_paths = ["/days/range", "/days/week-summary"]
+    for static_path in static_paths:
+        for index, route in enumerate(router.routes):
+            if getattr(route, "path", None) == static_path:
+                route_to_move = router.routes.pop(index)
+                router.routes.insert(0, route_to_move)
+                break
 
 
-_prioritize_week_summary_route()
+_prioritize_static_routes()
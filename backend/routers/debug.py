@@ -17,7 +17,7 @@ async def debug_headers(request: Request, authorization: Optional[str] = Header(
     }
 
 @router.post("/init-catalog")
-async def init_catalog(db: Session = Depends(get_db)):
+def init_catalog(db: Session = Depends(get_db)):
     """미션 카탈로그 초기화"""
     data = [
         {"category": "일회용품 줄이기", "example": "텀블러 사용하기 / 장바구니 챙기기 / 일회용 젓가락 거절하기"},
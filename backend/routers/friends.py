@@ -1,17 +1,19 @@
 # 친구/초대 라우터
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import and_, func
 from database import get_db
 from models import User, Friend, Invite, GroupMission, GroupMember
 from schemas import FriendResponse, InviteResponse, InviteRequest
 from auth import get_current_user
+from scoring import rebuild_users_scores
+from group_counters import MAX_MEMBERS_PER_GROUP, reserve_member_slot
 from datetime import date, timedelta
 
 router = APIRouter(prefix="", tags=["친구/초대"])
 
 @router.get("/friends", response_model=list[FriendResponse])
-async def get_friends(
+def get_friends(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -53,7 +55,7 @@ async def get_friends(
     return result
 
 @router.post("/group-missions/{group_id}/invite")
-async def send_invite(
+def send_invite(
     group_id: int,
     invite_data: InviteRequest,
     current_user: User = Depends(get_current_user),
@@ -68,11 +70,8 @@ async def send_invite(
             detail="존재하지 않는 그룹입니다"
         )
     
-    # 그룹 인원 확인
-    member_count = db.query(GroupMember).filter(
-        GroupMember.group_mission_id == group_id
-    ).count()
-    if member_count + len(invite_data.friend_ids) > 3:
+    # 그룹 인원 확인 (그룹 행의 member_count 카운터)
+    if group.member_count + len(invite_data.friend_ids) > MAX_MEMBERS_PER_GROUP:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="그룹 인원이 가득 찼습니다"
@@ -103,23 +102,30 @@ async def send_invite(
     return {"message": "초대가 전송되었습니다", "invited_count": len(invite_data.friend_ids)}
 
 @router.get("/invites/received", response_model=list[InviteResponse])
-async def get_invites(
+def get_invites(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """받은 초대 목록"""
-    invites = db.query(Invite).filter(
+    invites = db.query(Invite).options(
+        selectinload(Invite.group_mission),
+        selectinload(Invite.from_user),
+    ).filter(
         and_(
             Invite.to_user_id == current_user.id,
             Invite.status == "pending"
         )
     ).all()
     
+    # 초대된 그룹들을 한 번에 직렬화 (초대마다 그룹 조회를 반복하지 않도록)
+    from routers.group_missions import group_missions_to_responses
+    groups = list({invite.group_mission_id: invite.group_mission for invite in invites}.values())
+    group_responses = {
+        response.id: response for response in group_missions_to_responses(groups, db)
+    }
+    
     result = []
     for invite in invites:
-        from routers.group_missions import group_mission_to_response
-        group_response = group_mission_to_response(invite.group_mission, db)
-        
         from_user_response = FriendResponse(
             id=invite.from_user.id,
             name=invite.from_user.name,
@@ -129,7 +135,7 @@ async def get_invites(
         
         result.append(InviteResponse(
             id=invite.id,
-            group_mission=group_response,
+            group_mission=group_responses[invite.group_mission_id],
             from_user=from_user_response,
             created_at=invite.created_at
         ))
@@ -137,7 +143,7 @@ async def get_invites(
     return result
 
 @router.post("/invites/{invite_id}/accept")
-async def accept_invite(
+def accept_invite(
     invite_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -157,11 +163,8 @@ async def accept_invite(
             detail="존재하지 않는 초대입니다"
         )
     
-    # 그룹 인원 확인
-    member_count = db.query(GroupMember).filter(
-        GroupMember.group_mission_id == invite.group_mission_id
-    ).count()
-    if member_count >= 3:
+    # 그룹 인원 확인: 빈자리가 있을 때만 member_count를 늘리는 조건부 UPDATE
+    if not reserve_member_slot(db, invite.group_mission_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="그룹 인원이 가득 찼습니다"
@@ -176,6 +179,16 @@ async def accept_invite(
     
     # 초대 상태 변경
     invite.status = "accepted"
+    db.flush()
+    
+    # 그룹 인원이 바뀌면 보너스 점수 여부가 달라지므로 그룹원 점수 재계산
+    member_ids = [
+        row[0]
+        for row in db.query(GroupMember.user_id).filter(
+            GroupMember.group_mission_id == invite.group_mission_id
+        ).all()
+    ]
+    rebuild_users_scores(db, member_ids)
     db.commit()
     
     from routers.group_missions import group_mission_to_response
@@ -189,7 +202,7 @@ async def accept_invite(
     }
 
 @router.delete("/invites/{invite_id}/decline")
-async def decline_invite(
+def decline_invite(
     invite_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
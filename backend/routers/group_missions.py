@@ -1,6 +1,6 @@
 # 그룹 미션 라우터
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import and_, func
 from database import get_db
 from models import GroupMission, GroupMember, GroupMissionCheck, User
@@ -8,120 +8,263 @@ from schemas import (
     GroupMissionResponse,
     GroupMissionCheckRequest,
     GroupMissionCreate,
+    GroupMissionSummaryResponse,
     GroupParticipantResponse,
 )
 from auth import get_current_user
-from datetime import date, datetime
-from typing import List, Optional
+from scoring import refresh_group_daily_scores, rebuild_users_scores
+from group_counters import (
+    MAX_MEMBERS_PER_GROUP,
+    adjust_completed_checks,
+    mark_group_directory_changed,
+    release_member_slot,
+    reserve_member_slot,
+)
+from group_recommendations import friend_ids_query, get_pool, rank_for_user
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Union
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/group-missions", tags=["그룹 미션"])
 
-# 상수: 규칙과 제한
-MAX_MEMBERS_PER_GROUP = 3
+# 상수: 규칙과 제한 (그룹 최대 인원 MAX_MEMBERS_PER_GROUP 은 group_counters.py)
 MAX_GROUPS_PER_USER = 2
+# /my 기간 조회 최대 일수
+MAX_CHECK_RANGE_DAYS = 31
+# 전체 그룹 목록 페이지 크기
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+# 추천 그룹 개수
+DEFAULT_RECOMMENDATION_LIMIT = 10
+MAX_RECOMMENDATION_LIMIT = 50
 
-def group_mission_to_response(group: GroupMission, db: Session, checked: Optional[bool] = None) -> GroupMissionResponse:
-    """GroupMission 모델을 응답 스키마로 변환"""
-    # 참여자 정보 목록
-    participants = [
-        GroupParticipantResponse(
-            id=member.user.id,
-            name=member.user.name,
-            profile_color=member.user.profile_color,
+def group_missions_to_responses(
+    groups: List[GroupMission],
+    db: Session,
+    checked: Optional[Dict[int, bool]] = None,
+    checked_dates: Optional[Dict[int, Dict[date, bool]]] = None,
+) -> List[GroupMissionResponse]:
+    """여러 GroupMission을 한 번에 응답 스키마로 변환
+
+    그룹마다 members/user를 지연 로딩하고 체크 수를 따로 세면 1 + G×(M+2)번 조회하게 된다.
+    그룹 수와 관계없이 멤버(+사용자 selectinload) 2번만 조회하고,
+    완료 체크 수는 그룹 행의 completed_check_count 카운터를 쓴다.
+    checked: 그룹 id → 날짜별 체크 상태 (없는 그룹은 None)
+    checked_dates: 그룹 id → {날짜: 체크 상태} (기간 조회용)
+    """
+    if not groups:
+        return []
+    group_ids = [group.id for group in groups]
+
+    # 참여자 정보 (그룹 id → 참여자 목록)
+    participants: Dict[int, List[GroupParticipantResponse]] = {group_id: [] for group_id in group_ids}
+    members = (
+        db.query(GroupMember)
+        .options(selectinload(GroupMember.user))
+        .filter(GroupMember.group_mission_id.in_(group_ids))
+        .order_by(GroupMember.id)
+        .all()
+    )
+    for member in members:
+        participants[member.group_mission_id].append(
+            GroupParticipantResponse(
+                id=member.user.id,
+                name=member.user.name,
+                profile_color=member.user.profile_color,
+            )
         )
-        for member in group.members
+
+    return [
+        GroupMissionResponse(
+            id=group.id,
+            name=group.name,
+            color=group.color,
+            participants=participants[group.id],
+            total_score=group.completed_check_count * 2,  # 그룹 미션은 2점
+            member_count=len(participants[group.id]),
+            checked=checked.get(group.id) if checked is not None else None,
+            checked_dates=checked_dates.get(group.id) if checked_dates is not None else None,
+            created_by=group.created_by,
+        )
+        for group in groups
     ]
-    
-    # 총 점수 계산 (간단한 예시, 실제로는 더 복잡한 로직 필요)
-    total_score = db.query(func.count(GroupMissionCheck.id)).filter(
-        GroupMissionCheck.group_mission_id == group.id,
-        GroupMissionCheck.completed == True
-    ).scalar() or 0
-    
-    return GroupMissionResponse(
-        id=group.id,
-        name=group.name,
-        color=group.color,
-        participants=participants,
-        total_score=total_score * 2,  # 그룹 미션은 2점
-        member_count=len(participants),
-        checked=checked,
-        created_by=group.created_by
-    )
+
+
+def group_mission_to_response(group: GroupMission, db: Session, checked: Optional[bool] = None) -> GroupMissionResponse:
+    """GroupMission 모델을 응답 스키마로 변환"""
+    return group_missions_to_responses(
+        [group], db, checked=None if checked is None else {group.id: checked}
+    )[0]
 
 @router.get("/my", response_model=List[GroupMissionResponse])
-async def get_my_groups(
+def get_my_groups(
     date: Optional[str] = Query(None, description="날짜 (YYYY-MM-DD 형식, 선택적)"),
+    start: Optional[date] = Query(None, description="기간 시작 날짜 (end와 함께 사용)"),
+    end: Optional[date] = Query(None, description="기간 종료 날짜 (포함)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """내가 참여 중인 그룹 미션 목록 (선택적 날짜별 체크 상태 포함)"""
-    memberships = db.query(GroupMember).filter(
-        GroupMember.user_id == current_user.id
-    ).all()
-    
-    groups = [membership.group_mission for membership in memberships]
-    
-    # 날짜가 제공된 경우 각 그룹의 체크 상태 포함
-    if date:
-        try:
-            target_date = datetime.strptime(date, "%Y-%m-%d").date()
-            result = []
-            for group in groups:
-                check = db.query(GroupMissionCheck).filter(
-                    and_(
-                        GroupMissionCheck.group_mission_id == group.id,
-                        GroupMissionCheck.user_id == current_user.id,
-                        GroupMissionCheck.date == target_date
-                    )
-                ).first()
-                checked_status = check.completed if check else False
-                result.append(group_mission_to_response(group, db, checked=checked_status))
-            return result
-        except ValueError:
-            # 날짜 형식이 잘못된 경우 체크 상태 없이 반환
-            pass
-    
-    # 날짜가 없거나 파싱 실패 시 체크 상태 없이 반환
-    return [group_mission_to_response(group, db) for group in groups]
+    """내가 참여 중인 그룹 미션 목록 (선택적 날짜별 체크 상태 포함)
+
+    - date: 그 날짜의 체크 상태를 checked로 포함
+    - start~end: 기간(최대 MAX_CHECK_RANGE_DAYS일)의 날짜별 체크 상태를 checked_dates로 포함
+    멤버십, 그룹, 내 체크 기록을 한 번의 JOIN 조회로 가져온다.
+    """
+    if (start is None) != (end is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start와 end를 함께 지정해야 합니다"
+        )
+    if start is not None:
+        if end < start:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="종료 날짜가 시작 날짜보다 빠릅니다"
+            )
+        if (end - start).days + 1 > MAX_CHECK_RANGE_DAYS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"조회 기간은 최대 {MAX_CHECK_RANGE_DAYS}일입니다"
+            )
+        range_start, range_end = start, end
+    else:
+        range_start = range_end = None
+        if date:
+            try:
+                range_start = range_end = datetime.strptime(date, "%Y-%m-%d").date()
+            except ValueError:
+                # 날짜 형식이 잘못된 경우 체크 상태 없이 반환
+                pass
 
+    query = db.query(GroupMission).join(
+        GroupMember,
+        and_(
+            GroupMember.group_mission_id == GroupMission.id,
+            GroupMember.user_id == current_user.id,
+        ),
+    )
+    if range_start is None:
+        groups = query.order_by(GroupMember.id).all()
+        return group_missions_to_responses(groups, db)
 
-@router.get("/", response_model=List[GroupMissionResponse])
-async def get_all_groups(
+    # 그룹마다 기간 내 내 체크 기록을 LEFT JOIN (체크가 없으면 NULL 한 줄)
+    rows = query.outerjoin(
+        GroupMissionCheck,
+        and_(
+            GroupMissionCheck.group_mission_id == GroupMission.id,
+            GroupMissionCheck.user_id == current_user.id,
+            GroupMissionCheck.date >= range_start,
+            GroupMissionCheck.date <= range_end,
+        ),
+    ).add_columns(
+        GroupMissionCheck.date, GroupMissionCheck.completed
+    ).order_by(GroupMember.id).all()
+
+    groups: Dict[int, GroupMission] = {}
+    days = [range_start + timedelta(days=i) for i in range((range_end - range_start).days + 1)]
+    checked_dates: Dict[int, Dict] = {}
+    for group, check_date, completed in rows:
+        if group.id not in groups:
+            groups[group.id] = group
+            checked_dates[group.id] = {day: False for day in days}
+        if check_date is not None:
+            checked_dates[group.id][check_date] = bool(completed)
+
+    if start is not None:
+        return group_missions_to_responses(list(groups.values()), db, checked_dates=checked_dates)
+    return group_missions_to_responses(
+        list(groups.values()),
+        db,
+        checked={group_id: states[range_start] for group_id, states in checked_dates.items()},
+    )
+
+
+@router.get("/", response_model=List[Union[GroupMissionResponse, GroupMissionSummaryResponse]])
+def get_all_groups(
+    response: Response,
+    cursor: Optional[int] = Query(None, ge=1, description="이전 페이지 응답의 X-Next-Cursor 값"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    has_free_slots: bool = Query(False, description="빈자리가 있는 그룹만"),
+    friends_only: bool = Query(False, description="친구가 만든 그룹만"),
+    lean: bool = Query(False, description="참여자 목록 없이 요약만"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """전체 그룹 목록 조회 (개발/프론트에서 목록을 동적으로 가져오도록 사용)"""
-    groups = db.query(GroupMission).all()
-    return [group_mission_to_response(group, db) for group in groups]
+    """전체 그룹 목록 조회 (최신순 커서 페이지네이션)
+
+    id 내림차순(생성 순서의 역순)으로 limit개씩 내려주고, 다음 페이지가 있으면
+    마지막 그룹 id를 X-Next-Cursor 헤더로 준다. 다음 요청에 cursor로 넘기면
+    "id < cursor" 조건으로 PK 인덱스를 타므로 페이지 위치와 관계없이 비용이 일정하다.
+    """
+    query = db.query(GroupMission)
+    if cursor is not None:
+        query = query.filter(GroupMission.id < cursor)
+    if has_free_slots:
+        query = query.filter(GroupMission.member_count < MAX_MEMBERS_PER_GROUP)
+    if friends_only:
+        query = query.filter(GroupMission.created_by.in_(friend_ids_query(db, current_user.id)))
+
+    # 다음 페이지 존재 여부를 알기 위해 하나 더 조회
+    groups = query.order_by(GroupMission.id.desc()).limit(limit + 1).all()
+    if len(groups) > limit:
+        groups = groups[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = str(groups[-1].id)
+
+    if lean:
+        return [
+            GroupMissionSummaryResponse(
+                id=group.id,
+                name=group.name,
+                color=group.color,
+                total_score=group.completed_check_count * 2,  # 그룹 미션은 2점
+                member_count=group.member_count,
+                created_by=group.created_by,
+            )
+            for group in groups
+        ]
+    return group_missions_to_responses(groups, db)
 
 @router.get("/recommended", response_model=List[GroupMissionResponse])
-async def get_recommended(
+def get_recommended(
+    limit: int = Query(DEFAULT_RECOMMENDATION_LIMIT, ge=1, le=MAX_RECOMMENDATION_LIMIT),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """추천 그룹 미션 목록"""
-    # 내가 참여하지 않은 그룹 중 인원이 3명 미만인 그룹
-    my_group_ids = db.query(GroupMember.group_mission_id).filter(
-        GroupMember.user_id == current_user.id
-    ).subquery()
-    
-    groups = db.query(GroupMission).filter(
-        ~GroupMission.id.in_(my_group_ids)
-    ).all()
-    
-    # 인원이 3명 미만인 그룹만 필터링
-    recommended = []
-    for group in groups:
-        member_count = len(group.members)
-        if member_count < 3:
-            recommended.append(group_mission_to_response(group, db))
-    
-    return recommended
+    """추천 그룹 미션 목록
+
+    내가 참여하지 않았고 빈자리가 있는 그룹을 친구 참여, 최근 활동, 빈자리 순으로 추천한다.
+    후보 정렬은 미리 만들어 둔 풀(group_recommendations.py)을 쓰므로 전체 그룹 수와 무관하다.
+    """
+    pool = get_pool(db)
+    my_group_ids = {
+        row[0]
+        for row in db.query(GroupMember.group_mission_id).filter(
+            GroupMember.user_id == current_user.id
+        ).all()
+    }
+    friend_ids = [row[0] for row in friend_ids_query(db, current_user.id).all()]
+    group_ids = rank_for_user(pool, current_user.id, friend_ids, my_group_ids, limit)
+    if not group_ids:
+        return []
+
+    groups_by_id = {
+        group.id: group
+        for group in db.query(GroupMission).filter(GroupMission.id.in_(group_ids)).all()
+    }
+    groups = [groups_by_id[group_id] for group_id in group_ids if group_id in groups_by_id]
+    # 풀을 만든 뒤 가득 찬 그룹은 제외
+    return [
+        response
+        for response in group_missions_to_responses(groups, db)
+        if response.member_count < MAX_MEMBERS_PER_GROUP
+    ]
 
 
 @router.post("/", response_model=GroupMissionResponse)
-async def create_group(
+def create_group(
     group_in: GroupMissionCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -133,12 +276,13 @@ async def create_group(
         created_by=current_user.id,
     )
     db.add(group)
+    mark_group_directory_changed(db)
     db.commit()
     db.refresh(group)
     return group_mission_to_response(group, db)
 
 @router.get("/{group_id}", response_model=GroupMissionResponse)
-async def get_group_detail(
+def get_group_detail(
     group_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -154,18 +298,21 @@ async def get_group_detail(
     return group_mission_to_response(group, db)
 
 @router.post("/{group_id}/join", response_model=GroupMissionResponse)
-async def join_group(
+def join_group(
     group_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """그룹 미션 참여"""
-    print("[DEBUG] join_group called", "group_id=", group_id, "user_id=", current_user.id)
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logger.debug("그룹 참여 요청", extra={"group_id": group_id, "user_id": current_user.id})
 
     # 1) 그룹 존재 확인
     group = db.query(GroupMission).filter(GroupMission.id == group_id).first()
     if group is None:
-        print("[DEBUG] group not found:", group_id)
+        if debug_enabled:
+            logger.debug("그룹 참여 실패: 그룹 없음", extra={"group_id": group_id})
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="그룹을 찾을 수 없습니다.",
@@ -179,7 +326,11 @@ async def join_group(
         )
     ).first()
     if existing:
-        print("[DEBUG] already joined:", "user_id=", current_user.id, "group_id=", group_id)
+        if debug_enabled:
+            logger.debug(
+                "그룹 참여 실패: 이미 참여 중",
+                extra={"group_id": group_id, "user_id": current_user.id},
+            )
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="이미 이 그룹에 참여 중입니다.",
@@ -189,20 +340,21 @@ async def join_group(
         GroupMember.user_id == current_user.id
     ).count()
     if user_group_count >= MAX_GROUPS_PER_USER:
-        print("[DEBUG] user reached max groups:", current_user.id, user_group_count)
+        if debug_enabled:
+            logger.debug(
+                "그룹 참여 실패: 참여 그룹 수 초과",
+                extra={"user_id": current_user.id, "group_count": user_group_count},
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"사용자는 최대 {MAX_GROUPS_PER_USER}개의 그룹에만 참여할 수 있습니다"
         )
     
-    # 인원 확인 (최대 3명)
-    member_count = db.query(GroupMember).filter(
-        GroupMember.group_mission_id == group_id
-    ).count()
-    if member_count >= 3:
+    # 인원 확인 (최대 3명): 빈자리가 있을 때만 member_count를 늘리는 조건부 UPDATE
+    if not reserve_member_slot(db, group_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="그룹 미션은 최대 3명까지 참여할 수 있습니다"
+            detail=f"그룹 미션은 최대 {MAX_MEMBERS_PER_GROUP}명까지 참여할 수 있습니다"
         )
     
     # 5) 실제 참여 추가
@@ -211,15 +363,21 @@ async def join_group(
         user_id=current_user.id
     )
     db.add(membership)
+    db.flush()
+    # 그룹 인원이 바뀌면 보너스 점수 여부가 달라지므로 그룹원 점수 재계산
+    rebuild_users_scores(db, [m.user_id for m in group.members] + [current_user.id])
     db.commit()
     db.refresh(membership)
 
-    print("[DEBUG] join success: membership_id=", membership.id)
+    logger.info(
+        "그룹 참여",
+        extra={"group_id": group_id, "user_id": current_user.id, "membership_id": membership.id},
+    )
 
     return group_mission_to_response(group, db)
 
 @router.delete("/{group_id}/leave")
-async def leave_group(
+def leave_group(
     group_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -238,12 +396,21 @@ async def leave_group(
             detail="참여하지 않은 그룹입니다"
         )
     
+    remaining_ids = [
+        row[0]
+        for row in db.query(GroupMember.user_id).filter(
+            GroupMember.group_mission_id == group_id
+        ).all()
+    ]
     db.delete(member)
+    release_member_slot(db, group_id)
+    # 탈퇴한 사용자와 남은 그룹원의 점수 재계산
+    rebuild_users_scores(db, remaining_ids)
     db.commit()
     return {"message": "그룹에서 나갔습니다"}
 
 @router.post("/{group_id}/check")
-async def check_group_mission(
+def check_group_mission(
     group_id: int,
     check_data: GroupMissionCheckRequest,
     current_user: User = Depends(get_current_user),
@@ -273,8 +440,10 @@ async def check_group_mission(
     ).first()
     
     if check:
+        completed_delta = int(bool(check_data.completed)) - int(bool(check.completed))
         check.completed = check_data.completed
     else:
+        completed_delta = int(bool(check_data.completed))
         check = GroupMissionCheck(
             group_mission_id=group_id,
             user_id=current_user.id,
@@ -282,12 +451,14 @@ async def check_group_mission(
             completed=check_data.completed
         )
         db.add(check)
+    adjust_completed_checks(db, group_id, completed_delta)
     
+    refresh_group_daily_scores(db, group_id, check_data.date)
     db.commit()
     return {"message": "완료 상태가 업데이트되었습니다"}
 
 @router.delete("/{group_id}")
-async def delete_group(
+def delete_group(
     group_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -308,6 +479,14 @@ async def delete_group(
             detail="그룹을 만든 사람만 삭제할 수 있습니다"
         )
     
+    # 그룹 삭제 후 점수를 다시 계산할 그룹원 목록
+    former_member_ids = [
+        row[0]
+        for row in db.query(GroupMember.user_id).filter(
+            GroupMember.group_mission_id == group_id
+        ).all()
+    ]
+    
     # 관련 데이터 먼저 삭제 (cascade가 있지만 명시적으로 삭제하여 안전하게 처리)
     # 1. 그룹 미션 체크 삭제
     check_count = db.query(GroupMissionCheck).filter(
@@ -342,6 +521,10 @@ async def delete_group(
     
     # 4. 그룹 삭제
     db.delete(group)
+    mark_group_directory_changed(db)
+    
+    # 5. 그룹 점수가 빠지므로 기존 그룹원 점수 재계산
+    rebuild_users_scores(db, former_member_ids)
     db.commit()
     
     return {"message": "그룹이 삭제되었습니다"}
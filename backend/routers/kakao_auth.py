@@ -4,18 +4,56 @@ from sqlalchemy.orm import Session
 from database import get_db
 from models import User
 from schemas import TokenResponse, KakaoCallbackRequest
-from auth import create_access_token, create_refresh_token, ACCESS_TOKEN_EXPIRE_MINUTES
-from datetime import timedelta
+from starlette.concurrency import run_in_threadpool
+from refresh_tokens import issue_new_family
+from http_client import get_http_client, request_with_retry
 import httpx
+import logging
 import os
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/auth/kakao", tags=["카카오 로그인"])
 
 KAKAO_CLIENT_ID = os.getenv("KAKAO_CLIENT_ID", "")
 KAKAO_REDIRECT_URI = os.getenv("KAKAO_REDIRECT_URI", "http://localhost:5173/auth/kakao/callback")
+# 부하 테스트 시 scripts/fake_kakao_server.py 주소로 바꿔서 사용
+KAKAO_AUTH_BASE_URL = os.getenv("KAKAO_AUTH_BASE_URL", "https://kauth.kakao.com").rstrip("/")
+KAKAO_API_BASE_URL = os.getenv("KAKAO_API_BASE_URL", "https://kapi.kakao.com").rstrip("/")
+
+def _login_kakao_user(db: Session, kakao_id: str, email: str, name: str):
+    """카카오 사용자 조회/생성 후 토큰 발급 (스레드풀에서 실행되는 동기 DB 작업)"""
+    # 기존 사용자 확인 또는 신규 생성
+    user = db.query(User).filter(User.kakao_id == kakao_id).first()
+    
+    if not user:
+        # 이메일로도 확인 (이메일 계정과 카카오 계정 연동)
+        user = db.query(User).filter(User.email == email).first()
+        if user:
+            # 기존 이메일 계정에 카카오 ID 연동
+            user.kakao_id = kakao_id
+        else:
+            # 신규 사용자 생성
+            user = User(
+                email=email,
+                name=name,
+                kakao_id=kakao_id,
+                password_hash=None,  # 소셜 로그인 사용자는 비밀번호 없음
+                bio="카카오로 가입한 친환경 실천가!",
+            )
+            db.add(user)
+        db.commit()
+        db.refresh(user)
+    
+    access_token_jwt, refresh_token_jwt = issue_new_family(db, user.id)
+    return user.id, access_token_jwt, refresh_token_jwt
 
 @router.post("/callback", response_model=TokenResponse)
-async def kakao_callback(request: KakaoCallbackRequest, db: Session = Depends(get_db)):
+async def kakao_callback(
+    request: KakaoCallbackRequest,
+    db: Session = Depends(get_db),
+    client: httpx.AsyncClient = Depends(get_http_client),
+):
     """
     카카오 OAuth 콜백 처리
     프론트엔드에서 인가 코드를 받아서 이 엔드포인트로 전달
@@ -28,7 +66,7 @@ async def kakao_callback(request: KakaoCallbackRequest, db: Session = Depends(ge
         )
     
     # 1. 카카오 토큰 받기
-    token_url = "https://kauth.kakao.com/oauth/token"
+    token_url = f"{KAKAO_AUTH_BASE_URL}/oauth/token"
     token_data = {
         "grant_type": "authorization_code",
         "client_id": KAKAO_CLIENT_ID,
@@ -36,84 +74,73 @@ async def kakao_callback(request: KakaoCallbackRequest, db: Session = Depends(ge
         "code": code,
     }
     
-    async with httpx.AsyncClient() as client:
-        try:
-            token_response = await client.post(token_url, data=token_data)
-            token_response.raise_for_status()
-            token_json = token_response.json()
-            access_token = token_json.get("access_token")
-            
-            if not access_token:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="카카오 액세스 토큰을 받지 못했습니다"
-                )
-            
-            # 2. 카카오 사용자 정보 받기
-            user_info_url = "https://kapi.kakao.com/v2/user/me"
-            headers = {"Authorization": f"Bearer {access_token}"}
-            
-            user_info_response = await client.get(user_info_url, headers=headers)
-            user_info_response.raise_for_status()
-            user_info = user_info_response.json()
-            
-            kakao_id = str(user_info.get("id"))
-            kakao_account = user_info.get("kakao_account", {})
-            profile = kakao_account.get("profile", {})
-            
-            email = kakao_account.get("email", f"kakao_{kakao_id}@temp.com")
-            name = profile.get("nickname", "카카오 사용자")
-            
-            # 3. 기존 사용자 확인 또는 신규 생성
-            user = db.query(User).filter(User.kakao_id == kakao_id).first()
-            
-            if not user:
-                # 이메일로도 확인 (이메일 계정과 카카오 계정 연동)
-                user = db.query(User).filter(User.email == email).first()
-                if user:
-                    # 기존 이메일 계정에 카카오 ID 연동
-                    user.kakao_id = kakao_id
-                else:
-                    # 신규 사용자 생성
-                    user = User(
-                        email=email,
-                        name=name,
-                        kakao_id=kakao_id,
-                        password_hash=None,  # 소셜 로그인 사용자는 비밀번호 없음
-                        bio="카카오로 가입한 친환경 실천가!",
-                    )
-                    db.add(user)
-                db.commit()
-                db.refresh(user)
-            
-            # 4. JWT 토큰 생성
-            access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-            access_token_jwt = create_access_token(
-                data={"sub": str(user.id)}, expires_delta=access_token_expires
-            )
-            refresh_token_jwt = create_refresh_token(data={"sub": str(user.id)})
-            
-            print(f"[DEBUG] 카카오 로그인 성공: user_id={user.id}, kakao_id={kakao_id}")
-            
-            return TokenResponse(access=access_token_jwt, refresh=refresh_token_jwt)
-            
-        except httpx.HTTPStatusError as e:
-            error_detail = "Unknown error"
-            try:
-                error_detail = e.response.json()
-            except:
-                error_detail = e.response.text
-            print(f"[ERROR] 카카오 API 오류: {e}")
-            print(f"[ERROR] 카카오 응답: {error_detail}")
-            print(f"[DEBUG] 요청 파라미터: client_id={KAKAO_CLIENT_ID[:10]}..., redirect_uri={KAKAO_REDIRECT_URI}")
+    # 앱 공유 클라이언트 사용 (커넥션 재사용, 타임아웃/재시도 설정 적용)
+    try:
+        token_response = await request_with_retry(client, "POST", token_url, data=token_data)
+        token_response.raise_for_status()
+        token_json = token_response.json()
+        access_token = token_json.get("access_token")
+        
+        if not access_token:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"카카오 로그인 실패: {error_detail}"
+                detail="카카오 액세스 토큰을 받지 못했습니다"
             )
-        except Exception as e:
-            print(f"[ERROR] 카카오 로그인 처리 중 오류: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"카카오 로그인 처리 중 오류가 발생했습니다: {str(e)}"
-            )
-
+        
+        # 2. 카카오 사용자 정보 받기
+        user_info_url = f"{KAKAO_API_BASE_URL}/v2/user/me"
+        headers = {"Authorization": f"Bearer {access_token}"}
+        
+        user_info_response = await request_with_retry(client, "GET", user_info_url, headers=headers)
+        user_info_response.raise_for_status()
+        user_info = user_info_response.json()
+        
+        kakao_id = str(user_info.get("id"))
+        kakao_account = user_info.get("kakao_account", {})
+        profile = kakao_account.get("profile", {})
+        
+        email = kakao_account.get("email", f"kakao_{kakao_id}@temp.com")
+        name = profile.get("nickname", "카카오 사용자")
+        
+        # 3. 사용자 조회/생성 + 4. JWT 토큰 생성 (동기 DB 작업은 스레드풀에서)
+        user_id, access_token_jwt, refresh_token_jwt = await run_in_threadpool(
+            _login_kakao_user, db, kakao_id, email, name
+        )
+        
+        logger.info("카카오 로그인 성공", extra={"user_id": user_id, "kakao_id": kakao_id})
+        
+        return TokenResponse(access=access_token_jwt, refresh=refresh_token_jwt)
+        
+    except HTTPException:
+        raise
+    except httpx.HTTPStatusError as e:
+        error_detail = "Unknown error"
+        try:
+            error_detail = e.response.json()
+        except ValueError:
+            error_detail = e.response.text
+        logger.warning(
+            "카카오 API 오류",
+            extra={
+                "status_code": e.response.status_code,
+                "url": str(e.request.url),
+                "kakao_response": error_detail,
+                "redirect_uri": KAKAO_REDIRECT_URI,
+            },
+        )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"카카오 로그인 실패: {error_detail}"
+        )
+    except httpx.TransportError as e:
+        logger.warning("카카오 서버 연결 실패", extra={"error": repr(e)})
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="카카오 서버에 연결할 수 없습니다. 잠시 후 다시 시도해주세요"
+        )
+    except Exception as e:
+        logger.exception("카카오 로그인 처리 중 오류")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"카카오 로그인 처리 중 오류가 발생했습니다: {str(e)}"
+        )
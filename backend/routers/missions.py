@@ -9,7 +9,7 @@ from auth import get_current_user
 router = APIRouter(prefix="/missions", tags=["미션"])
 
 @router.get("/catalog", response_model=list[CatalogMissionResponse])
-async def get_catalog(
+def get_catalog(
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
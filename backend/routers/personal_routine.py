@@ -6,6 +6,7 @@ from database import get_db
 from models import WeeklyPersonalRoutine, User
 from schemas import WeeklyPersonalRoutineResponse, WeeklyPersonalRoutineCreate
 from auth import get_current_user
+from day_versions import bump_day_versions
 from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
 
@@ -26,8 +27,14 @@ def get_sunday_of_week(target_date: date) -> date:
     sunday = target_date + timedelta(days=days_until_sunday)
     return sunday
 
+def get_routine_dates(routine: WeeklyPersonalRoutine) -> list[date]:
+    """루틴이 표시되는 날짜 목록 (start_date부터 그 주 일요일까지)"""
+    start_date = routine.start_date or routine.week_start_date
+    sunday = get_sunday_of_week(routine.week_start_date)
+    return [start_date + timedelta(days=i) for i in range((sunday - start_date).days + 1)]
+
 @router.post("", response_model=WeeklyPersonalRoutineResponse)
-async def add_weekly_routine(
+def add_weekly_routine(
     routine_data: WeeklyPersonalRoutineCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -77,13 +84,14 @@ async def add_weekly_routine(
         start_date=start_date
     )
     db.add(routine)
+    bump_day_versions(db, current_user.id, get_routine_dates(routine))
     db.commit()
     db.refresh(routine)
     
     return routine
 
 @router.get("", response_model=list[WeeklyPersonalRoutineResponse])
-async def get_week_routines(
+def get_week_routines(
     week_start_date: date = Query(None, description="해당 주의 월요일 날짜 (없으면 오늘이 속한 주)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -104,7 +112,7 @@ async def get_week_routines(
     return routines
 
 @router.get("/week/{date_str}", response_model=list[WeeklyPersonalRoutineResponse])
-async def get_week_routines_by_date(
+def get_week_routines_by_date(
     date_str: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -131,7 +139,7 @@ async def get_week_routines_by_date(
     return routines
 
 @router.delete("/{routine_id}")
-async def delete_weekly_routine(
+def delete_weekly_routine(
     routine_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -151,5 +159,6 @@ async def delete_weekly_routine(
         )
     
     db.delete(routine)
+    bump_day_versions(db, current_user.id, get_routine_dates(routine))
     db.commit()
     return {"message": "주간 루틴이 삭제되었습니다"}
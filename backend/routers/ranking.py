@@ -1,176 +1,129 @@
 # 랭킹 라우터
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
 from database import get_db
-from models import User, DayMission, GroupMissionCheck, GroupMember, GroupMission
+from models import User, GroupMember, UserStreak
 from schemas import RankingUserResponse, MyRankResponse
 from auth import get_current_user
-from datetime import date, timedelta
+from scoring import (
+    current_streak_expression,
+    personal_leaderboard_page,
+    personal_rank_of,
+    user_total_score,
+)
+from ranking_snapshot import RANKING_SOURCE_HEADER, SNAPSHOT_AGE_HEADER, RankingSnapshot, get_snapshot
 from typing import List
 
 router = APIRouter(prefix="/ranking", tags=["랭킹"])
 
 def calculate_user_score(user_id: int, db: Session) -> int:
-    """사용자 총점 계산"""
-    # 개인 미션 점수 (하루 최대 3점)
-    personal_score = 0
-    day_missions = db.query(DayMission).filter(
-        and_(
-            DayMission.user_id == user_id,
-            DayMission.completed == True
-        )
-    ).all()
-    
-    # 날짜별로 그룹화하여 하루 최대 3점 계산
-    from collections import defaultdict
-    missions_by_date = defaultdict(list)
-    for mission in day_missions:
-        missions_by_date[mission.date].append(mission)
-    
-    for date_missions in missions_by_date.values():
-        personal_score += min(len(date_missions), 3)
-    
-    # 그룹 미션 점수 (하루 최대 2점 또는 보너스 4점)
-    group_score = 0
-    user_groups = db.query(GroupMember).filter(
-        GroupMember.user_id == user_id
-    ).all()
-    
-    checks_by_date = defaultdict(lambda: defaultdict(list))
-    for group_member in user_groups:
-        checks = db.query(GroupMissionCheck).filter(
-            and_(
-                GroupMissionCheck.group_mission_id == group_member.group_mission_id,
-                GroupMissionCheck.completed == True
-            )
-        ).all()
-        for check in checks:
-            checks_by_date[check.date][group_member.group_mission_id].append(check.user_id)
-    
-    for date_checks in checks_by_date.values():
-        for group_id, completed_users in date_checks.items():
-            if user_id in completed_users:
-                # 그룹원 수 확인
-                group = db.query(GroupMember).filter(
-                    GroupMember.group_mission_id == group_id
-                ).all()
-                if len(group) == 3 and len(completed_users) == 3:
-                    group_score = max(group_score, 4)  # 보너스 4점
-                else:
-                    group_score = max(group_score, 2)  # 기본 2점
-    
-    return personal_score + group_score
+    """사용자 총점 조회 (점수 원장 집계)"""
+    return user_total_score(db, user_id)
 
 def calculate_streak(user_id: int, db: Session) -> int:
-    """연속 달성일 계산"""
-    completed_dates = db.query(func.distinct(DayMission.date)).filter(
-        and_(
-            DayMission.user_id == user_id,
-            DayMission.completed == True
-        )
-    ).order_by(DayMission.date.desc()).all()
-    
-    if not completed_dates:
-        return 0
-    
-    completed_dates_set = {d[0] for d in completed_dates}
-    today = date.today()
-    streak = 0
-    
-    while True:
-        check_date = today - timedelta(days=streak)
-        if check_date in completed_dates_set:
-            streak += 1
-        else:
-            break
-    
-    return streak
+    """연속 달성일 조회 (KST 기준 오늘까지 이어진 기록)"""
+    streak = db.query(current_streak_expression()).select_from(UserStreak).filter(
+        UserStreak.user_id == user_id
+    ).scalar()
+    return streak or 0
+
+def _set_snapshot_age(response: Response, snapshot: RankingSnapshot) -> None:
+    response.headers[SNAPSHOT_AGE_HEADER] = f"{snapshot.age():.1f}"
+    response.headers[RANKING_SOURCE_HEADER] = "snapshot"
+
+def _set_live(response: Response) -> None:
+    # DB에서 방금 읽은 페이지: 나이 0, 출처 live
+    response.headers[SNAPSHOT_AGE_HEADER] = "0.0"
+    response.headers[RANKING_SOURCE_HEADER] = "live"
 
 @router.get("/personal", response_model=List[RankingUserResponse])
-async def get_personal_ranking(
+def get_personal_ranking(
+    response: Response,
+    limit: int = Query(100, ge=1, le=500, description="한 번에 조회할 사용자 수"),
+    offset: int = Query(0, ge=0, description="건너뛸 사용자 수"),
+    around_me: bool = Query(False, description="내 순위가 가운데 오도록 조회"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """개인 랭킹 조회"""
-    users = db.query(User).all()
-    
-    rankings = []
-    for user in users:
-        score = calculate_user_score(user.id, db)
-        streak = calculate_streak(user.id, db)
-        
-        rankings.append(RankingUserResponse(
-            id=user.id,
-            name=user.name,
-            score=score,
-            streak=streak,
-            profile_color=user.profile_color
-        ))
-    
-    # 점수 순으로 정렬
-    rankings.sort(key=lambda x: x.score, reverse=True)
-    return rankings
+    """개인 랭킹 조회 (점수 순, 페이지 단위)
+
+    스냅샷(상위 N명) 안의 페이지는 스냅샷에서, 범위를 벗어난 페이지는 DB에서 바로 읽는다
+    (X-Ranking-Source: snapshot/live). 스냅샷이 만들어진 뒤 점수가 바뀌었다면 두 출처의
+    순위가 다를 수 있으므로, 스냅샷 경계를 넘어 페이지를 넘기면 사용자가 빠지거나 겹칠 수 있다.
+    """
+    snapshot = get_snapshot(db)
+    
+    # 스냅샷(상위 N명) 범위 안의 요청은 DB 조회 없이 응답
+    if around_me:
+        position = snapshot.personal_position_by_user.get(current_user.id)
+        if position is not None:
+            offset = max(position - limit // 2, 0)
+            around_me = False
+    if not around_me and (snapshot.is_complete or offset + limit <= len(snapshot.personal)):
+        _set_snapshot_age(response, snapshot)
+        return list(snapshot.personal[offset:offset + limit])
+    
+    # 스냅샷 밖 구간은 DB에서 해당 페이지만 조회
+    rows = personal_leaderboard_page(
+        db,
+        limit=limit,
+        offset=offset,
+        around_user_id=current_user.id if around_me else None,
+    )
+    _set_live(response)
+    return [
+        RankingUserResponse(
+            id=row.id,
+            name=row.name,
+            score=row.score,
+            streak=row.streak,
+            profile_color=row.profile_color,
+            rank=row.rank
+        )
+        for row in rows
+    ]
 
 @router.get("/group", response_model=List[dict])
-async def get_group_ranking(
+def get_group_ranking(
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """그룹 랭킹 조회"""
-    groups = db.query(GroupMission).all()
-    
-    rankings = []
-    for group in groups:
-        # 그룹 총점 계산
-        total_score = 0
-        for member in group.members:
-            total_score += calculate_user_score(member.user_id, db)
-        
-        rankings.append({
-            "id": group.id,
-            "name": group.name,
-            "total_score": total_score,
-            "member_count": len(group.members),
-            "color": group.color
-        })
-    
-    # 총점 순으로 정렬
-    rankings.sort(key=lambda x: x["total_score"], reverse=True)
-    return rankings
+    """그룹 랭킹 조회 (스냅샷)"""
+    snapshot = get_snapshot(db)
+    _set_snapshot_age(response, snapshot)
+    return [dict(group) for group in snapshot.group]
 
 @router.get("/my", response_model=MyRankResponse)
-async def get_my_rank(
+def get_my_rank(
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """내 순위 조회"""
-    # 개인 랭킹에서 내 순위 찾기
-    all_rankings = await get_personal_ranking(current_user, db)
-    personal_rank = next(
-        (i + 1 for i, user in enumerate(all_rankings) if user.id == current_user.id),
-        0
-    )
-    
-    # 그룹별 순위
-    group_ranks = []
-    user_groups = db.query(GroupMember).filter(
-        GroupMember.user_id == current_user.id
-    ).all()
-    
-    for group_member in user_groups:
-        group_ranking = await get_group_ranking(current_user, db)
-        group_rank = next(
-            (i + 1 for i, g in enumerate(group_ranking) if g["id"] == group_member.group_mission_id),
-            0
-        )
-        group_ranks.append({
-            "group_id": group_member.group_mission_id,
-            "rank": group_rank
-        })
+    snapshot = get_snapshot(db)
+    _set_snapshot_age(response, snapshot)
+    
+    # 개인 순위: 스냅샷(상위 N명)에 있으면 그대로, 없으면 나보다 점수가 높은 사용자 수로 계산
+    position = snapshot.personal_position_by_user.get(current_user.id)
+    if position is not None:
+        personal_rank = snapshot.personal[position].rank
+    else:
+        personal_rank = personal_rank_of(db, current_user.id)
+    
+    # 그룹별 순위: 스냅샷의 그룹 순위표에서 내 그룹만 조회
+    my_group_ids = [
+        row[0]
+        for row in db.query(GroupMember.group_mission_id).filter(
+            GroupMember.user_id == current_user.id
+        ).order_by(GroupMember.id).all()
+    ]
+    group_ranks = [
+        {"group_id": group_id, "rank": snapshot.group_rank_by_id.get(group_id, 0)}
+        for group_id in my_group_ids
+    ]
     
     return MyRankResponse(
         personal_rank=personal_rank,
         group_ranks=group_ranks
     )
-
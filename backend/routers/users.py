@@ -5,7 +5,7 @@ from sqlalchemy import func, and_
 from database import get_db
 from models import User, DayMission
 from schemas import UserResponse, UserUpdate, FriendResponse
-from auth import get_current_user
+from auth import get_current_user, invalidate_cached_user
 from datetime import date, timedelta
 
 router = APIRouter(prefix="/users", tags=["사용자"])
@@ -16,26 +16,32 @@ async def get_me(current_user: User = Depends(get_current_user)):
     return current_user
 
 @router.put("/me", response_model=UserResponse)
-async def update_profile(
+def update_profile(
     user_update: UserUpdate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """사용자 프로필 업데이트"""
+    # current_user는 캐시된 읽기 전용 객체이므로 수정할 사용자는 다시 조회
+    user = db.query(User).filter(User.id == current_user.id).first()
+    if user is None:
+        raise HTTPException(status_code=404, detail="존재하지 않는 사용자입니다")
+    
     if user_update.name is not None:
-        current_user.name = user_update.name
+        user.name = user_update.name
     if user_update.profile_color is not None:
-        current_user.profile_color = user_update.profile_color
+        user.profile_color = user_update.profile_color
     if user_update.bio is not None:
-        current_user.bio = user_update.bio
+        user.bio = user_update.bio
     
     db.commit()
-    db.refresh(current_user)
-    return current_user
+    db.refresh(user)
+    invalidate_cached_user(user.id)
+    return user
 
 
 @router.get("/random", response_model=list[FriendResponse])
-async def get_random_users(
+def get_random_users(
     limit: int = Query(3, ge=1, le=10),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
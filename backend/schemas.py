@@ -1,6 +1,6 @@
 # Pydantic 스키마 (요청/응답 모델)
 from pydantic import BaseModel, EmailStr
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import date, datetime
 
 # ===== 인증 =====
@@ -104,11 +104,22 @@ class GroupMissionResponse(GroupMissionBase):
     total_score: Optional[int] = 0
     member_count: int
     checked: Optional[bool] = None  # 날짜별 체크 상태 (선택적)
+    checked_dates: Optional[Dict[date, bool]] = None  # 기간 조회 시 날짜 → 체크 상태
     created_by: Optional[int] = None  # 그룹을 만든 사용자 ID
     
     class Config:
         from_attributes = True
 
+class GroupMissionSummaryResponse(GroupMissionBase):
+    """참여자 목록 없는 그룹 요약 (목록 lean 모드)"""
+    id: int
+    total_score: Optional[int] = 0
+    member_count: int
+    created_by: Optional[int] = None
+
+    class Config:
+        from_attributes = True
+
 class GroupMissionCheckRequest(BaseModel):
     date: date
     completed: bool
@@ -150,6 +161,7 @@ class RankingUserResponse(BaseModel):
     score: int
     streak: int
     profile_color: str
+    rank: Optional[int] = None  # 동점자는 같은 순위
     
     class Config:
         from_attributes = True
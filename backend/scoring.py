@@ -0,0 +1,427 @@
+# 점수 원장(ledger) 관리
+# =======================
+# 사용자별·날짜별 점수를 user_daily_scores 테이블에 저장해두고,
+# 미션 완료/그룹 체크가 바뀔 때 해당 날짜만 다시 계산한다.
+# 랭킹은 이 테이블에 대한 집계 쿼리 한 번으로 계산된다.
+
+import logging
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, case, func, union
+from sqlalchemy.orm import Session
+
+from database import SessionLocal
+from models import DayMission, GroupMember, GroupMission, GroupMissionCheck, User, UserDailyScore, UserStreak
+
+# KST(Asia/Seoul) 타임존 - day_missions와 같은 기준의 "오늘"
+KST = ZoneInfo("Asia/Seoul")
+logger = logging.getLogger(__name__)
+
+# 점수 규칙
+PERSONAL_DAILY_CAP = 3  # 개인 미션은 하루 최대 3점
+GROUP_BASE_POINTS = 2  # 그룹 미션 기본 2점
+GROUP_BONUS_POINTS = 4  # 3명 전원 완료 시 보너스 4점
+FULL_GROUP_SIZE = 3
+
+# 점수가 바뀐 세션 표시 (커밋 후 랭킹 스냅샷 갱신 신호로 사용)
+RANKING_DIRTY_KEY = "ranking_dirty"
+
+
+def today_kst() -> date:
+    """KST 기준 오늘 날짜"""
+    return datetime.now(KST).date()
+
+
+def compute_day_points(db: Session, user_id: int, target_date: date) -> Tuple[int, int]:
+    """특정 날짜의 (개인 점수, 그룹 점수) 계산"""
+    completed_count = db.query(func.count(DayMission.id)).filter(
+        and_(
+            DayMission.user_id == user_id,
+            DayMission.date == target_date,
+            DayMission.completed == True
+        )
+    ).scalar() or 0
+    personal_points = min(completed_count, PERSONAL_DAILY_CAP)
+
+    # 현재 참여 중인 그룹 중 이 날짜에 완료 체크한 그룹
+    checked_group_ids = [
+        row[0]
+        for row in db.query(GroupMissionCheck.group_mission_id)
+        .join(
+            GroupMember,
+            and_(
+                GroupMember.group_mission_id == GroupMissionCheck.group_mission_id,
+                GroupMember.user_id == user_id,
+            ),
+        )
+        .filter(
+            and_(
+                GroupMissionCheck.user_id == user_id,
+                GroupMissionCheck.date == target_date,
+                GroupMissionCheck.completed == True
+            )
+        )
+        .all()
+    ]
+
+    group_points = 0
+    for group_id in checked_group_ids:
+        member_count = db.query(func.count(GroupMember.id)).filter(
+            GroupMember.group_mission_id == group_id
+        ).scalar() or 0
+        completed_users = db.query(func.count(func.distinct(GroupMissionCheck.user_id))).filter(
+            and_(
+                GroupMissionCheck.group_mission_id == group_id,
+                GroupMissionCheck.date == target_date,
+                GroupMissionCheck.completed == True
+            )
+        ).scalar() or 0
+        if member_count == FULL_GROUP_SIZE and completed_users == FULL_GROUP_SIZE:
+            group_points = max(group_points, GROUP_BONUS_POINTS)
+        else:
+            group_points = max(group_points, GROUP_BASE_POINTS)
+
+    return personal_points, group_points
+
+
+def refresh_daily_score(db: Session, user_id: int, target_date: date, track_streak: bool = True) -> None:
+    """사용자의 특정 날짜 점수 행을 다시 계산 (커밋은 호출한 쪽에서)
+
+    track_streak이면 그날의 개인 미션 달성 여부가 바뀌었을 때 연속 달성일도 갱신한다.
+    """
+    # autoflush=False 세션이므로 아직 반영되지 않은 변경사항을 먼저 flush
+    db.flush()
+    db.info[RANKING_DIRTY_KEY] = True
+    personal_points, group_points = compute_day_points(db, user_id, target_date)
+
+    row = db.query(UserDailyScore).filter(
+        and_(
+            UserDailyScore.user_id == user_id,
+            UserDailyScore.date == target_date
+        )
+    ).first()
+
+    was_completed = bool(row and row.personal_points > 0)
+    if track_streak and was_completed != (personal_points > 0):
+        update_streak(db, user_id, target_date, completed=personal_points > 0)
+
+    if personal_points == 0 and group_points == 0:
+        # 점수가 없는 날은 행을 두지 않는다
+        if row:
+            db.delete(row)
+        return
+
+    if row:
+        row.personal_points = personal_points
+        row.group_points = group_points
+    else:
+        db.add(UserDailyScore(
+            user_id=user_id,
+            date=target_date,
+            personal_points=personal_points,
+            group_points=group_points,
+        ))
+
+
+def refresh_group_daily_scores(db: Session, group_id: int, target_date: date) -> None:
+    """그룹 체크 변경 시 그룹원 전원의 해당 날짜 점수 갱신 (보너스 여부가 함께 바뀌므로)"""
+    db.flush()
+    member_ids = [
+        row[0]
+        for row in db.query(GroupMember.user_id).filter(
+            GroupMember.group_mission_id == group_id
+        ).all()
+    ]
+    for member_id in member_ids:
+        # 그룹 체크는 연속 달성일(개인 미션 기준)에 영향을 주지 않는다
+        refresh_daily_score(db, member_id, target_date, track_streak=False)
+
+
+def rebuild_user_scores(db: Session, user_id: int) -> None:
+    """사용자의 점수 원장을 처음부터 다시 계산 (그룹 가입/탈퇴 등 과거 점수가 바뀌는 경우)"""
+    db.flush()
+    personal_dates = db.query(DayMission.date).filter(
+        and_(
+            DayMission.user_id == user_id,
+            DayMission.completed == True
+        )
+    )
+    group_dates = db.query(GroupMissionCheck.date).filter(
+        and_(
+            GroupMissionCheck.user_id == user_id,
+            GroupMissionCheck.completed == True
+        )
+    )
+    active_dates = [row[0] for row in db.execute(union(personal_dates.statement, group_dates.statement)).all()]
+
+    db.info[RANKING_DIRTY_KEY] = True
+    db.query(UserDailyScore).filter(
+        UserDailyScore.user_id == user_id
+    ).delete(synchronize_session=False)
+
+    for target_date in active_dates:
+        refresh_daily_score(db, user_id, target_date, track_streak=False)
+
+
+def _get_or_create_streak(db: Session, user_id: int) -> UserStreak:
+    streak = db.query(UserStreak).filter(UserStreak.user_id == user_id).first()
+    if streak is None:
+        streak = UserStreak(user_id=user_id, current_streak=0, longest_streak=0)
+        db.add(streak)
+    return streak
+
+
+def update_streak(db: Session, user_id: int, target_date: date, completed: bool) -> None:
+    """하루의 개인 미션 달성 여부가 바뀌었을 때 연속 달성일 갱신
+
+    마지막 달성일 이후의 날짜가 새로 달성된 경우(대부분의 토글)는 바로 갱신하고,
+    과거 날짜 변경이나 달성 취소처럼 구간이 쪼개질 수 있는 경우만 전체를 다시 계산한다.
+    미래 날짜(KST 오늘 이후)의 달성은 연속 기록에 반영하지 않는다
+    (마지막 달성일이 오늘을 넘어가면 오늘 연속 기록이 0으로 읽히기 때문).
+    """
+    if target_date > today_kst():
+        return
+
+    streak = _get_or_create_streak(db, user_id)
+    last_date = streak.last_completed_date
+
+    if completed and (last_date is None or target_date > last_date):
+        if last_date == target_date - timedelta(days=1):
+            streak.current_streak = (streak.current_streak or 0) + 1
+        else:
+            streak.current_streak = 1
+        streak.last_completed_date = target_date
+        streak.longest_streak = max(streak.longest_streak or 0, streak.current_streak)
+        return
+
+    rebuild_streak(db, user_id)
+
+
+def rebuild_streak(db: Session, user_id: int) -> None:
+    """완료 기록 전체로 연속 달성일 재계산 (KST 오늘 이후 날짜는 제외)"""
+    db.flush()
+    completed_dates = [
+        row[0]
+        for row in db.query(DayMission.date).filter(
+            and_(
+                DayMission.user_id == user_id,
+                DayMission.completed == True,
+                DayMission.date <= today_kst(),
+            )
+        ).distinct().order_by(DayMission.date).all()
+    ]
+
+    current_streak = 0
+    longest_streak = 0
+    previous_date = None
+    for completed_date in completed_dates:
+        if previous_date is not None and completed_date == previous_date + timedelta(days=1):
+            current_streak += 1
+        else:
+            current_streak = 1
+        longest_streak = max(longest_streak, current_streak)
+        previous_date = completed_date
+
+    streak = _get_or_create_streak(db, user_id)
+    streak.current_streak = current_streak
+    streak.longest_streak = longest_streak
+    streak.last_completed_date = previous_date
+
+
+def current_streak_expression(today: Optional[date] = None):
+    """오늘 기준 연속 달성일 SQL 식
+
+    마지막 달성일이 오늘(KST)이 아니면 연속 기록이 끊긴 것으로 본다.
+    자정이 지나면 별도 작업 없이 읽는 시점에 0으로 넘어간다.
+    """
+    today = today or today_kst()
+    return func.coalesce(
+        case(
+            (UserStreak.last_completed_date == today, UserStreak.current_streak),
+            else_=0,
+        ),
+        0,
+    )
+
+
+def rebuild_users_scores(db: Session, user_ids: Iterable[int]) -> None:
+    """여러 사용자의 점수 원장 재계산"""
+    for user_id in set(user_ids):
+        rebuild_user_scores(db, user_id)
+
+
+def rebuild_all_scores(db: Session) -> None:
+    """전체 사용자의 점수 원장 재계산"""
+    personal_users = db.query(DayMission.user_id).filter(DayMission.completed == True)
+    group_users = db.query(GroupMissionCheck.user_id).filter(GroupMissionCheck.completed == True)
+    user_ids = [row[0] for row in db.execute(union(personal_users.statement, group_users.statement)).all()]
+    rebuild_users_scores(db, user_ids)
+    for user_id in set(user_ids):
+        rebuild_streak(db, user_id)
+
+
+def user_scores_subquery(db: Session):
+    """사용자별 총점 서브쿼리 (user_id, score)
+
+    기존 calculate_user_score와 동일하게 개인 점수는 날짜별 합계,
+    그룹 점수는 전체 기간 중 최고값(2 또는 4)만 반영한다.
+    """
+    return (
+        db.query(
+            UserDailyScore.user_id.label("user_id"),
+            (
+                func.coalesce(func.sum(UserDailyScore.personal_points), 0)
+                + func.coalesce(func.max(UserDailyScore.group_points), 0)
+            ).label("score"),
+        )
+        .group_by(UserDailyScore.user_id)
+        .subquery()
+    )
+
+
+def user_total_score(db: Session, user_id: int) -> int:
+    """사용자 한 명의 총점 (user_scores_subquery와 같은 규칙)"""
+    score = db.query(
+        func.coalesce(func.sum(UserDailyScore.personal_points), 0)
+        + func.coalesce(func.max(UserDailyScore.group_points), 0)
+    ).filter(
+        UserDailyScore.user_id == user_id
+    ).scalar()
+    return score or 0
+
+
+def ranked_users_subquery(db: Session):
+    """전체 사용자 순위 서브쿼리 (id, name, profile_color, score, streak, rank, position)
+
+    순위는 DB의 윈도 함수로 계산한다. 개인 점수의 하루 최대 3점(LEAST(count, 3))은
+    점수 원장에 이미 반영되어 있으므로 PostgreSQL과 SQLite(3.25+)에서 같은 쿼리를 쓴다.
+    - rank: 동점자는 같은 순위 (RANK)
+    - position: 페이지네이션용 고유 순번 (동점이면 id 순)
+    """
+    scores = user_scores_subquery(db)
+    score = func.coalesce(scores.c.score, 0)
+    return (
+        db.query(
+            User.id.label("id"),
+            User.name.label("name"),
+            User.profile_color.label("profile_color"),
+            score.label("score"),
+            current_streak_expression().label("streak"),
+            func.rank().over(order_by=score.desc()).label("rank"),
+            func.row_number().over(order_by=(score.desc(), User.id)).label("position"),
+        )
+        .outerjoin(scores, scores.c.user_id == User.id)
+        .outerjoin(UserStreak, UserStreak.user_id == User.id)
+        .subquery()
+    )
+
+
+def personal_leaderboard_page(
+    db: Session,
+    limit: int,
+    offset: int = 0,
+    around_user_id: Optional[int] = None,
+) -> List:
+    """개인 랭킹 한 페이지 조회
+
+    around_user_id가 주어지면 해당 사용자가 페이지 가운데 오도록 offset을 다시 잡는다.
+    """
+    ranked = ranked_users_subquery(db)
+    if around_user_id is not None:
+        position = db.query(ranked.c.position).filter(
+            ranked.c.id == around_user_id
+        ).scalar()
+        if position is not None:
+            offset = max(position - 1 - limit // 2, 0)
+
+    return (
+        db.query(ranked)
+        .order_by(ranked.c.position)
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+
+
+def personal_rank_of(db: Session, user_id: int) -> int:
+    """내 개인 순위 (나보다 점수가 높은 사용자 수 + 1)
+
+    전체 순위를 매기지 않고 COUNT 한 번으로 계산하므로 사용자 수와 무관하게 가볍다.
+    점수 원장에 행이 없는 사용자는 0점이므로 비교 대상에서 빠져도 결과가 같다.
+    """
+    my_score = user_total_score(db, user_id)
+    scores = user_scores_subquery(db)
+    higher_count = db.query(func.count()).select_from(scores).filter(
+        scores.c.score > my_score
+    ).scalar() or 0
+    return higher_count + 1
+
+
+def group_scores_subquery(db: Session):
+    """그룹별 총점 서브쿼리 (group_id, total_score, member_count)
+
+    그룹 총점은 그룹원 개인 총점의 합이다. 그룹원이 없는 그룹도 0점으로 포함한다.
+    """
+    scores = user_scores_subquery(db)
+    return (
+        db.query(
+            GroupMission.id.label("group_id"),
+            func.coalesce(func.sum(scores.c.score), 0).label("total_score"),
+            func.count(GroupMember.id).label("member_count"),
+        )
+        .outerjoin(GroupMember, GroupMember.group_mission_id == GroupMission.id)
+        .outerjoin(scores, scores.c.user_id == GroupMember.user_id)
+        .group_by(GroupMission.id)
+        .subquery()
+    )
+
+
+def group_leaderboard(db: Session) -> List[dict]:
+    """그룹 랭킹 전체 (총점 순, 그룹원 점수를 한 번씩만 집계하는 단일 쿼리)"""
+    group_scores = group_scores_subquery(db)
+    rows = db.query(
+        GroupMission.id,
+        GroupMission.name,
+        GroupMission.color,
+        group_scores.c.total_score,
+        group_scores.c.member_count,
+    ).join(
+        group_scores, group_scores.c.group_id == GroupMission.id
+    ).order_by(
+        group_scores.c.total_score.desc(), GroupMission.id
+    ).all()
+
+    return [
+        {
+            "id": row.id,
+            "name": row.name,
+            "total_score": row.total_score,
+            "member_count": row.member_count,
+            "color": row.color,
+        }
+        for row in rows
+    ]
+
+
+def ensure_score_ledger():
+    """점수 원장/연속 달성일이 비어 있으면 기존 미션 기록으로부터 채운다 (최초 배포 시 1회)"""
+    db = SessionLocal()
+    try:
+        if (
+            db.query(UserDailyScore.id).first() is not None
+            and db.query(UserStreak.id).first() is not None
+        ):
+            return
+        has_history = (
+            db.query(DayMission.id).filter(DayMission.completed == True).first() is not None
+            or db.query(GroupMissionCheck.id).filter(GroupMissionCheck.completed == True).first() is not None
+        )
+        if not has_history:
+            return
+        logger.info("점수 원장이 비어 있어 기존 기록으로 재계산합니다")
+        rebuild_all_scores(db)
+        db.commit()
+    finally:
+        db.close()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+bcrypt 비용(rounds)별 로그인 처리량 측정
+
+각 비용마다 검증 1회 시간을 재고, 코어 1개가 초당 처리할 수 있는 로그인 수와
+PASSWORD_HASH_WORKERS 스레드로 동시에 돌렸을 때의 처리량을 출력한다.
+BCRYPT_ROUNDS 값을 정할 때 사용한다.
+
+사용법:
+    python scripts/bench_bcrypt.py                 # rounds 10~13
+    python scripts/bench_bcrypt.py --rounds 12 14 --iterations 20
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from passlib.hash import bcrypt
+
+PASSWORD = "benchmark-password"
+
+
+def measure_single(hash_value: str, iterations: int) -> list:
+    """검증 1회 시간(초) 목록"""
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        bcrypt.verify(PASSWORD, hash_value)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def measure_parallel(hash_value: str, iterations: int, workers: int) -> float:
+    """workers개 스레드로 iterations번 검증했을 때 초당 처리량"""
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(lambda _: bcrypt.verify(PASSWORD, hash_value), range(iterations)))
+    return iterations / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="bcrypt 비용별 로그인 처리량 측정")
+    parser.add_argument("--rounds", type=int, nargs="+", default=[10, 11, 12, 13])
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1)))),
+    )
+    args = parser.parse_args()
+
+    print(f"CPU {os.cpu_count()}개, 해싱 스레드 {args.workers}개, 비용별 {args.iterations}회 측정\n")
+    print(f"{'rounds':>6} {'median ms':>10} {'p95 ms':>8} {'login/s/core':>13} {'login/s (pool)':>15}")
+    for rounds in args.rounds:
+        hash_value = bcrypt.using(rounds=rounds).hash(PASSWORD)
+        timings = sorted(measure_single(hash_value, args.iterations))
+        median = statistics.median(timings)
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        parallel = measure_parallel(hash_value, args.iterations * args.workers, args.workers)
+        print(f"{rounds:>6} {median * 1000:>10.1f} {p95 * 1000:>8.1f} {1 / median:>13.1f} {parallel:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+SQLite 쓰기 경합 벤치마크 (여러 사용자가 동시에 미션 완료를 토글하는 상황)
+
+임시 DB 파일 두 개를 만들어 같은 작업을 실행한다.
+  - default : check_same_thread=False 만 준 기존 설정 (rollback journal, synchronous=FULL)
+  - tuned   : database.SQLITE_PRAGMAS 적용 (WAL, busy_timeout, synchronous=NORMAL, mmap ...)
+각 토글은 실제 API와 같이 DayMission.completed 변경 + 점수 원장 갱신 + 날짜 버전 증가 후 커밋한다.
+
+사용법:
+    python scripts/bench_sqlite_contention.py
+    python scripts/bench_sqlite_contention.py --threads 16 --toggles 200 --users 50
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import date
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, apply_sqlite_pragmas
+from day_versions import bump_day_versions
+from models import DayMission, User
+from scoring import refresh_daily_score
+
+TARGET_DATE = date(2025, 3, 3)
+MISSIONS_PER_USER = 3
+
+
+def build_engine(path: str, tuned: bool, pool_size: int):
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False},
+        pool_size=pool_size,
+        max_overflow=0,
+    )
+    if tuned:
+        event.listen(engine, "connect", lambda conn, record: apply_sqlite_pragmas(conn))
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def seed(Session, users: int):
+    db = Session()
+    mission_ids = []
+    for index in range(users):
+        user = User(email=f"bench-{index}@example.com", password_hash=None, name=f"bench-{index}")
+        db.add(user)
+        db.flush()
+        for mission_index in range(MISSIONS_PER_USER):
+            mission = DayMission(
+                user_id=user.id,
+                mission_id=mission_index + 1,
+                date=TARGET_DATE,
+                sub_mission=f"bench-sub-{mission_index}",
+                completed=False,
+            )
+            db.add(mission)
+            db.flush()
+            mission_ids.append((user.id, mission.id))
+    db.commit()
+    db.close()
+    return mission_ids
+
+
+def toggle(Session, user_id: int, mission_id: int):
+    db = Session()
+    try:
+        mission = db.query(DayMission).filter(
+            DayMission.id == mission_id, DayMission.user_id == user_id
+        ).first()
+        mission.completed = not mission.completed
+        refresh_daily_score(db, user_id, TARGET_DATE)
+        bump_day_versions(db, user_id, [TARGET_DATE])
+        db.commit()
+    finally:
+        db.close()
+
+
+def run(label: str, tuned: bool, args) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = build_engine(os.path.join(directory, "bench.db"), tuned, args.threads)
+        Session = sessionmaker(bind=engine, autoflush=False)
+        missions = seed(Session, args.users)
+
+        latencies = []
+        errors = 0
+        lock = threading.Lock()
+
+        def worker(seed_value: int):
+            nonlocal errors
+            rng = random.Random(seed_value)
+            for _ in range(args.toggles):
+                user_id, mission_id = rng.choice(missions)
+                started = time.perf_counter()
+                try:
+                    toggle(Session, user_id, mission_id)
+                except OperationalError:
+                    with lock:
+                        errors += 1
+                    continue
+                with lock:
+                    latencies.append(time.perf_counter() - started)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(args.threads)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        engine.dispose()
+
+    latencies.sort()
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] if latencies else 0.0
+    print(
+        f"{label:<8} {len(latencies) / elapsed:>9.1f} toggles/s   "
+        f"p50 {statistics.median(latencies) * 1000 if latencies else 0:>7.1f} ms   "
+        f"p95 {p95 * 1000:>7.1f} ms   locked errors {errors}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite 동시 토글 경합 벤치마크")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--toggles", type=int, default=100, help="스레드당 토글 횟수")
+    parser.add_argument("--users", type=int, default=30)
+    args = parser.parse_args()
+
+    print(f"스레드 {args.threads}개 x 토글 {args.toggles}회, 사용자 {args.users}명\n")
+    run("default", False, args)
+    run("tuned", True, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+access 토큰 발급/검증 마이크로벤치마크
+
+기존 방식(jwt.encode/jwt.decode + 클레임 개별 검사)과 tokens.TokenService
+(standard / compact 형식)의 초당 처리량을 비교한다.
+
+사용법:
+    python scripts/bench_tokens.py
+    python scripts/bench_tokens.py --iterations 200000
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jwt
+
+from tokens import ACCESS, ALGORITHM, SECRET_KEY, TokenService
+
+KST = ZoneInfo("Asia/Seoul")
+
+
+def legacy_issue(user_id: int) -> str:
+    """변경 전 auth.create_access_token과 같은 방식"""
+    to_encode = {"sub": str(user_id)}.copy()
+    expire = datetime.now(KST) + timedelta(minutes=30)
+    to_encode.update({"exp": expire, "iat": datetime.now(KST), "type": "access"})
+    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+
+
+def legacy_verify(token: str) -> int:
+    """변경 전 auth.get_current_user와 같은 방식"""
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    user_id_str = payload.get("sub")
+    if user_id_str is None:
+        raise ValueError("sub 없음")
+    user_id = int(user_id_str)
+    if payload.get("type") != "access":
+        raise ValueError("access 토큰 아님")
+    return user_id
+
+
+def ops_per_second(func, arg, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func(arg)
+    return iterations / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="토큰 발급/검증 처리량 측정")
+    parser.add_argument("--iterations", type=int, default=50000)
+    args = parser.parse_args()
+
+    standard = TokenService(SECRET_KEY, ALGORITHM, timedelta(minutes=30), timedelta(days=7))
+    compact = TokenService(SECRET_KEY, ALGORITHM, timedelta(minutes=30), timedelta(days=7), compact=True)
+
+    cases = [
+        ("legacy (jwt.encode/decode)", legacy_issue, legacy_verify),
+        ("TokenService standard", standard.issue_access_token, lambda t: standard.verify(t, ACCESS)),
+        ("TokenService compact", compact.issue_access_token, lambda t: compact.verify(t, ACCESS)),
+    ]
+
+    print(f"{ALGORITHM}, {args.iterations}회 반복\n")
+    print(f"{'방식':<28} {'issue ops/s':>12} {'verify ops/s':>13} {'토큰 길이':>9}")
+    baseline = None
+    for name, issue, verify in cases:
+        token = issue(1)
+        issue_rate = ops_per_second(issue, 1, args.iterations)
+        verify_rate = ops_per_second(verify, token, args.iterations)
+        baseline = baseline or verify_rate
+        print(
+            f"{name:<28} {issue_rate:>12.0f} {verify_rate:>13.0f} {len(token):>9}"
+            f"  (verify x{verify_rate / baseline:.2f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
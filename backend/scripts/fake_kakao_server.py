@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+로컬 카카오 OAuth 대역 서버 (오프라인 테스트/부하 테스트용)
+
+kauth.kakao.com/oauth/token 과 kapi.kakao.com/v2/user/me 를 흉내 낸다.
+인가 코드가 곧 사용자 식별자가 되므로 코드만 바꿔서 여러 사용자를 만들 수 있다.
+
+사용법:
+    python scripts/fake_kakao_server.py --port 9100 --latency-ms 30
+
+    # 백엔드를 대역 서버로 향하게 실행
+    KAKAO_CLIENT_ID=fake \\
+    KAKAO_AUTH_BASE_URL=http://127.0.0.1:9100 \\
+    KAKAO_API_BASE_URL=http://127.0.0.1:9100 \\
+    uvicorn main:app
+
+    # 그 다음 /api/auth/kakao/callback 에 {"code": "user-1"} 처럼 요청
+"""
+import argparse
+import asyncio
+import hashlib
+
+from fastapi import FastAPI, Form, Header, HTTPException
+
+TOKEN_PREFIX = "fake-kakao-token-"
+
+
+def kakao_id_for(code: str) -> int:
+    """인가 코드마다 고정된 카카오 사용자 id"""
+    return int(hashlib.sha1(code.encode()).hexdigest()[:12], 16)
+
+
+def create_app(latency_ms: float = 0.0) -> FastAPI:
+    app = FastAPI(title="Fake Kakao OAuth")
+
+    async def simulate_latency():
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+
+    @app.post("/oauth/token")
+    async def issue_token(
+        grant_type: str = Form(...),
+        client_id: str = Form(...),
+        code: str = Form(...),
+        redirect_uri: str = Form(""),
+    ):
+        await simulate_latency()
+        if grant_type != "authorization_code" or code.startswith("invalid"):
+            raise HTTPException(status_code=400, detail={"error": "invalid_grant"})
+        return {
+            "token_type": "bearer",
+            "access_token": f"{TOKEN_PREFIX}{code}",
+            "expires_in": 21599,
+        }
+
+    @app.get("/v2/user/me")
+    async def user_me(authorization: str = Header("")):
+        await simulate_latency()
+        token = authorization.removeprefix("Bearer ").strip()
+        if not token.startswith(TOKEN_PREFIX):
+            raise HTTPException(status_code=401, detail={"msg": "this access token does not exist"})
+        code = token[len(TOKEN_PREFIX):]
+        kakao_id = kakao_id_for(code)
+        return {
+            "id": kakao_id,
+            "kakao_account": {
+                "email": f"kakao-{kakao_id}@fake.kakao.local",
+                "profile": {"nickname": f"카카오-{code}"},
+            },
+        }
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 카카오 OAuth 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="응답마다 추가할 지연 (실제 카카오 왕복 시간 흉내)")
+    args = parser.parse_args()
+
+    import uvicorn
+    uvicorn.run(create_app(args.latency_ms), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
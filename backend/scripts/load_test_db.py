@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+동기 DB 접근 방식별 동시 요청 처리량 비교
+
+1) 비교 모드 (기본): 같은 DB 조회를 하는 엔드포인트를 두 방식으로 만들어 앱 안에서 바로 부하를 준다.
+   - inline     : async def 핸들러 안에서 동기 Session 사용 (변경 전 방식, 이벤트 루프가 막힘)
+   - threadpool : def 핸들러 (FastAPI가 스레드풀에서 실행, 현재 routers/ 방식)
+   로컬 SQLite는 조회가 너무 빨라 차이가 잘 보이지 않으므로 --db-latency-ms 로
+   원격 DB(Render PostgreSQL 등)의 왕복 시간을 흉내 낸다.
+
+    python scripts/load_test_db.py --requests 400 --concurrency 10 --db-latency-ms 5
+
+   inline 방식에서 동시성이 DB 커넥션 풀 크기(pool_size + max_overflow)보다 크면
+   루프가 막힌 채 커넥션을 기다리다 풀 타임아웃까지 멈춘다 (변경 전 구조의 또 다른 문제).
+
+2) 서버 모드: 실행 중인 서버의 실제 엔드포인트에 부하를 준다 (변경 전/후 빌드 비교용).
+
+    python scripts/load_test_db.py --url http://127.0.0.1:8000 --token <access> \\
+        --path /api/ranking/personal --path /api/days/2025-03-03/missions
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from database import get_db
+from models import DayMission
+
+
+def build_probe_app(threadpool: bool, db_latency: float) -> FastAPI:
+    app = FastAPI()
+
+    def query(db: Session) -> int:
+        if db_latency:
+            time.sleep(db_latency)  # 원격 DB 왕복 시간 흉내
+        return db.query(func.count(DayMission.id)).scalar()
+
+    if threadpool:
+        @app.get("/probe")
+        def probe(db: Session = Depends(get_db)):
+            return {"count": query(db)}
+    else:
+        @app.get("/probe")
+        async def probe(db: Session = Depends(get_db)):
+            return {"count": query(db)}
+
+    return app
+
+
+async def run_load(client: httpx.AsyncClient, paths, total: int, concurrency: int, headers=None):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    errors = 0
+
+    async def one(index: int):
+        nonlocal errors
+        path = paths[index % len(paths)]
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.get(path, headers=headers)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "rps": total / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000,
+        "errors": errors,
+    }
+
+
+def print_result(name: str, result: dict):
+    print(
+        f"{name:<12} {result['rps']:>9.1f} req/s   p50 {result['p50_ms']:>8.1f} ms   "
+        f"p95 {result['p95_ms']:>8.1f} ms   errors {result['errors']}"
+    )
+
+
+async def compare(args):
+    print(
+        f"요청 {args.requests}개, 동시성 {args.concurrency}, "
+        f"DB 지연 {args.db_latency_ms}ms (앱 내부 ASGI 호출)\n"
+    )
+    for name, threadpool in (("inline", False), ("threadpool", True)):
+        app = build_probe_app(threadpool, args.db_latency_ms / 1000)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://probe") as client:
+            await client.get("/probe")  # 워밍업
+            result = await run_load(client, ["/probe"], args.requests, args.concurrency)
+        print_result(name, result)
+
+
+async def against_server(args):
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else None
+    paths = args.path or ["/health"]
+    print(f"{args.url} 요청 {args.requests}개, 동시성 {args.concurrency}, 경로 {paths}\n")
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=30) as client:
+        result = await run_load(client, paths, args.requests, args.concurrency, headers)
+    print_result("server", result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동기 DB 접근 방식별 처리량 비교")
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--db-latency-ms", type=float, default=5.0)
+    parser.add_argument("--url", help="실행 중인 서버 주소 (지정하면 서버 모드)")
+    parser.add_argument("--token", help="서버 모드에서 사용할 access 토큰")
+    parser.add_argument("--path", action="append", help="서버 모드에서 요청할 경로 (여러 번 지정 가능)")
+    args = parser.parse_args()
+
+    asyncio.run(against_server(args) if args.url else compare(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+그룹 미션 카운터 재계산 (group_missions.member_count / completed_check_count)
+
+group_members, group_mission_checks 원본 테이블을 세어서 어긋난 카운터를 고친다.
+수동으로 DB를 고쳤거나 카운터가 어긋난 것이 의심될 때 실행한다.
+
+사용법:
+    python scripts/reconcile_group_counters.py              # 전체 그룹
+    python scripts/reconcile_group_counters.py --group 3 7  # 특정 그룹만
+    python scripts/reconcile_group_counters.py --dry-run    # 고칠 그룹 수만 확인
+"""
+import argparse
+import os
+import sys
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import SessionLocal
+from group_counters import ensure_group_counter_schema, reconcile_group_counters
+
+
+def main():
+    parser = argparse.ArgumentParser(description="그룹 미션 카운터 재계산")
+    parser.add_argument("--group", type=int, nargs="+", help="재계산할 그룹 id (생략하면 전체)")
+    parser.add_argument("--dry-run", action="store_true", help="변경 내용을 저장하지 않음")
+    args = parser.parse_args()
+
+    ensure_group_counter_schema()
+    db = SessionLocal()
+    try:
+        fixed = reconcile_group_counters(db, args.group)
+        if args.dry_run:
+            db.rollback()
+            print(f"카운터가 어긋난 그룹 {fixed}개 (저장하지 않음)")
+        else:
+            db.commit()
+            print(f"카운터를 고친 그룹 {fixed}개")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
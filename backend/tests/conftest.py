@@ -0,0 +1,19 @@
+import pytest
+
+from models import User
+
+
+def _get_or_create_user(db, email):
+    user = db.query(User).filter(User.email == email).first()
+    if not user:
+        user = User(email=email, password_hash="x", name=email.split("@")[0])
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+    return user
+
+
+@pytest.fixture
+def get_user():
+    """이메일로 테스트 사용자를 찾고, 없으면 만들어서 돌려주는 함수"""
+    return _get_or_create_user
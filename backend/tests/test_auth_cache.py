@@ -0,0 +1,58 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from auth import CurrentUser, create_access_token, principal_cache
+from database import SessionLocal
+from main import app
+from models import User
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def token_user():
+    app.dependency_overrides = {}
+    principal_cache.clear()
+    db = SessionLocal()
+    user = db.query(User).filter(User.email == "auth-cache-tester@example.com").first()
+    if not user:
+        user = User(
+            email="auth-cache-tester@example.com",
+            password_hash="dummy",
+            name="Auth Cache Tester",
+        )
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+    user_id = user.id
+    db.close()
+    token = create_access_token({"sub": str(user_id)})
+    yield user_id, {"Authorization": f"Bearer {token}"}
+    principal_cache.clear()
+
+
+def test_repeated_requests_reuse_cached_principal(token_user):
+    user_id, headers = token_user
+    assert client.get("/api/users/me", headers=headers).status_code == 200
+
+    cached = list(principal_cache._entries.values())
+    assert len(cached) == 1
+    principal = cached[0][1]
+    assert isinstance(principal, CurrentUser)
+    assert principal.id == user_id
+
+    # 두 번째 요청은 캐시된 객체를 그대로 사용한다
+    assert client.get("/api/users/me", headers=headers).json()["id"] == user_id
+    assert list(principal_cache._entries.values())[0][1] is principal
+
+
+def test_profile_update_invalidates_cached_principal(token_user):
+    user_id, headers = token_user
+    client.get("/api/users/me", headers=headers)
+
+    response = client.put("/api/users/me", json={"bio": "캐시 무효화"}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["bio"] == "캐시 무효화"
+    assert len(principal_cache._entries) == 0
+
+    assert client.get("/api/users/me", headers=headers).json()["bio"] == "캐시 무효화"
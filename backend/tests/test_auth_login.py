@@ -0,0 +1,106 @@
+import pytest
+from fastapi.testclient import TestClient
+from passlib.hash import bcrypt
+
+from auth import BCRYPT_ROUNDS, DUMMY_PASSWORD_HASH, get_password_hash, pwd_context, verify_dummy_password
+from database import SessionLocal
+from main import app
+from models import User
+from password_hashing import password_hasher
+
+client = TestClient(app)
+
+EMAIL = "login-tester@example.com"
+PASSWORD = "correct-horse"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def login_user():
+    app.dependency_overrides = {}
+    db = SessionLocal()
+    user = db.query(User).filter(User.email == EMAIL).first()
+    if not user:
+        user = User(email=EMAIL, password_hash=get_password_hash(PASSWORD), name="Login Tester")
+        db.add(user)
+        db.commit()
+    db.close()
+    yield
+
+
+def test_login_verifies_password_in_hash_pool():
+    before = client.get("/metrics/auth").json()["password_hasher"]["completed"]
+
+    response = client.post("/api/auth/login", json={"email": EMAIL, "password": PASSWORD})
+    assert response.status_code == 200
+    assert set(response.json()) >= {"access", "refresh"}
+
+    response = client.post("/api/auth/login", json={"email": EMAIL, "password": "wrong"})
+    assert response.status_code == 401
+
+    metrics = client.get("/metrics/auth").json()["password_hasher"]
+    assert metrics["completed"] == before + 2
+    assert metrics["pending"] == 0
+
+
+def test_login_is_rejected_when_hash_pool_is_saturated(monkeypatch):
+    monkeypatch.setattr(password_hasher, "_pending", password_hasher.max_pending)
+    response = client.post("/api/auth/login", json={"email": EMAIL, "password": PASSWORD})
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_login_rehashes_password_when_cost_changed():
+    db = SessionLocal()
+    user = db.query(User).filter(User.email == EMAIL).first()
+    user.password_hash = bcrypt.using(rounds=4).hash(PASSWORD)
+    db.commit()
+    db.close()
+
+    response = client.post("/api/auth/login", json={"email": EMAIL, "password": PASSWORD})
+    assert response.status_code == 200
+
+    db = SessionLocal()
+    user = db.query(User).filter(User.email == EMAIL).first()
+    assert bcrypt.from_string(user.password_hash).rounds == BCRYPT_ROUNDS
+    assert bcrypt.verify(PASSWORD, user.password_hash)
+    db.close()
+
+
+def test_social_and_unknown_accounts_fail_after_one_dummy_verify():
+    db = SessionLocal()
+    if not db.query(User).filter(User.email == "social-only@example.com").first():
+        db.add(User(email="social-only@example.com", password_hash=None, name="Social Only"))
+        db.commit()
+    db.close()
+
+    for email in ("social-only@example.com", "nobody@example.com"):
+        before = password_hasher.metrics()["completed"]
+        response = client.post("/api/auth/login", json={"email": email, "password": PASSWORD})
+        assert response.status_code == 401
+        assert password_hasher.metrics()["completed"] == before + 1
+
+
+def test_dummy_verify_is_a_single_bcrypt_verify(monkeypatch):
+    # 더미 해시는 미리 만들어져 있고 실제 계정과 같은 비용
+    assert bcrypt.from_string(DUMMY_PASSWORD_HASH).rounds == BCRYPT_ROUNDS
+
+    def fail_hash(*args, **kwargs):
+        raise AssertionError("더미 검증 중에 해시를 새로 만들면 안 된다")
+
+    monkeypatch.setattr(pwd_context, "hash", fail_hash)
+    assert verify_dummy_password(PASSWORD) is False
+
+
+def test_auth_metrics_require_token_when_configured(monkeypatch):
+    import main
+
+    monkeypatch.setattr(main, "METRICS_TOKEN", "metrics-secret")
+    assert client.get("/metrics/auth").status_code == 404
+    assert client.get("/metrics/auth", headers={"X-Metrics-Token": "wrong"}).status_code == 404
+    response = client.get("/metrics/auth", headers={"X-Metrics-Token": "metrics-secret"})
+    assert response.status_code == 200
+
+    # 토큰이 없으면 production에서는 닫힌다
+    monkeypatch.setattr(main, "METRICS_TOKEN", None)
+    monkeypatch.setenv("ENV", "production")
+    assert client.get("/metrics/auth").status_code == 404
@@ -0,0 +1,58 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from database import SessionLocal, create_db_engine, engine
+from main import app
+
+client = TestClient(app)
+
+
+def test_db_metrics_report_pool_utilization():
+    assert engine.echo is False
+
+    db = SessionLocal()
+    db.connection()  # 커넥션 하나를 빌린 상태
+    response = client.get("/metrics/db")
+    db.close()
+
+    assert response.status_code == 200
+    pool = response.json()["pool"]
+    assert pool["checked_out"] >= 1
+    assert pool["capacity"] == pool["pool_size"] + pool["max_overflow"]
+    assert 0 < pool["utilization"] <= 1
+
+
+def test_db_metrics_are_hidden_without_token(monkeypatch):
+    import main
+
+    monkeypatch.setattr(main, "METRICS_TOKEN", "metrics-secret")
+    assert client.get("/metrics/db").status_code == 404
+    response = client.get("/metrics/db", headers={"X-Metrics-Token": "metrics-secret"})
+    assert response.status_code == 200
+
+
+@pytest.mark.skipif(engine.dialect.name != "sqlite", reason="SQLite only")
+def test_sqlite_connections_use_tuned_pragmas():
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert conn.exec_driver_sql("PRAGMA busy_timeout").scalar() == 5000
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+        assert conn.exec_driver_sql("PRAGMA temp_store").scalar() == 2  # MEMORY
+
+
+def test_in_memory_sqlite_engine_builds_without_pool_size_options():
+    from concurrent.futures import ThreadPoolExecutor
+
+    memory_engine = create_db_engine("sqlite:///:memory:")
+    with memory_engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE t (x INTEGER)")
+        conn.exec_driver_sql("INSERT INTO t VALUES (1)")
+
+    # 다른 스레드에서도 같은 메모리 DB를 본다
+    def count():
+        with memory_engine.connect() as conn:
+            return conn.exec_driver_sql("SELECT COUNT(*) FROM t").scalar()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(count).result() == 1
+    memory_engine.dispose()
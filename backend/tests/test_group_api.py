@@ -2,6 +2,7 @@
 import pytest
 from fastapi.testclient import TestClient
 from database import SessionLocal
+from group_counters import release_member_slot
 from models import User, GroupMission, GroupMember
 from main import app
 
@@ -49,6 +50,7 @@ def test_join_flow(db_setup, monkeypatch):
     existing = db.query(GroupMember).filter(GroupMember.group_mission_id == group.id, GroupMember.user_id == user.id).first()
     if existing:
         db.delete(existing)
+        release_member_slot(db, group.id)
         db.commit()
     db.close()
 
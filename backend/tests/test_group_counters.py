@@ -0,0 +1,95 @@
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from auth import CurrentUser
+from database import SessionLocal
+from group_counters import reconcile_group_counters
+from main import app
+from models import GroupMember, GroupMission, GroupMissionCheck
+
+client = TestClient(app)
+
+CHECK_DATE = date(2025, 2, 10)
+
+
+@pytest.fixture
+def setup(get_user):
+    db = SessionLocal()
+    users = [CurrentUser.from_model(get_user(db, f"counter-{index}@example.com")) for index in range(4)]
+    # 다른 테스트에서 남은 참여 기록이 그룹 수 제한에 걸리지 않도록 정리
+    db.query(GroupMember).filter(GroupMember.user_id.in_([u.id for u in users])).delete(synchronize_session=False)
+    group = GroupMission(name="카운터 그룹", color="bg-blue-300", created_by=users[0].id)
+    db.add(group)
+    db.commit()
+    group_id = group.id
+    db.close()
+
+    from auth import get_current_user
+
+    current = {"user": users[0]}
+    app.dependency_overrides = {}
+    app.dependency_overrides[get_current_user] = lambda: current["user"]
+
+    yield {"group_id": group_id, "users": users, "current": current}
+
+    app.dependency_overrides = {}
+    db = SessionLocal()
+    db.query(GroupMissionCheck).filter(GroupMissionCheck.group_mission_id == group_id).delete(synchronize_session=False)
+    db.query(GroupMember).filter(GroupMember.group_mission_id == group_id).delete(synchronize_session=False)
+    db.query(GroupMission).filter(GroupMission.id == group_id).delete(synchronize_session=False)
+    db.commit()
+    db.close()
+
+
+def _counters(group_id):
+    db = SessionLocal()
+    group = db.query(GroupMission).filter(GroupMission.id == group_id).first()
+    result = (group.member_count, group.completed_check_count)
+    db.close()
+    return result
+
+
+def test_counters_follow_join_check_and_leave(setup):
+    group_id, users, current = setup["group_id"], setup["users"], setup["current"]
+
+    for user in users[:3]:
+        current["user"] = user
+        assert client.post(f"/api/group-missions/{group_id}/join").status_code == 200
+    assert _counters(group_id) == (3, 0)
+
+    # 정원 초과는 카운터 조건부 UPDATE에서 거절
+    current["user"] = users[3]
+    assert client.post(f"/api/group-missions/{group_id}/join").status_code == 400
+    assert _counters(group_id) == (3, 0)
+
+    current["user"] = users[0]
+    body = {"date": CHECK_DATE.isoformat(), "completed": True}
+    assert client.post(f"/api/group-missions/{group_id}/check", json=body).status_code == 200
+    # 같은 상태로 다시 체크해도 두 번 세지 않는다
+    assert client.post(f"/api/group-missions/{group_id}/check", json=body).status_code == 200
+    assert _counters(group_id) == (3, 1)
+
+    body["completed"] = False
+    client.post(f"/api/group-missions/{group_id}/check", json=body)
+    assert _counters(group_id) == (3, 0)
+
+    current["user"] = users[1]
+    assert client.delete(f"/api/group-missions/{group_id}/leave").status_code == 200
+    assert _counters(group_id) == (2, 0)
+
+
+def test_reconcile_repairs_drifted_counters(setup):
+    group_id, users = setup["group_id"], setup["users"]
+    db = SessionLocal()
+    db.add(GroupMember(group_mission_id=group_id, user_id=users[0].id))
+    db.add(GroupMissionCheck(group_mission_id=group_id, user_id=users[0].id, date=CHECK_DATE, completed=True))
+    db.commit()
+    assert _counters(group_id) == (0, 0)
+
+    assert reconcile_group_counters(db, [group_id]) == 1
+    db.commit()
+    assert _counters(group_id) == (1, 1)
+    assert reconcile_group_counters(db, [group_id]) == 0
+    db.close()
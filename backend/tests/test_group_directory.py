@@ -0,0 +1,86 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from auth import CurrentUser
+from database import SessionLocal
+from main import app
+from models import Friend, GroupMission
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def directory(get_user):
+    db = SessionLocal()
+    me = get_user(db, "directory-me@example.com")
+    friend = get_user(db, "directory-friend@example.com")
+    stranger = get_user(db, "directory-stranger@example.com")
+    if not db.query(Friend).filter(Friend.user_id == friend.id, Friend.friend_id == me.id).first():
+        # 친구 관계는 반대 방향으로만 저장해도 친구로 본다
+        db.add(Friend(user_id=friend.id, friend_id=me.id))
+
+    creators = [friend, stranger, friend, stranger, friend]
+    groups = [
+        GroupMission(name=f"디렉터리 {index}", color="bg-blue-300", created_by=creator.id,
+                     member_count=3 if index == 2 else 1)
+        for index, creator in enumerate(creators)
+    ]
+    db.add_all(groups)
+    db.commit()
+    group_ids = [group.id for group in groups]
+    friend_pair = (friend.id, me.id)
+    principal = CurrentUser.from_model(me)
+    db.close()
+
+    from auth import get_current_user
+
+    app.dependency_overrides = {}
+    app.dependency_overrides[get_current_user] = lambda: principal
+    yield group_ids
+
+    app.dependency_overrides = {}
+    db = SessionLocal()
+    db.query(GroupMission).filter(GroupMission.id.in_(group_ids)).delete(synchronize_session=False)
+    db.query(Friend).filter(
+        Friend.user_id == friend_pair[0], Friend.friend_id == friend_pair[1]
+    ).delete(synchronize_session=False)
+    db.commit()
+    db.close()
+
+
+def test_cursor_pages_are_newest_first(directory):
+    # 픽스처 그룹 바로 위에서 시작 (다른 테스트가 만든 그룹과 섞이지 않도록)
+    cursor = directory[-1] + 1
+    seen = []
+    for _ in range(3):
+        response = client.get("/api/group-missions/", params={"cursor": cursor, "limit": 2})
+        assert response.status_code == 200
+        page = [g["id"] for g in response.json()]
+        seen.extend(page)
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        assert cursor == str(page[-1])
+    assert seen[:5] == sorted(directory, reverse=True)
+
+
+def test_filters_and_lean_mode(directory):
+    params = {"cursor": directory[-1] + 1, "limit": 5}
+
+    friends = client.get("/api/group-missions/", params={**params, "friends_only": True}).json()
+    assert [g["id"] for g in friends][:3] == [directory[4], directory[2], directory[0]]
+
+    free = client.get(
+        "/api/group-missions/", params={**params, "friends_only": True, "has_free_slots": True}
+    ).json()
+    assert directory[2] not in [g["id"] for g in free]
+
+    lean = client.get("/api/group-missions/", params={**params, "lean": True}).json()
+    assert [g["id"] for g in lean] == sorted(directory, reverse=True)
+    assert "participants" not in lean[0]
+    assert lean[0]["member_count"] == 1
+
+    full = client.get("/api/group-missions/", params=params).json()
+    assert full[0]["participants"] == []
+
+    assert client.get("/api/group-missions/", params={"limit": 1000}).status_code == 422
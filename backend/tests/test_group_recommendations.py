@@ -0,0 +1,81 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from auth import CurrentUser
+from database import SessionLocal
+from group_counters import reconcile_group_counters
+from group_recommendations import CandidatePool, rank_for_user
+from main import app
+from models import Friend, GroupMember, GroupMission
+
+client = TestClient(app)
+
+
+def test_rank_for_user_boosts_friends_and_excludes_my_groups():
+    pool = CandidatePool(
+        version=0,
+        built_at=0.0,
+        ranked=(1, 2, 3, 4),
+        base_score={1: 0.7, 2: 0.5, 3: 0.3, 4: 0.1},
+        groups_by_member={10: (4,), 11: (4,), 20: (2,), 99: (1,)},
+    )
+    # 친구 두 명이 있는 4번이 1위, 내가 참여 중인 1번과 명시적으로 뺀 3번은 제외
+    assert rank_for_user(pool, 99, [10, 11], {3}, limit=3) == [4, 2]
+    assert rank_for_user(pool, 50, [], set(), limit=2) == [1, 2]
+    assert rank_for_user(pool, 50, [20], set(), limit=1) == [2]
+
+
+@pytest.fixture
+def groups(get_user):
+    db = SessionLocal()
+    me = get_user(db, "recommend-me@example.com")
+    friend = get_user(db, "recommend-friend@example.com")
+    others = [get_user(db, f"recommend-other-{index}@example.com") for index in range(3)]
+    users = [me, friend, *others]
+    db.query(GroupMember).filter(GroupMember.user_id.in_([u.id for u in users])).delete(synchronize_session=False)
+    if not db.query(Friend).filter(Friend.user_id == me.id, Friend.friend_id == friend.id).first():
+        db.add(Friend(user_id=me.id, friend_id=friend.id))
+
+    with_friend = GroupMission(name="친구 그룹", color="bg-blue-300", created_by=friend.id)
+    full = GroupMission(name="꽉 찬 그룹", color="bg-blue-300", created_by=others[0].id)
+    mine = GroupMission(name="내 그룹", color="bg-blue-300", created_by=me.id)
+    db.add_all([with_friend, full, mine])
+    db.flush()
+    db.add(GroupMember(group_mission_id=with_friend.id, user_id=friend.id))
+    for user in others:
+        db.add(GroupMember(group_mission_id=full.id, user_id=user.id))
+    db.add(GroupMember(group_mission_id=mine.id, user_id=me.id))
+    group_ids = [with_friend.id, full.id, mine.id]
+    friend_pair = (me.id, friend.id)
+    reconcile_group_counters(db, group_ids)
+    db.commit()
+    principal = CurrentUser.from_model(me)
+    db.close()
+
+    from auth import get_current_user
+
+    app.dependency_overrides = {}
+    app.dependency_overrides[get_current_user] = lambda: principal
+    yield group_ids
+
+    app.dependency_overrides = {}
+    db = SessionLocal()
+    db.query(GroupMember).filter(GroupMember.group_mission_id.in_(group_ids)).delete(synchronize_session=False)
+    db.query(GroupMission).filter(GroupMission.id.in_(group_ids)).delete(synchronize_session=False)
+    db.query(Friend).filter(
+        Friend.user_id == friend_pair[0], Friend.friend_id == friend_pair[1]
+    ).delete(synchronize_session=False)
+    db.commit()
+    db.close()
+
+
+def test_recommended_ranks_friend_groups_first(groups):
+    with_friend, full, mine = groups
+    response = client.get("/api/group-missions/recommended", params={"limit": 5})
+    assert response.status_code == 200
+    ids = [g["id"] for g in response.json()]
+    assert ids[0] == with_friend
+    assert full not in ids and mine not in ids
+    assert len(ids) <= 5
+
+    assert client.get("/api/group-missions/recommended", params={"limit": 0}).status_code == 422
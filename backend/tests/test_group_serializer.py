@@ -0,0 +1,77 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+
+from database import SessionLocal, engine
+from group_counters import reconcile_group_counters
+from models import GroupMember, GroupMission, GroupMissionCheck, User
+from routers.group_missions import group_mission_to_response, group_missions_to_responses
+
+CHECK_DATE = date(2025, 2, 3)
+
+
+@pytest.fixture
+def groups():
+    db = SessionLocal()
+    users = []
+    for index in range(3):
+        email = f"serializer-{index}@example.com"
+        user = db.query(User).filter(User.email == email).first()
+        if not user:
+            user = User(email=email, password_hash="x", name=f"직렬화 {index}")
+            db.add(user)
+            db.flush()
+        users.append(user)
+
+    created = []
+    for size in (1, 2, 3):
+        group = GroupMission(name=f"직렬화 그룹 {size}", color="bg-blue-300", created_by=users[0].id)
+        db.add(group)
+        db.flush()
+        for user in users[:size]:
+            db.add(GroupMember(group_mission_id=group.id, user_id=user.id))
+            db.add(GroupMissionCheck(group_mission_id=group.id, user_id=user.id, date=CHECK_DATE, completed=True))
+        created.append(group)
+    db.flush()
+    reconcile_group_counters(db, [group.id for group in created])
+    db.commit()
+    group_ids = [group.id for group in created]
+    db.close()
+
+    yield group_ids
+
+    db = SessionLocal()
+    db.query(GroupMissionCheck).filter(GroupMissionCheck.group_mission_id.in_(group_ids)).delete(synchronize_session=False)
+    db.query(GroupMember).filter(GroupMember.group_mission_id.in_(group_ids)).delete(synchronize_session=False)
+    db.query(GroupMission).filter(GroupMission.id.in_(group_ids)).delete(synchronize_session=False)
+    db.commit()
+    db.close()
+
+
+def test_bulk_serializer_uses_constant_queries(groups):
+    db = SessionLocal()
+    loaded = db.query(GroupMission).filter(GroupMission.id.in_(groups)).order_by(GroupMission.id).all()
+
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        responses = group_missions_to_responses(loaded, db, checked={groups[0]: True})
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    # 멤버, 사용자 (그룹 수와 무관, 완료 체크 수는 카운터 컬럼)
+    assert len(statements) == 2
+    assert [r.id for r in responses] == groups
+    assert [r.member_count for r in responses] == [1, 2, 3]
+    assert [r.total_score for r in responses] == [2, 4, 6]
+    assert [r.checked for r in responses] == [True, None, None]
+    assert [p.name for p in responses[2].participants] == ["직렬화 0", "직렬화 1", "직렬화 2"]
+
+    # 단건 변환도 같은 결과
+    assert group_mission_to_response(loaded[1], db, checked=False) == responses[1].model_copy(update={"checked": False})
+    db.close()
@@ -0,0 +1,73 @@
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from database import SessionLocal
+from http_client import create_client, get_http_client, request_with_retry
+from main import app
+from models import User
+from routers import kakao_auth
+from scripts.fake_kakao_server import create_app as create_fake_kakao, kakao_id_for
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def fake_kakao(monkeypatch):
+    """카카오 API 호출을 로컬 대역 서버(ASGI)로 보내는 공유 클라이언트"""
+    monkeypatch.setattr(kakao_auth, "KAKAO_CLIENT_ID", "fake-client")
+    fake_client = create_client(transport=httpx.ASGITransport(app=create_fake_kakao()))
+    app.dependency_overrides = {get_http_client: lambda: fake_client}
+    yield fake_client
+    app.dependency_overrides = {}
+
+
+def test_kakao_callback_uses_shared_client(fake_kakao):
+    response = client.post("/api/auth/kakao/callback", json={"code": "offline-user"})
+    assert response.status_code == 200
+    tokens = response.json()
+
+    me = client.get("/api/users/me", headers={"Authorization": f"Bearer {tokens['access']}"})
+    assert me.status_code == 200
+    db = SessionLocal()
+    user = db.query(User).filter(User.id == me.json()["id"]).first()
+    assert user.kakao_id == str(kakao_id_for("offline-user"))
+    db.close()
+
+    # 같은 코드로 다시 로그인해도 같은 사용자
+    again = client.post("/api/auth/kakao/callback", json={"code": "offline-user"})
+    again_me = client.get("/api/users/me", headers={"Authorization": f"Bearer {again.json()['access']}"})
+    assert again_me.json()["id"] == me.json()["id"]
+
+
+def test_kakao_callback_reports_rejected_code(fake_kakao):
+    response = client.post("/api/auth/kakao/callback", json={"code": "invalid-code"})
+    assert response.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_request_with_retry_retries_only_safe_failures():
+    calls = {"GET": 0, "POST": 0}
+
+    def handler(request):
+        calls[request.method] += 1
+        if request.method == "GET" and calls["GET"] < 3:
+            return httpx.Response(503)
+        if request.method == "POST":
+            raise httpx.ReadTimeout("timeout", request=request)
+        return httpx.Response(200, json={"ok": True})
+
+    async with create_client(transport=httpx.MockTransport(handler)) as http:
+        response = await request_with_retry(http, "GET", "http://kakao.test/", max_retries=2)
+        assert response.status_code == 200
+        assert calls["GET"] == 3
+
+        # 응답을 못 받은 POST는 서버가 처리했을 수 있으므로 다시 보내지 않는다
+        with pytest.raises(httpx.ReadTimeout):
+            await request_with_retry(http, "POST", "http://kakao.test/", max_retries=2)
+        assert calls["POST"] == 1
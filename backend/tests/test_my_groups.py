@@ -0,0 +1,95 @@
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from auth import CurrentUser
+from database import SessionLocal, engine
+from group_counters import reconcile_group_counters
+from main import app
+from models import GroupMember, GroupMission, GroupMissionCheck, User
+
+client = TestClient(app)
+
+MONDAY = date(2025, 3, 10)
+
+
+@pytest.fixture
+def member():
+    db = SessionLocal()
+    user = db.query(User).filter(User.email == "my-groups@example.com").first()
+    if not user:
+        user = User(email="my-groups@example.com", password_hash="x", name="내 그룹")
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+    db.query(GroupMember).filter(GroupMember.user_id == user.id).delete(synchronize_session=False)
+
+    groups = [
+        GroupMission(name=f"내 그룹 {index}", color="bg-blue-300", created_by=user.id)
+        for index in range(2)
+    ]
+    db.add_all(groups)
+    db.flush()
+    for group in groups:
+        db.add(GroupMember(group_mission_id=group.id, user_id=user.id))
+    db.add(GroupMissionCheck(group_mission_id=groups[0].id, user_id=user.id, date=MONDAY, completed=True))
+    db.add(GroupMissionCheck(group_mission_id=groups[1].id, user_id=user.id, date=date(2025, 3, 12), completed=True))
+    db.add(GroupMissionCheck(group_mission_id=groups[1].id, user_id=user.id, date=date(2025, 3, 13), completed=False))
+    group_ids = [group.id for group in groups]
+    reconcile_group_counters(db, group_ids)
+    db.commit()
+    principal = CurrentUser.from_model(user)
+    db.close()
+
+    from auth import get_current_user
+
+    app.dependency_overrides = {}
+    app.dependency_overrides[get_current_user] = lambda: principal
+    yield group_ids
+
+    app.dependency_overrides = {}
+    db = SessionLocal()
+    db.query(GroupMissionCheck).filter(GroupMissionCheck.group_mission_id.in_(group_ids)).delete(synchronize_session=False)
+    db.query(GroupMember).filter(GroupMember.group_mission_id.in_(group_ids)).delete(synchronize_session=False)
+    db.query(GroupMission).filter(GroupMission.id.in_(group_ids)).delete(synchronize_session=False)
+    db.commit()
+    db.close()
+
+
+def test_my_groups_single_date_uses_constant_queries(member):
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        response = client.get("/api/group-missions/my", params={"date": MONDAY.isoformat()})
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert response.status_code == 200
+    assert [(g["id"], g["checked"]) for g in response.json()] == [(member[0], True), (member[1], False)]
+    # 그룹+내 체크 JOIN 1번, 참여자(멤버, 사용자) 2번
+    assert len(statements) == 3
+
+
+def test_my_groups_week_range(member):
+    response = client.get(
+        "/api/group-missions/my", params={"start": "2025-03-10", "end": "2025-03-16"}
+    )
+    assert response.status_code == 200
+    data = {g["id"]: g["checked_dates"] for g in response.json()}
+    assert len(data[member[0]]) == 7
+    assert data[member[0]]["2025-03-10"] is True
+    assert data[member[1]]["2025-03-12"] is True
+    assert data[member[1]]["2025-03-13"] is False
+    assert sum(data[member[1]].values()) == 1
+
+    assert client.get("/api/group-missions/my", params={"start": "2025-03-10"}).status_code == 400
+    assert client.get(
+        "/api/group-missions/my", params={"start": "2025-03-10", "end": "2025-06-10"}
+    ).status_code == 400
@@ -0,0 +1,257 @@
+from dataclasses import replace
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from database import SessionLocal
+from main import app
+from models import DayMission, User, UserDailyScore, UserStreak
+from ranking_snapshot import get_snapshot
+from scoring import today_kst
+
+client = TestClient(app)
+
+TEST_DATE = date(2025, 1, 6)
+
+
+@pytest.fixture(scope="module")
+def test_user():
+    db = SessionLocal()
+    user = db.query(User).filter(User.email == "ranking-tester@example.com").first()
+    if not user:
+        user = User(
+            email="ranking-tester@example.com",
+            password_hash="dummy",
+            name="Ranking Tester",
+        )
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+    yield user
+    db.close()
+
+
+@pytest.fixture(autouse=True)
+def override_current_user(test_user):
+    from auth import get_current_user
+
+    app.dependency_overrides = {}
+    app.dependency_overrides[get_current_user] = lambda: test_user
+    yield
+    app.dependency_overrides = {}
+
+
+@pytest.fixture
+def day_missions(test_user):
+    db = SessionLocal()
+    db.query(DayMission).filter(DayMission.user_id == test_user.id).delete()
+    db.query(UserDailyScore).filter(UserDailyScore.user_id == test_user.id).delete()
+    db.query(UserStreak).filter(UserStreak.user_id == test_user.id).delete()
+    missions = []
+    for index in range(4):
+        mission = DayMission(
+            user_id=test_user.id,
+            mission_id=index + 1,
+            date=TEST_DATE,
+            sub_mission=f"ranking-sub-{index}",
+            completed=False,
+        )
+        db.add(mission)
+        missions.append(mission)
+    db.commit()
+    mission_ids = [mission.id for mission in missions]
+    db.close()
+    yield mission_ids
+
+    db = SessionLocal()
+    db.query(DayMission).filter(DayMission.user_id == test_user.id).delete()
+    db.query(UserDailyScore).filter(UserDailyScore.user_id == test_user.id).delete()
+    db.query(UserStreak).filter(UserStreak.user_id == test_user.id).delete()
+    db.commit()
+    db.close()
+
+
+def _my_personal_entry(user_id):
+    response = client.get("/api/ranking/personal?limit=5&around_me=true")
+    assert response.status_code == 200
+    return next(entry for entry in response.json() if entry["id"] == user_id)
+
+
+def test_toggle_complete_updates_score_ledger(test_user, day_missions):
+    assert _my_personal_entry(test_user.id)["score"] == 0
+
+    for mission_id in day_missions:
+        response = client.patch(
+            f"/api/days/{TEST_DATE.isoformat()}/missions/{mission_id}/complete",
+            json={"completed": True},
+        )
+        assert response.status_code == 200
+
+    # 하루 최대 3점
+    assert _my_personal_entry(test_user.id)["score"] == 3
+
+    client.patch(
+        f"/api/days/{TEST_DATE.isoformat()}/missions/{day_missions[0]}/complete",
+        json={"completed": False},
+    )
+    client.patch(
+        f"/api/days/{TEST_DATE.isoformat()}/missions/{day_missions[1]}/complete",
+        json={"completed": False},
+    )
+    assert _my_personal_entry(test_user.id)["score"] == 2
+
+
+def test_delete_completed_mission_updates_score_ledger(test_user, day_missions):
+    client.patch(
+        f"/api/days/{TEST_DATE.isoformat()}/missions/{day_missions[0]}/complete",
+        json={"completed": True},
+    )
+    assert _my_personal_entry(test_user.id)["score"] == 1
+
+    response = client.delete(f"/api/days/{TEST_DATE.isoformat()}/missions/{day_missions[0]}")
+    assert response.status_code == 200
+    assert _my_personal_entry(test_user.id)["score"] == 0
+
+
+def test_personal_ranking_is_paginated_and_ranked(test_user):
+    response = client.get("/api/ranking/personal?limit=1")
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 1
+    assert data[0]["rank"] == 1
+
+    response = client.get("/api/ranking/personal?limit=3&around_me=true")
+    assert response.status_code == 200
+    data = response.json()
+    assert any(entry["id"] == test_user.id for entry in data)
+    scores = [entry["score"] for entry in data]
+    assert scores == sorted(scores, reverse=True)
+    ranks = [entry["rank"] for entry in data]
+    assert ranks == sorted(ranks)
+
+
+def test_my_rank_matches_personal_ranking(test_user, day_missions):
+    client.patch(
+        f"/api/days/{TEST_DATE.isoformat()}/missions/{day_missions[0]}/complete",
+        json={"completed": True},
+    )
+
+    response = client.get("/api/ranking/my")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["personal_rank"] == _my_personal_entry(test_user.id)["rank"]
+    assert isinstance(data["group_ranks"], list)
+
+
+def test_group_ranking_sorted_by_total_score():
+    response = client.get("/api/ranking/group")
+    assert response.status_code == 200
+    data = response.json()
+    totals = [group["total_score"] for group in data]
+    assert totals == sorted(totals, reverse=True)
+    for group in data:
+        assert set(group.keys()) == {"id", "name", "total_score", "member_count", "color"}
+
+
+def test_streak_counts_consecutive_days_up_to_kst_today(test_user, day_missions):
+    today = today_kst()
+    db = SessionLocal()
+    missions = []
+    for offset in range(3):
+        mission = DayMission(
+            user_id=test_user.id,
+            mission_id=1,
+            date=today - timedelta(days=offset),
+            sub_mission="streak-sub",
+            completed=False,
+        )
+        db.add(mission)
+        missions.append(mission)
+    db.commit()
+    mission_ids = [(mission.id, mission.date) for mission in missions]
+    db.close()
+
+    # 오늘 → 어제 → 그저께 순서로 완료해도 연속 기록은 3일
+    for mission_id, mission_date in mission_ids:
+        client.patch(
+            f"/api/days/{mission_date.isoformat()}/missions/{mission_id}/complete",
+            json={"completed": True},
+        )
+    assert _my_personal_entry(test_user.id)["streak"] == 3
+
+    # 어제를 취소하면 오늘 하루만 남는다
+    yesterday_id, yesterday = mission_ids[1]
+    client.patch(
+        f"/api/days/{yesterday.isoformat()}/missions/{yesterday_id}/complete",
+        json={"completed": False},
+    )
+    assert _my_personal_entry(test_user.id)["streak"] == 1
+
+    db = SessionLocal()
+    streak = db.query(UserStreak).filter(UserStreak.user_id == test_user.id).first()
+    assert streak.longest_streak == 1
+    assert streak.last_completed_date == today
+    db.close()
+
+
+def test_completing_future_mission_keeps_todays_streak(test_user, day_missions):
+    today = today_kst()
+    db = SessionLocal()
+    missions = [
+        DayMission(user_id=test_user.id, mission_id=1, date=day, sub_mission="future-sub", completed=False)
+        for day in (today, today + timedelta(days=1))
+    ]
+    db.add_all(missions)
+    db.commit()
+    (today_id, _), (tomorrow_id, tomorrow) = [(m.id, m.date) for m in missions]
+    db.close()
+
+    client.patch(f"/api/days/{today.isoformat()}/missions/{today_id}/complete", json={"completed": True})
+    assert _my_personal_entry(test_user.id)["streak"] == 1
+
+    # 내일 미션을 미리 완료해도 오늘 기준 연속 기록은 그대로
+    client.patch(f"/api/days/{tomorrow.isoformat()}/missions/{tomorrow_id}/complete", json={"completed": True})
+    assert _my_personal_entry(test_user.id)["streak"] == 1
+
+    # 전체 재계산에서도 미래 날짜는 세지 않는다
+    client.patch(f"/api/days/{today.isoformat()}/missions/{today_id}/complete", json={"completed": False})
+    client.patch(f"/api/days/{today.isoformat()}/missions/{today_id}/complete", json={"completed": True})
+    assert _my_personal_entry(test_user.id)["streak"] == 1
+    db = SessionLocal()
+    streak = db.query(UserStreak).filter(UserStreak.user_id == test_user.id).first()
+    assert streak.last_completed_date == today
+    db.close()
+
+
+def test_ranking_responses_report_snapshot_age():
+    for path in ("/api/ranking/personal", "/api/ranking/group", "/api/ranking/my"):
+        response = client.get(path)
+        assert response.status_code == 200
+        assert float(response.headers["X-Ranking-Snapshot-Age"]) >= 0.0
+
+
+def test_personal_pages_outside_snapshot_are_marked_live(test_user, monkeypatch):
+    import routers.ranking as ranking_router
+
+    db = SessionLocal()
+    snapshot = get_snapshot(db)
+    db.close()
+    # 상위 1명만 담긴 (불완전한) 스냅샷으로 바꿔서 스냅샷 밖 페이지를 요청
+    truncated = replace(
+        snapshot,
+        personal=snapshot.personal[:1],
+        personal_position_by_user={},
+        is_complete=False,
+    )
+    monkeypatch.setattr(ranking_router, "get_snapshot", lambda db: truncated)
+
+    inside = client.get("/api/ranking/personal?limit=1")
+    assert inside.headers["X-Ranking-Source"] == "snapshot"
+
+    response = client.get("/api/ranking/personal?limit=2&offset=1")
+    assert response.status_code == 200
+    assert response.headers["X-Ranking-Source"] == "live"
+    assert float(response.headers["X-Ranking-Snapshot-Age"]) == 0.0
+    ranks = [entry["rank"] for entry in response.json()]
+    assert ranks == sorted(ranks)
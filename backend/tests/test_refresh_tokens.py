@@ -0,0 +1,122 @@
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+import jwt
+import pytest
+from fastapi.testclient import TestClient
+
+from auth import get_password_hash
+from database import SessionLocal
+from main import app
+from models import RefreshTokenFamily, User
+from refresh_tokens import _legacy_family_id, purge_expired, revoked_families, sync_revocations
+from tokens import ALGORITHM, SECRET_KEY, token_service
+
+client = TestClient(app)
+
+EMAIL = "refresh-tester@example.com"
+PASSWORD = "refresh-password"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def refresh_user():
+    app.dependency_overrides = {}
+    db = SessionLocal()
+    if not db.query(User).filter(User.email == EMAIL).first():
+        db.add(User(email=EMAIL, password_hash=get_password_hash(PASSWORD), name="Refresh Tester"))
+        db.commit()
+    db.close()
+    yield
+
+
+def _login():
+    response = client.post("/api/auth/login", json={"email": EMAIL, "password": PASSWORD})
+    assert response.status_code == 200
+    return response.json()
+
+
+def _me(access):
+    return client.get("/api/users/me", headers={"Authorization": f"Bearer {access}"})
+
+
+def test_refresh_rotates_and_detects_reuse():
+    tokens = _login()
+    rotated = client.post("/api/auth/refresh", json={"refresh": tokens["refresh"]})
+    assert rotated.status_code == 200
+    rotated = rotated.json()
+    assert rotated["refresh"] != tokens["refresh"]
+    assert _me(rotated["access"]).status_code == 200
+
+    # 이미 교체된 refresh 토큰을 다시 쓰면 계열 전체가 폐기된다
+    reused = client.post("/api/auth/refresh", json={"refresh": tokens["refresh"]})
+    assert reused.status_code == 401
+    assert client.post("/api/auth/refresh", json={"refresh": rotated["refresh"]}).status_code == 401
+    assert _me(rotated["access"]).status_code == 401
+
+
+def test_logout_revokes_family():
+    tokens = _login()
+    other = _login()
+    headers = {"Authorization": f"Bearer {tokens['access']}"}
+    assert client.post("/api/auth/logout", headers=headers).status_code == 200
+
+    assert _me(tokens["access"]).status_code == 401
+    assert client.post("/api/auth/refresh", json={"refresh": tokens["refresh"]}).status_code == 401
+    # 다른 로그인(계열)은 영향 없음
+    assert _me(other["access"]).status_code == 200
+
+
+def test_revocations_sync_from_db_and_expired_families_are_purged():
+    db = SessionLocal()
+    user = db.query(User).filter(User.email == EMAIL).first()
+    now = datetime.now(timezone.utc)
+    db.add_all([
+        RefreshTokenFamily(
+            id="revoked-elsewhere", user_id=user.id, current_jti="j1",
+            expires_at=now + timedelta(days=1), revoked_at=now,
+        ),
+        RefreshTokenFamily(
+            id="already-expired", user_id=user.id, current_jti="j2",
+            expires_at=now - timedelta(seconds=1),
+        ),
+    ])
+    db.commit()
+
+    sync_revocations(db)
+    assert "revoked-elsewhere" in revoked_families
+
+    assert purge_expired(db) >= 1
+    assert db.query(RefreshTokenFamily).filter(RefreshTokenFamily.id == "already-expired").first() is None
+    db.query(RefreshTokenFamily).filter(RefreshTokenFamily.id == "revoked-elsewhere").delete()
+    db.commit()
+    db.close()
+
+
+def test_legacy_refresh_token_can_only_be_migrated_once():
+    db = SessionLocal()
+    user = db.query(User).filter(User.email == EMAIL).first()
+    db.close()
+    # 계열 도입 전 PyJWT 형식 (fam/jti 없음)
+    now = int(time.time())
+    legacy = jwt.encode(
+        {"sub": str(user.id), "type": "refresh", "iat": now, "exp": now + 3600 + random.randint(0, 10**6)},
+        SECRET_KEY,
+        algorithm=ALGORITHM,
+    )
+
+    migrated = client.post("/api/auth/refresh", json={"refresh": legacy})
+    assert migrated.status_code == 200
+    migrated = migrated.json()
+
+    # 같은 이전 형식 토큰을 다시 쓰면 거절되고, 옮겨 간 계열도 폐기된다
+    assert client.post("/api/auth/refresh", json={"refresh": legacy}).status_code == 401
+    assert client.post("/api/auth/refresh", json={"refresh": legacy}).status_code == 401
+    assert client.post("/api/auth/refresh", json={"refresh": migrated["refresh"]}).status_code == 401
+    assert _me(migrated["access"]).status_code == 401
+
+    family_id = _legacy_family_id(token_service.verify(legacy, "refresh"))
+    db = SessionLocal()
+    db.query(RefreshTokenFamily).filter(RefreshTokenFamily.id == family_id).delete()
+    db.commit()
+    db.close()
@@ -0,0 +1,64 @@
+import time
+from datetime import timedelta
+
+import jwt
+import pytest
+
+from tokens import ACCESS, REFRESH, TokenError, TokenService
+
+SECRET = "test-secret-key-with-enough-length-0123456789"
+
+
+@pytest.fixture
+def service():
+    return TokenService(SECRET, "HS256", timedelta(minutes=30), timedelta(days=7))
+
+
+def test_standard_tokens_are_interchangeable_with_pyjwt(service):
+    token = service.issue_access_token(42)
+    payload = jwt.decode(token, SECRET, algorithms=["HS256"])
+    assert payload["sub"] == "42"
+    assert payload["type"] == ACCESS
+
+    external = jwt.encode(
+        {"sub": "7", "type": REFRESH, "exp": int(time.time()) + 60}, SECRET, algorithm="HS256"
+    )
+    claims = service.verify(external, REFRESH)
+    assert claims.user_id == 7
+    assert claims.issued_at is None
+
+
+def test_compact_tokens_verify_with_either_setting(service):
+    compact = TokenService(SECRET, "HS256", timedelta(minutes=30), timedelta(days=7), compact=True)
+    access, refresh = compact.issue_token_pair(5)
+    assert len(access) < len(service.issue_access_token(5))
+
+    for verifier in (compact, service):
+        assert verifier.verify(access, ACCESS).user_id == 5
+        assert verifier.verify(refresh, REFRESH).user_id == 5
+
+
+def test_verify_rejects_invalid_tokens(service):
+    access = service.issue_access_token(1)
+    with pytest.raises(TokenError):
+        service.verify(access, REFRESH)
+
+    expired = service.issue_access_token(1, expires_delta=timedelta(seconds=-1))
+    with pytest.raises(TokenError):
+        service.verify(expired, ACCESS)
+
+    header, payload, signature = access.split(".")
+    with pytest.raises(TokenError):
+        service.verify(f"{header}.{payload}.{signature[::-1]}", ACCESS)
+
+    unsigned = jwt.encode({"sub": "1", "type": ACCESS, "exp": int(time.time()) + 60}, None, algorithm="none")
+    with pytest.raises(TokenError):
+        service.verify(unsigned, ACCESS)
+
+    other_key = TokenService("another-secret-key-with-enough-length-987", "HS256", timedelta(minutes=1), timedelta(days=1))
+    with pytest.raises(TokenError):
+        service.verify(other_key.issue_access_token(1), ACCESS)
+
+    for malformed in ("", "not-a-token", "a.b", "a.b.c"):
+        with pytest.raises(TokenError):
+            service.verify(malformed, ACCESS)
@@ -0,0 +1,190 @@
+import json
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from database import SessionLocal
+from main import app
+from models import DayMission, User, WeeklyPersonalRoutine
+
+client = TestClient(app)
+
+WEEK_START = date(2025, 3, 3)  # 월요일
+
+
+@pytest.fixture(scope="module")
+def test_user():
+    db = SessionLocal()
+    user = db.query(User).filter(User.email == "week-missions-tester@example.com").first()
+    if not user:
+        user = User(
+            email="week-missions-tester@example.com",
+            password_hash="dummy",
+            name="Week Missions Tester",
+        )
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+    yield user
+    db.close()
+
+
+@pytest.fixture(autouse=True)
+def override_current_user(test_user):
+    from auth import get_current_user
+
+    app.dependency_overrides = {}
+    app.dependency_overrides[get_current_user] = lambda: test_user
+    yield
+    app.dependency_overrides = {}
+
+
+@pytest.fixture(autouse=True)
+def week_data(test_user):
+    db = SessionLocal()
+    db.query(DayMission).filter(DayMission.user_id == test_user.id).delete()
+    db.query(WeeklyPersonalRoutine).filter(WeeklyPersonalRoutine.user_id == test_user.id).delete()
+    db.add_all([
+        DayMission(
+            user_id=test_user.id,
+            mission_id=1,
+            date=WEEK_START + timedelta(days=1),
+            sub_mission="텀블러 사용하기",
+            completed=True,
+        ),
+        DayMission(
+            user_id=test_user.id,
+            mission_id=2,
+            date=WEEK_START + timedelta(days=3),
+            sub_mission="장바구니 챙기기",
+            completed=False,
+        ),
+        WeeklyPersonalRoutine(
+            user_id=test_user.id,
+            mission_id=2,
+            sub_mission="장바구니 챙기기",
+            week_start_date=WEEK_START,
+            start_date=WEEK_START + timedelta(days=2),
+        ),
+    ])
+    db.commit()
+    db.close()
+    yield
+    db = SessionLocal()
+    db.query(DayMission).filter(DayMission.user_id == test_user.id).delete()
+    db.query(WeeklyPersonalRoutine).filter(WeeklyPersonalRoutine.user_id == test_user.id).delete()
+    db.commit()
+    db.close()
+
+
+def test_week_missions_match_single_day_responses():
+    response = client.get(f"/api/days/week/{WEEK_START.isoformat()}/missions")
+    assert response.status_code == 200
+    week = response.json()
+
+    expected_dates = [(WEEK_START + timedelta(days=i)).isoformat() for i in range(7)]
+    assert list(week.keys()) == expected_dates
+
+    for date_str in expected_dates:
+        single = client.get(f"/api/days/{date_str}/missions")
+        assert single.status_code == 200
+        assert week[date_str] == single.json()
+
+    # 루틴은 start_date(수요일)부터 표시되고, 같은 미션이 있는 목요일에는 중복되지 않는다
+    assert week[expected_dates[1]][0]["sub_mission"] == "텀블러 사용하기"
+    assert [m["is_weekly_routine"] for m in week[expected_dates[2]]] == [True]
+    assert [m["is_weekly_routine"] for m in week[expected_dates[3]]] == [False]
+    assert week[expected_dates[0]] == []
+
+
+def test_week_missions_accepts_any_day_of_week():
+    response = client.get(f"/api/days/week/{(WEEK_START + timedelta(days=4)).isoformat()}/missions")
+    assert response.status_code == 200
+    assert next(iter(response.json())) == WEEK_START.isoformat()
+
+
+def test_range_summary_streams_week_summary_entries():
+    week_summary = client.get(f"/api/days/week-summary?date={WEEK_START.isoformat()}").json()
+
+    end = WEEK_START + timedelta(days=6)
+    response = client.get(f"/api/days/range?start={WEEK_START.isoformat()}&end={end.isoformat()}")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines() if line]
+    assert lines == week_summary
+
+    response = client.get(
+        f"/api/days/range?start={(WEEK_START - timedelta(days=40)).isoformat()}"
+        f"&end={(WEEK_START + timedelta(days=3)).isoformat()}&format=json"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 44
+    assert data[-1] == week_summary[3]
+
+
+def test_range_summary_rejects_invalid_spans():
+    response = client.get("/api/days/range?start=2025-03-10&end=2025-03-01")
+    assert response.status_code == 400
+    response = client.get("/api/days/range?start=2024-01-01&end=2025-03-01")
+    assert response.status_code == 400
+
+
+def test_week_summary_counts_missions_and_routine_gaps():
+    response = client.get(f"/api/days/week-summary?date={(WEEK_START + timedelta(days=5)).isoformat()}")
+    assert response.status_code == 200
+    data = response.json()
+
+    assert [entry["date"] for entry in data] == [
+        (WEEK_START + timedelta(days=i)).isoformat() for i in range(7)
+    ]
+    assert [entry["total_missions"] for entry in data] == [0, 1, 1, 1, 1, 1, 1]
+    assert [entry["completed_missions"] for entry in data] == [0, 1, 0, 0, 0, 0, 0]
+    assert data[1]["is_day_perfectly_complete"] is True
+    assert data[1]["completion_rate"] == 1.0
+
+
+def test_day_reads_support_conditional_get(test_user):
+    target = (WEEK_START + timedelta(days=1)).isoformat()
+    paths = [
+        f"/api/days/{target}/missions",
+        f"/api/days/week/{WEEK_START.isoformat()}/missions",
+        f"/api/days/week-summary?date={target}",
+    ]
+    etags = {}
+    for path in paths:
+        response = client.get(path)
+        assert response.status_code == 200
+        etags[path] = response.headers["ETag"]
+
+        cached = client.get(path, headers={"If-None-Match": etags[path]})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+    # 미션 완료 토글 후에는 같은 ETag로 다시 받아야 한다
+    db = SessionLocal()
+    mission = db.query(DayMission).filter(
+        DayMission.user_id == test_user.id,
+        DayMission.date == WEEK_START + timedelta(days=1),
+    ).first()
+    mission_id = mission.id
+    db.close()
+    client.patch(f"/api/days/{target}/missions/{mission_id}/complete", json={"completed": False})
+
+    for path in paths:
+        response = client.get(path, headers={"If-None-Match": etags[path]})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etags[path]
+
+
+def test_routine_write_changes_week_etag():
+    path = f"/api/days/week/{WEEK_START.isoformat()}/missions"
+    etag = client.get(path).headers["ETag"]
+
+    response = client.post(
+        "/api/personal-routines",
+        json={"mission_id": 9, "date": (WEEK_START + timedelta(days=5)).isoformat(), "submission": "콘센트 뽑기"},
+    )
+    assert response.status_code == 200
+    assert client.get(path, headers={"If-None-Match": etag}).status_code == 200
@@ -1,9 +1,15 @@
+from datetime import date
+
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import null
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateTable
 
-from database import SessionLocal
+from database import Base, SessionLocal, create_db_engine
 from main import app
-from models import User
+from models import DayMission, User, WeeklyPersonalRoutine
+from routers.day_missions import get_monday_of_week, summarize_days
 
 client = TestClient(app)
 
@@ -64,3 +70,43 @@ def test_week_summary_returns_defaults_for_any_input(query_suffix):
         assert entry["completed_missions"] >= 0
         assert 0.0 <= entry["completion_rate"] <= 1.0
 
+
+
+def test_summary_treats_null_sub_missions_as_duplicates():
+    # 예전 스키마처럼 sub_mission에 NULL이 들어갈 수 있는 메모리 DB
+    memory_engine = create_db_engine("sqlite:///:memory:")
+    legacy_tables = [DayMission.__table__, WeeklyPersonalRoutine.__table__]
+    Base.metadata.create_all(
+        memory_engine, tables=[t for t in Base.metadata.sorted_tables if t not in legacy_tables]
+    )
+    with memory_engine.begin() as conn:
+        for table in legacy_tables:
+            ddl = str(CreateTable(table).compile(memory_engine))
+            conn.exec_driver_sql(ddl.replace("sub_mission VARCHAR NOT NULL", "sub_mission VARCHAR"))
+
+    target = date(2025, 4, 9)
+    db = sessionmaker(bind=memory_engine, autoflush=False)()
+    user = User(email="null-sub@example.com", password_hash="dummy", name="Null Sub")
+    db.add(user)
+    db.flush()
+    # ORM은 None 대신 기본값("")을 넣으므로 NULL은 직접 INSERT
+    db.execute(
+        DayMission.__table__.insert().values(
+            user_id=user.id, mission_id=7, date=target, sub_mission=null(), completed=True
+        )
+    )
+    db.execute(
+        WeeklyPersonalRoutine.__table__.insert().values(
+            user_id=user.id, mission_id=7, sub_mission=null(),
+            week_start_date=get_monday_of_week(target), start_date=target,
+        )
+    )
+    db.commit()
+    assert db.query(DayMission.sub_mission).scalar() is None
+
+    [summary] = summarize_days(db, user.id, target, target)
+    # 같은 (mission_id, NULL) 루틴은 일일 미션과 중복이므로 한 번만 센다
+    assert summary.total_missions == 1
+    assert summary.completed_missions == 1
+    db.close()
+    memory_engine.dispose()
@@ -0,0 +1,214 @@
+# 토큰 서비스
+# =======================
+# access/refresh JWT 발급과 검증을 한곳에서 처리한다.
+# - HMAC 키 객체와 헤더 세그먼트는 시작할 때 한 번만 만든다.
+# - 검증은 서명 확인 → payload 한 번 파싱 → exp/type/sub 검사를 한 번에 끝낸다.
+#   (jwt.decode는 매 호출마다 키 준비, 헤더 파싱, 옵션 병합, 전체 클레임 검사를 반복한다)
+# - TOKEN_FORMAT=compact 이면 짧은 클레임 이름으로 발급한다 (토큰 크기/파싱 비용 감소).
+#   검증은 두 형식을 모두 받으므로 설정을 바꿔도 기존 토큰은 그대로 유효하다.
+#
+# 환경 변수
+#   SECRET_KEY, ALGORITHM(HS256/HS384/HS512), ACCESS_TOKEN_EXPIRE_MINUTES, REFRESH_TOKEN_EXPIRE_DAYS
+#   TOKEN_FORMAT : standard | compact (기본 standard)
+
+import hmac
+import json
+import os
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Optional, Tuple
+
+import jwt
+from dotenv import load_dotenv
+from jwt.algorithms import get_default_algorithms
+from jwt.utils import base64url_decode, base64url_encode
+
+load_dotenv()
+
+SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
+ALGORITHM = os.getenv("ALGORITHM", "HS256")
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
+TOKEN_FORMAT = os.getenv("TOKEN_FORMAT", "standard")
+
+ACCESS = "access"
+REFRESH = "refresh"
+
+# compact 형식의 클레임 이름과 토큰 종류 약어
+_COMPACT_TYPES = {ACCESS: "a", REFRESH: "r"}
+_COMPACT_TYPES_REVERSE = {value: key for key, value in _COMPACT_TYPES.items()}
+
+
+class TokenError(Exception):
+    """유효하지 않은 토큰 (서명/형식/만료/종류 오류)"""
+
+
+@dataclass(frozen=True)
+class TokenClaims:
+    user_id: int
+    token_type: str
+    issued_at: Optional[int]
+    expires_at: int
+    family_id: Optional[str] = None  # refresh 토큰 계열 (로그인 1회 = 계열 1개)
+    token_id: Optional[str] = None  # refresh 토큰 jti
+
+
+def _json_segment(value: dict) -> bytes:
+    return base64url_encode(json.dumps(value, separators=(",", ":")).encode())
+
+
+class TokenService:
+    def __init__(
+        self,
+        secret_key: str,
+        algorithm: str,
+        access_expires: timedelta,
+        refresh_expires: timedelta,
+        compact: bool = False,
+    ):
+        algorithms = get_default_algorithms()
+        if algorithm not in algorithms:
+            raise ValueError(f"지원하지 않는 ALGORITHM입니다: {algorithm}")
+        self.algorithm = algorithm
+        self.access_expires = access_expires
+        self.refresh_expires = refresh_expires
+        self.compact = compact
+        self._algorithm = algorithms[algorithm]
+        self._key = self._algorithm.prepare_key(secret_key)
+        self._secret_key = secret_key
+        # 직접 서명/검증하는 경로는 HMAC 계열만 사용 (그 외는 PyJWT에 맡긴다)
+        self._is_hmac = algorithm.startswith("HS")
+        # 이 서비스가 발급하는 토큰의 헤더 (PyJWT와 같은 순서/형식)
+        self._header_segment = _json_segment({"alg": algorithm, "typ": "JWT"})
+
+    # ----- 발급 -----
+
+    def issue(
+        self,
+        user_id: int,
+        token_type: str,
+        expires_delta: Optional[timedelta] = None,
+        family_id: Optional[str] = None,
+        token_id: Optional[str] = None,
+    ) -> str:
+        now = int(time.time())
+        if expires_delta is None:
+            expires_delta = self.access_expires if token_type == ACCESS else self.refresh_expires
+        expires_at = now + int(expires_delta.total_seconds())
+        if self.compact:
+            payload = {"s": user_id, "t": _COMPACT_TYPES[token_type], "i": now, "e": expires_at}
+            if family_id:
+                payload["f"] = family_id
+            if token_id:
+                payload["j"] = token_id
+        else:
+            payload = {"sub": str(user_id), "exp": expires_at, "iat": now, "type": token_type}
+            if family_id:
+                payload["fam"] = family_id
+            if token_id:
+                payload["jti"] = token_id
+
+        if not self._is_hmac:
+            return jwt.encode(payload, self._secret_key, algorithm=self.algorithm)
+        signing_input = self._header_segment + b"." + _json_segment(payload)
+        signature = self._algorithm.sign(signing_input, self._key)
+        return (signing_input + b"." + base64url_encode(signature)).decode()
+
+    def issue_access_token(
+        self, user_id: int, expires_delta: Optional[timedelta] = None, family_id: Optional[str] = None
+    ) -> str:
+        return self.issue(user_id, ACCESS, expires_delta, family_id=family_id)
+
+    def issue_refresh_token(
+        self, user_id: int, family_id: Optional[str] = None, token_id: Optional[str] = None
+    ) -> str:
+        return self.issue(user_id, REFRESH, family_id=family_id, token_id=token_id)
+
+    def issue_token_pair(
+        self, user_id: int, family_id: Optional[str] = None, token_id: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """(access, refresh) 토큰 쌍 발급 (같은 계열 id를 두 토큰에 모두 기록)"""
+        return (
+            self.issue_access_token(user_id, family_id=family_id),
+            self.issue_refresh_token(user_id, family_id=family_id, token_id=token_id),
+        )
+
+    # ----- 검증 -----
+
+    def _decode_payload(self, token: str) -> dict:
+        if not self._is_hmac:
+            try:
+                return jwt.decode(
+                    token, self._secret_key, algorithms=[self.algorithm], options={"verify_exp": False}
+                )
+            except jwt.InvalidTokenError as e:
+                raise TokenError(str(e)) from e
+
+        try:
+            signing_input, signature_segment = token.encode().rsplit(b".", 1)
+            header_segment, payload_segment = signing_input.split(b".", 1)
+            signature = base64url_decode(signature_segment)
+        except ValueError as e:
+            raise TokenError("토큰 형식이 올바르지 않습니다") from e
+
+        if header_segment != self._header_segment:
+            # 다른 라이브러리가 만든 토큰 등: 헤더를 읽어 알고리즘만 확인
+            try:
+                header = json.loads(base64url_decode(header_segment))
+            except ValueError as e:
+                raise TokenError("토큰 헤더가 올바르지 않습니다") from e
+            if not isinstance(header, dict) or header.get("alg") != self.algorithm:
+                raise TokenError("허용되지 않은 알고리즘입니다")
+
+        if not hmac.compare_digest(self._algorithm.sign(signing_input, self._key), signature):
+            raise TokenError("서명이 올바르지 않습니다")
+
+        try:
+            payload = json.loads(base64url_decode(payload_segment))
+        except ValueError as e:
+            raise TokenError("토큰 payload가 올바르지 않습니다") from e
+        if not isinstance(payload, dict):
+            raise TokenError("토큰 payload가 올바르지 않습니다")
+        return payload
+
+    def verify(self, token: str, expected_type: str = ACCESS) -> TokenClaims:
+        """서명, 만료, 종류, sub를 한 번에 검증하고 클레임 반환"""
+        if not token:
+            raise TokenError("토큰이 없습니다")
+        payload = self._decode_payload(token)
+
+        if "s" in payload:
+            subject, token_type = payload.get("s"), _COMPACT_TYPES_REVERSE.get(payload.get("t"))
+            issued_at, expires_at = payload.get("i"), payload.get("e")
+            family_id, token_id = payload.get("f"), payload.get("j")
+        else:
+            subject, token_type = payload.get("sub"), payload.get("type")
+            issued_at, expires_at = payload.get("iat"), payload.get("exp")
+            family_id, token_id = payload.get("fam"), payload.get("jti")
+
+        if token_type != expected_type:
+            raise TokenError(f"{expected_type} 토큰이 아닙니다")
+        if not isinstance(expires_at, (int, float)) or expires_at <= time.time():
+            raise TokenError("만료된 토큰입니다")
+        try:
+            user_id = int(subject)
+        except (TypeError, ValueError) as e:
+            raise TokenError("sub 클레임이 올바르지 않습니다") from e
+        return TokenClaims(
+            user_id=user_id,
+            token_type=token_type,
+            issued_at=int(issued_at) if isinstance(issued_at, (int, float)) else None,
+            expires_at=int(expires_at),
+            family_id=family_id if isinstance(family_id, str) else None,
+            token_id=token_id if isinstance(token_id, str) else None,
+        )
+
+
+token_service = TokenService(
+    SECRET_KEY,
+    ALGORITHM,
+    access_expires=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
+    refresh_expires=timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
+    compact=TOKEN_FORMAT == "compact",
+)
@@ -8,6 +8,13 @@ export const dayMissionApi = {
     return request<DayMission[]>(`/days/${dateStr}/missions`);
   },
 
+  // 특정 주(월~일)의 날짜별 미션 목록을 한 번에 조회
+  getWeekMissions: async (
+    weekStartDate: string
+  ): Promise<Record<string, DayMission[]>> => {
+    return request<Record<string, DayMission[]>>(`/days/week/${weekStartDate}/missions`);
+  },
+
   // 특정 날짜에 미션 추가
   addMission: async (
     dateStr: string,
@@ -52,6 +52,11 @@ export const groupMissionApi = {
     return request(url);
   },
 
+  // 내가 속한 그룹들 + 기간(최대 31일) 날짜별 체크 상태 (한 주를 한 번에 조회)
+  getMyGroupsRange: async (start: string, end: string): Promise<GroupMission[]> => {
+    return request(`/group-missions/my?start=${start}&end=${end}`);
+  },
+
   // 그룹 미션 완료 체크
   checkGroupMission: async (
     groupId: number,
@@ -32,6 +32,10 @@ export interface GroupMission {
   color: string;
   total_score?: number;
   member_count?: number;
+  checked?: boolean;
+  // 기간 조회(getMyGroupsRange) 시 날짜(YYYY-MM-DD) → 체크 상태
+  checked_dates?: Record<string, boolean>;
+  created_by?: number;
 }
 
 // 그룹 랭킹 응답 타입